@@ -0,0 +1,184 @@
+"use client";
+
+import { useEffect, useState } from "react";
+
+// Built by scripts/chord_autocomplete.py; entries are sorted by folded label
+interface ChordIndex {
+  version: number;
+  labels: string[];
+  chords: number[];
+  scores: number[];
+  names: string[];
+  notes: string[];
+}
+
+interface Match {
+  label: string;
+  chord: string;
+  notes: string;
+  distance: number;
+}
+
+const LIMIT = 10;
+
+function fold(text: string): string {
+  return text
+    .replace(/♯/g, "#")
+    .replace(/♭/g, "b")
+    .replace(/𝄪/g, "##")
+    .replace(/𝄫/g, "bb")
+    .toLowerCase();
+}
+
+function lowerBound(keys: string[], key: string): number {
+  let lo = 0;
+  let hi = keys.length;
+  while (lo < hi) {
+    const mid = (lo + hi) >> 1;
+    if (keys[mid] < key) lo = mid + 1;
+    else hi = mid;
+  }
+  return lo;
+}
+
+// Typo-tolerant matches: entries with a prefix within maxEdits edits
+// (insertions, deletions, substitutions, swapped neighbours) of query.
+// Keys are sorted, so each key reuses the edit-distance rows of the shared
+// prefix with the previous one and a branch that is out of range (or can
+// no longer improve) is skipped for every key below it, like a trie walk.
+function fuzzy(keys: string[], query: string, maxEdits: number, entries: number[], distances: number[]): void {
+  const far = maxEdits + 1;
+  const size = query.length;
+  const rows: number[][] = [[]];
+  for (let column = 0; column <= size; column++) rows[0].push(Math.min(column, far));
+  const bestAt = [rows[0][size]];
+  let previousKey = "";
+  let computed = 0;
+  let cut = Infinity;
+  let cutDistance = far;
+  for (let entry = lowerBound(keys, query[0]); entry < keys.length && keys[entry][0] === query[0]; entry++) {
+    const key = keys[entry];
+    let common = 0;
+    while (common < computed && key[common] === previousKey[common]) common++;
+    if (common >= cut) {
+      if (cutDistance <= maxEdits) {
+        entries.push(entry);
+        distances.push(cutDistance);
+      }
+      continue;
+    }
+    cut = Infinity;
+    let depth = common + 1;
+    for (; depth <= key.length; depth++) {
+      const previous = rows[depth - 1];
+      const before = rows[depth - 2];
+      const row = [Math.min(depth, far)];
+      let nearest = row[0];
+      for (let column = 1; column <= size; column++) {
+        let value = Math.min(
+          previous[column - 1] + (query[column - 1] === key[depth - 1] ? 0 : 1),
+          row[column - 1] + 1,
+          previous[column] + 1,
+        );
+        if (depth > 1 && column > 1 && query[column - 1] === key[depth - 2] && query[column - 2] === key[depth - 1]) {
+          value = Math.min(value, before[column - 2] + 1);
+        }
+        row.push(Math.min(value, far));
+        nearest = Math.min(nearest, row[column]);
+      }
+      rows[depth] = row;
+      bestAt[depth] = Math.min(bestAt[depth - 1], row[size]);
+      if (nearest >= bestAt[depth] || nearest > maxEdits) {
+        cut = depth;
+        cutDistance = bestAt[depth];
+        break;
+      }
+    }
+    computed = Math.min(depth, key.length);
+    previousKey = key;
+    if (bestAt[computed] <= maxEdits) {
+      entries.push(entry);
+      distances.push(bestAt[computed]);
+    }
+  }
+}
+
+function rank(index: ChordIndex, entries: number[], distances: number[], limit: number): Match[] {
+  const order = entries.map((_, i) => i);
+  order.sort((a, b) => distances[a] - distances[b] || index.scores[entries[b]] - index.scores[entries[a]]);
+  const seen: Record<number, boolean> = {};
+  const results: Match[] = [];
+  for (const i of order) {
+    const chord = index.chords[entries[i]];
+    if (seen[chord]) continue;
+    seen[chord] = true;
+    results.push({
+      label: index.labels[entries[i]],
+      chord: index.names[chord],
+      notes: index.notes[chord],
+      distance: distances[i],
+    });
+    if (results.length === limit) break;
+  }
+  return results;
+}
+
+// Same rules as ChordAutocomplete.complete(): prefix matches first, typo-tolerant
+// matches (same first character) only when nothing starts with the query.
+function complete(index: ChordIndex, keys: string[], text: string, limit = LIMIT): Match[] {
+  const query = fold(text.trim());
+  if (!query) return [];
+  const entries: number[] = [];
+  for (let entry = lowerBound(keys, query); entry < keys.length && keys[entry].startsWith(query); entry++) {
+    entries.push(entry);
+  }
+  if (entries.length) return rank(index, entries, entries.map(() => 0), limit);
+
+  const maxEdits = query.length <= 1 ? 0 : query.length <= 7 ? 1 : 2;
+  if (!maxEdits) return [];
+  const distances: number[] = [];
+  fuzzy(keys, query, maxEdits, entries, distances);
+  return rank(index, entries, distances, limit);
+}
+
+export default function ChordSearch() {
+  const [index, setIndex] = useState<ChordIndex | null>(null);
+  const [keys, setKeys] = useState<string[]>([]);
+  const [query, setQuery] = useState("");
+
+  useEffect(() => {
+    fetch("/chord_index.json")
+      .then((response) => response.json())
+      .then((data: ChordIndex) => {
+        setKeys(data.labels.map(fold));
+        setIndex(data);
+      })
+      .catch(() => setIndex(null));
+  }, []);
+
+  const matches = index ? complete(index, keys, query) : [];
+
+  return (
+    <div className="mt-8">
+      <input
+        type="search"
+        value={query}
+        onChange={(event) => setQuery(event.target.value)}
+        placeholder={index ? "Find a chord (Cmaj7, F#m7b5, C/E)" : "Loading chords..."}
+        disabled={!index}
+        className="w-full border rounded px-3 py-2"
+      />
+      <ul className="mt-2 divide-y">
+        {matches.map((match) => (
+          <li key={match.label} className="py-1 flex justify-between">
+            <span className="font-semibold">
+              {match.label}
+              {match.label !== match.chord && <span className="ml-2 text-gray-500">{match.chord}</span>}
+            </span>
+            <span className="text-gray-600">{match.notes}</span>
+          </li>
+        ))}
+      </ul>
+    </div>
+  );
+}
@@ -1,3 +1,5 @@
+import ChordSearch from "./chord-search";
+
 export default function Home() {
   return (
     <main className="max-w-2xl mx-auto p-6">
@@ -5,6 +7,7 @@ export default function Home() {
       <p className="mt-4 text-gray-600">
         Learning music theory while building tools with DuckDB + Next.js.
       </p>
+      <ChordSearch />
       <ul className="mt-6 space-y-2">
         <li>
           <a href="/blog" className="underline">Read the Blog</a>
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Benchmark audio chord recognition on synthesized test tones.
+
+Writes a 16-bit 44.1 kHz WAV file of random catalog chords (each note a
+decaying tone with a few harmonics, root in the bass), labels it with every
+smoothing mode and reports the real-time factor (processing time / audio
+duration, lower is faster), frame accuracy on chord names and on pitch-class
+sets, and peak traced memory.
+
+    python bench_audio.py 600      # seconds of audio
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+import wave
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from chord_audio import AudioChordRecognizer, WavReader
+from chord_identifier import ChordIdentifier, pitch_class_mask
+
+SAMPLE_RATE = 44100
+CHORD_SECONDS = 2.0
+HARMONICS = (1.0, 0.5, 0.25, 0.125)
+
+
+def write_test_tones(filename, seconds, identifier, seed=0):
+    """Write random chords to filename; return [(start, end, mask, root pc)]."""
+    rng = random.Random(seed)
+    qualities = identifier.qualities
+    intervals = identifier.generator.chord_intervals
+    chord_samples = int(CHORD_SECONDS * SAMPLE_RATE)
+    t = np.arange(chord_samples) / SAMPLE_RATE
+    envelope = np.exp(-t / 1.5) * np.minimum(1.0, t / 0.01) * np.minimum(1.0, (CHORD_SECONDS - t) / 0.02)
+    truth = []
+    with wave.open(filename, 'wb') as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(SAMPLE_RATE)
+        for index in range(int(seconds / CHORD_SECONDS)):
+            root = rng.randrange(12)
+            quality = rng.choice(qualities)
+            signal = np.zeros(chord_samples)
+            for interval in intervals[quality]:
+                frequency = 440.0 * 2 ** ((48 + root + interval - 69) / 12)
+                for harmonic, amplitude in enumerate(HARMONICS, 1):
+                    signal += amplitude * np.sin(2 * np.pi * frequency * harmonic * t)
+            signal *= envelope * 0.8 / np.abs(signal).max()
+            wav.writeframes((signal * 32767).astype('<i2').tobytes())
+            mask = pitch_class_mask(root + i for i in intervals[quality])
+            truth.append((index * CHORD_SECONDS, (index + 1) * CHORD_SECONDS, mask, root))
+    return truth
+
+
+def main(seconds=600):
+    identifier = ChordIdentifier()
+    names = identifier.best_name_table()
+    name_masks = {}
+    for mask in range(1 << 12):
+        for hint in range(12):
+            name = names[mask * 12 + hint]
+            if name is not None:
+                name_masks.setdefault(name, mask)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        filename = os.path.join(tmp, 'tones.wav')
+        truth = write_test_tones(filename, seconds, identifier)
+        with WavReader(filename) as reader:
+            duration = reader.duration
+
+        print("AUDIO CHORD RECOGNITION BENCHMARK")
+        print("=" * 70)
+        print(f"{duration:.0f} s of synthesized chords ({len(truth)} chords, {len(identifier.qualities)} qualities)")
+        print(f"{'smoothing':<10} {'RTF':>8} {'x realtime':>11} {'names':>8} {'pc sets':>8} {'peak MB':>8}")
+        for smoothing in ('hmm', 'median', None):
+            recognizer = AudioChordRecognizer(identifier, smoothing=smoothing)
+            tracemalloc.start()
+            start = time.perf_counter()
+            segments = recognizer.label_file(filename)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+
+            hop = recognizer.hop_size / SAMPLE_RATE
+            frames = name_hits = mask_hits = 0
+            segment_index = 0
+            for start_time, end_time, mask, root in truth:
+                expected = names[mask * 12 + root]
+                frame = int(np.ceil(start_time / hop))
+                while frame * hop < end_time:
+                    time_point = frame * hop
+                    while segments[segment_index].end_time <= time_point:
+                        segment_index += 1
+                    chord = segments[segment_index].chord
+                    frames += 1
+                    name_hits += chord == expected
+                    mask_hits += name_masks.get(chord) == mask
+                    frame += 1
+            print(f"{str(smoothing):<10} {elapsed / duration:>8.4f} {duration / elapsed:>10.0f}x "
+                  f"{name_hits / frames:>8.1%} {mask_hits / frames:>8.1%} {peak / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 600)
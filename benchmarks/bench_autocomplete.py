@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark chord autocomplete: index build and load time, JSON size and
+per-keystroke latency for prefix and typo-tolerant queries, on the default
+catalog and on catalogs expanded with synthetic qualities.
+
+    python bench_autocomplete.py 0 200 1000   # synthetic qualities per run
+"""
+
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+from bench_utils import add_synthetic_qualities
+
+from chord_autocomplete import ChordAutocomplete
+from chord_generator import ChordGenerator
+
+
+def keystrokes(index, count, typo_rate, seed=0):
+    """Every prefix of random labels, with a character dropped or swapped in some."""
+    rng = random.Random(seed)
+    queries = []
+    for label in rng.sample(index.labels, min(count, len(index.labels))):
+        if len(label) > 3 and rng.random() < typo_rate:
+            position = rng.randrange(1, len(label) - 1)
+            label = label[:position] + label[position + 1:] if rng.random() < 0.5 else \
+                label[:position] + label[position + 1] + label[position] + label[position + 2:]
+        queries.extend(label[:end] for end in range(1, len(label) + 1))
+    return queries
+
+
+def latencies(func, queries):
+    samples = []
+    for query in queries:
+        start = time.perf_counter()
+        func(query)
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    return statistics.mean(samples), samples[int(len(samples) * 0.99)]
+
+
+def main(synthetic_counts=(0, 200, 1000)):
+    print("CHORD AUTOCOMPLETE BENCHMARK")
+    print("=" * 88)
+    print(f"{'qualities':>9} {'labels':>9} {'build':>9} {'load':>9} {'json':>8}   "
+          f"{'prefix mean/p99':>17}   {'complete mean/p99':>19}")
+    for count in synthetic_counts:
+        generator = ChordGenerator()
+        if count:
+            add_synthetic_qualities(generator, count)
+        start = time.perf_counter()
+        index = ChordAutocomplete.build(generator)
+        build = time.perf_counter() - start
+
+        with tempfile.TemporaryDirectory() as tmp:
+            filename = os.path.join(tmp, 'chord_index.json')
+            index.save(filename)
+            size = os.path.getsize(filename)
+            start = time.perf_counter()
+            index = ChordAutocomplete.load(filename)
+            load = time.perf_counter() - start
+
+        queries = keystrokes(index, 500, typo_rate=0.3)
+        prefix_mean, prefix_p99 = latencies(index.prefix, queries)
+        complete_mean, complete_p99 = latencies(index.complete, queries)
+        print(f"{len(generator.chord_intervals):>9,} {len(index.labels):>9,} {build:>8.2f}s {load:>8.2f}s "
+              f"{size / 1e6:>6.1f}MB   {prefix_mean * 1e6:>7.1f}/{prefix_p99 * 1e6:>6.1f} us   "
+              f"{complete_mean * 1e6:>8.1f}/{complete_p99 * 1e6:>7.1f} us")
+
+
+if __name__ == "__main__":
+    main([int(value) for value in sys.argv[1:]] or (0, 200, 1000))
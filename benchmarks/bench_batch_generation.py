@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Benchmark NumPy batch chord generation against ChordGenerator.generate_all_chords.
+"""
+
+from bench_utils import add_synthetic_qualities, time_call
+from chord_batch import ChordBatchGenerator
+from chord_generator import ChordGenerator
+
+
+def main():
+    """Compare both generators at several catalog sizes."""
+    print("BATCH GENERATION BENCHMARK")
+    print("=" * 50)
+    print(f"{'qualities':>10} {'chords':>10} {'loop ms':>10} {'batch ms':>10} {'arrays ms':>10}")
+    
+    for extra in (0, 500, 5000):
+        generator = ChordGenerator()
+        add_synthetic_qualities(generator, extra)
+        batch = ChordBatchGenerator(generator)
+        
+        chords = len(batch.generate_all_chords())
+        loop = time_call(generator.generate_all_chords)
+        dicts = time_call(batch.generate_all_chords)
+        arrays = time_call(batch.chord_arrays)
+        print(f"{len(batch.qualities):>10} {chords:>10} {loop * 1e3:>10.1f} "
+              f"{dicts * 1e3:>10.1f} {arrays * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
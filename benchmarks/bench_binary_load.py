@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Benchmark loading the chord catalog from CSV versus the binary format.
+"""
+
+import csv
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from analyze_chords import ChordTable
+from chord_binary import BinaryChordCatalog
+from chord_generator import ChordGenerator
+
+
+def read_csv(csv_file):
+    with open(csv_file, 'r') as f:
+        return list(csv.DictReader(f))
+
+
+def open_binary(bin_file):
+    catalog = BinaryChordCatalog(bin_file)
+    catalog.close()
+
+
+def read_binary_numpy(bin_file):
+    catalog = BinaryChordCatalog(bin_file)
+    masks = catalog.to_numpy()['mask'].copy()
+    catalog.close()
+    return masks
+
+
+def main():
+    """Time each load path."""
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_file = os.path.join(tmp, 'chords.csv')
+        bin_file = os.path.join(tmp, 'chords.bin')
+        generator = ChordGenerator()
+        generator.save_chords_to_csv(csv_file)
+        generator.save_chords_to_binary(bin_file)
+        
+        cases = [
+            ('csv rows', lambda: read_csv(csv_file)),
+            ('binary open', lambda: open_binary(bin_file)),
+            ('binary numpy', lambda: read_binary_numpy(bin_file)),
+            ('table from csv', lambda: ChordTable.from_csv(csv_file)),
+            ('table from bin', lambda: ChordTable.from_binary(bin_file)),
+        ]
+        
+        print("CATALOG LOAD BENCHMARK")
+        print("=" * 50)
+        for label, func in cases:
+            number = 200
+            elapsed = timeit.timeit(func, number=number)
+            print(f"{label:<16} {elapsed / number * 1e6:>10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Compare the memory held by the dict-of-lists catalog and ChordCatalog.
+"""
+
+import tracemalloc
+
+from bench_utils import add_synthetic_qualities
+from chord_catalog import ChordCatalog
+from chord_generator import ChordGenerator
+
+
+def retained_bytes(build):
+    """Bytes still allocated by the object `build` returns."""
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def main():
+    """Measure both representations at several catalog sizes."""
+    print("CATALOG MEMORY BENCHMARK")
+    print("=" * 50)
+    print(f"{'chords':>10} {'dicts KB':>12} {'catalog KB':>12} {'+Chords KB':>12} {'ratio':>8}")
+    
+    for extra in (0, 500, 5000):
+        generator = ChordGenerator()
+        add_synthetic_qualities(generator, extra)
+        count = len(generator.generate_all_chords())
+        
+        dicts = retained_bytes(generator.generate_all_chords)
+        catalog = retained_bytes(lambda: ChordCatalog(generator))
+        objects = retained_bytes(lambda: list(ChordCatalog(generator)))
+        print(f"{count:>10} {dicts / 1024:>12.0f} {catalog / 1024:>12.0f} "
+              f"{objects / 1024:>12.0f} {dicts / catalog:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Throughput benchmark for parse_chord_symbol on a synthetic symbol corpus.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from chord_parser import ChordSymbolParser
+
+ROOTS = ['C', 'C#', 'Db', 'D', 'Eb', 'E', 'F', 'F#', 'Gb', 'G', 'Ab', 'A', 'Bb', 'B']
+MODIFIERS = ['', '', '', '(#9)', 'b9', '#11', '(b13)', 'add9', '/9']
+
+
+def synthetic_corpus(parser, count, seed=0):
+    """Random symbols drawn from every root, suffix, modifier and slash bass."""
+    rng = random.Random(seed)
+    suffixes = list(parser.suffix_to_quality)
+    corpus = []
+    for _ in range(count):
+        symbol = rng.choice(ROOTS) + rng.choice(suffixes) + rng.choice(MODIFIERS)
+        if rng.random() < 0.1:
+            symbol += '/' + rng.choice(ROOTS)
+        corpus.append(symbol)
+    return corpus
+
+
+def main(count=1_000_000):
+    """Parse the corpus cold (no cache) and warm (LRU cache)."""
+    parser = ChordSymbolParser()
+    corpus = synthetic_corpus(parser, count)
+    distinct = len(set(corpus))
+    
+    sample = corpus[:50_000]
+    start = time.perf_counter()
+    for symbol in sample:
+        parser._parse(symbol)
+    uncached = len(sample) / (time.perf_counter() - start)
+    
+    parse = parser.parse
+    start = time.perf_counter()
+    for symbol in corpus:
+        parse(symbol)
+    elapsed = time.perf_counter() - start
+    
+    info = parse.cache_info()
+    print("CHORD PARSER BENCHMARK")
+    print("=" * 50)
+    print(f"{'symbols':<20} {count:>12,}")
+    print(f"{'distinct':<20} {distinct:>12,}")
+    print(f"{'uncached':<20} {uncached:>12,.0f} symbols/sec")
+    print(f"{'cached':<20} {count / elapsed:>12,.0f} symbols/sec")
+    print(f"{'cache hit ratio':<20} {info.hits / (info.hits + info.misses):>12.1%}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
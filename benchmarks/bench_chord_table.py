@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""
+Benchmark repeated ChordTable queries against re-reading the CSV per query.
+"""
+
+import csv
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from analyze_chords import ChordTable
+from chord_generator import ChordGenerator
+
+
+def scan_find_chords(csv_file, chord_type=None, chord_extension=None, contains_note=None):
+    """The pre-index implementation: parse the whole CSV for every query."""
+    matching_chords = []
+    with open(csv_file, 'r') as f:
+        for row in csv.DictReader(f):
+            if chord_type and row['chord_type'] != chord_type:
+                continue
+            if chord_extension and row['chord_extension'] != chord_extension:
+                continue
+            if contains_note and contains_note not in row['notes']:
+                continue
+            matching_chords.append({
+                'name': row['chord_name'],
+                'notes': row['notes'],
+                'type': row['chord_type'],
+                'extension': row['chord_extension']
+            })
+    return matching_chords
+
+
+QUERIES = [
+    {'chord_type': 'Dominant', 'chord_extension': 'Dominant 7th'},
+    {'contains_note': 'C#'},
+    {'chord_type': 'Minor', 'chord_extension': 'Minor 9th'},
+    {'chord_type': 'Suspended'},
+    {'chord_type': 'Major', 'contains_note': 'E'},
+]
+
+
+def main():
+    """Run the analyze_chords.main query mix both ways."""
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_file = os.path.join(tmp, 'chords.csv')
+        ChordGenerator().save_chords_to_csv(csv_file)
+        
+        rounds = 20
+        scan = timeit.timeit(
+            lambda: [scan_find_chords(csv_file, **query) for query in QUERIES], number=rounds)
+        
+        table = ChordTable.from_csv(csv_file)
+        indexed = timeit.timeit(
+            lambda: [table.find(**query) for query in QUERIES], number=rounds * 50)
+        
+        # "C" must not match "C#" rows
+        wrong = len(scan_find_chords(csv_file, contains_note='C')) - len(table.find(contains_note='C'))
+    
+    queries = len(QUERIES) * rounds
+    scan_us = scan / queries * 1e6
+    indexed_us = indexed / (queries * 50) * 1e6
+    
+    print("CHORD TABLE BENCHMARK")
+    print("=" * 50)
+    print(f"{'csv scan':<16} {scan_us:>10.1f} us/query")
+    print(f"{'indexed':<16} {indexed_us:>10.1f} us/query")
+    print(f"{'speedup':<16} {scan_us / indexed_us:>10.0f}x")
+    print(f"Rows the substring test wrongly matched for 'C': {wrong}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Benchmark the chordsense CLI on large newline-delimited inputs.
+
+Writes an input file per subcommand (chord names, 'root quality' pairs and
+note sets drawn from the catalog), runs `chordsense.py <command>` on it in a
+subprocess with output to a file, and reports lines/sec.
+
+    python bench_cli.py 10000000 --jobs 1 4
+"""
+
+import argparse
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts')
+sys.path.insert(0, SCRIPTS_DIR)
+
+from chord_generator import ChordGenerator
+
+
+def write_inputs(tmp, lines, seed=0):
+    """Write one input file per subcommand and return {command: path}."""
+    generator = ChordGenerator()
+    chords = generator.generate_all_chords()
+    vocabularies = {
+        'lookup': [chord['chord'] for chord in chords],
+        'spell': [f"{chord['root']} {chord['type']}" for chord in chords],
+        'identify': [" ".join(chord['notes']) for chord in chords],
+    }
+    rng = random.Random(seed)
+    paths = {}
+    for command, vocabulary in vocabularies.items():
+        path = os.path.join(tmp, f'{command}.txt')
+        with open(path, 'w', encoding='utf-8') as f:
+            remaining = lines
+            while remaining:
+                batch = min(remaining, 100000)
+                f.write("\n".join(rng.choices(vocabulary, k=batch)) + "\n")
+                remaining -= batch
+        paths[command] = path
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('lines', type=int, nargs='?', default=1000000, help="input lines per command")
+    parser.add_argument('--jobs', type=int, nargs='+', default=[1], help="--jobs values to compare")
+    parser.add_argument('--format', choices=['csv', 'jsonl'], default='csv')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = write_inputs(tmp, args.lines)
+        output = os.path.join(tmp, 'out')
+
+        print("CHORDSENSE CLI BENCHMARK")
+        print("=" * 50)
+        print(f"{args.lines:,} lines per command, {args.format} output")
+        for command, path in paths.items():
+            for jobs in args.jobs:
+                start = time.perf_counter()
+                subprocess.run([sys.executable, os.path.join(SCRIPTS_DIR, 'chordsense.py'), command, path,
+                                '--format', args.format, '--jobs', str(jobs), '-o', output], check=True)
+                elapsed = time.perf_counter() - start
+                print(f"{command:<10} jobs={jobs:<3} {elapsed:>8.2f} s {args.lines / elapsed:>14,.0f} lines/s")
+
+
+if __name__ == "__main__":
+    main()
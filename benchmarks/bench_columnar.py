@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Benchmark the analyze_chords.main query mix on CSV versus columnar input.
+
+For each catalog scale the catalog is written as CSV and with
+save_chords_to_columns (Parquet if pyarrow is installed, .npy columns
+otherwise), then timed cold (load + queries) and warm (queries only).
+If duckdb is installed the same queries also run as SQL over both files.
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+
+from bench_utils import add_synthetic_qualities, time_call
+
+from analyze_chords import ChordTable
+from chord_columnar import ColumnarChordCatalog
+from chord_generator import ChordGenerator
+
+# Same queries as analyze_chords.main
+QUERIES = [
+    {'chord_type': 'Dominant', 'chord_extension': 'Dominant 7th'},
+    {'contains_note': 'C#'},
+    {'chord_type': 'Minor', 'chord_extension': 'Minor 9th'},
+    {'chord_type': 'Suspended'},
+]
+
+SQL_QUERIES = [
+    "SELECT chord_type, count(*) FROM {source} GROUP BY 1",
+    "SELECT chord_extension, count(*) FROM {source} GROUP BY 1",
+    "SELECT chord_type, chord_extension, count(*) FROM {source} GROUP BY 1, 2",
+    "SELECT chord_name FROM {source} WHERE chord_type = 'Dominant' AND chord_extension = 'Dominant 7th'",
+    "SELECT chord_name FROM {source} WHERE {contains}",
+    "SELECT chord_name FROM {source} WHERE chord_type = 'Minor' AND chord_extension = 'Minor 9th'",
+    "SELECT chord_name FROM {source} WHERE chord_type = 'Suspended'",
+]
+
+
+def csv_queries(table):
+    table.analyze()
+    return [table.find(**query) for query in QUERIES]
+
+
+def columnar_queries(catalog):
+    catalog.summary()
+    return [catalog.find(**query) for query in QUERIES]
+
+
+def duckdb_timings(csv_file, columns_path):
+    """(csv seconds, columnar seconds) for the SQL query mix, or None without duckdb/Parquet."""
+    try:
+        import duckdb
+    except ImportError:
+        return None
+    if not columns_path.endswith('.parquet'):
+        return None
+    connection = duckdb.connect()
+    sources = [
+        (f"read_csv_auto('{csv_file}')", "list_contains(string_split(notes, ', '), 'C#')"),
+        (f"read_parquet('{columns_path}')", "list_contains(notes, 'C#')"),
+    ]
+    return tuple(
+        time_call(lambda: [connection.execute(sql.format(source=source, contains=contains)).fetchall()
+                           for sql in SQL_QUERIES])
+        for source, contains in sources
+    )
+
+
+def main(scales=(0, 570, 5860)):
+    print("COLUMNAR EXPORT BENCHMARK")
+    print("=" * 68)
+    print(f"{'chords':>9} {'input':<9} {'size KB':>9} {'load+query ms':>14} {'query ms':>10} {'duckdb ms':>10}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for synthetic in scales:
+            generator = ChordGenerator()
+            add_synthetic_qualities(generator, synthetic)
+            csv_file = os.path.join(tmp, f'chords_{synthetic}.csv')
+            with contextlib.redirect_stdout(io.StringIO()):
+                generator.save_chords_to_csv(csv_file)
+                columns_path = generator.save_chords_to_columns(os.path.join(tmp, f'chords_{synthetic}.parquet'))
+
+            table = ChordTable.from_csv(csv_file)
+            catalog = ColumnarChordCatalog(columns_path)
+            assert csv_queries(table) == columnar_queries(catalog)
+
+            if os.path.isdir(columns_path):
+                columns_size = sum(os.path.getsize(os.path.join(columns_path, name)) for name in os.listdir(columns_path))
+            else:
+                columns_size = os.path.getsize(columns_path)
+            duckdb_times = duckdb_timings(csv_file, columns_path) or (None, None)
+
+            runs = [
+                ('csv', os.path.getsize(csv_file),
+                 time_call(lambda: csv_queries(ChordTable.from_csv(csv_file))),
+                 time_call(lambda: csv_queries(table)), duckdb_times[0]),
+                ('columnar', columns_size,
+                 time_call(lambda: columnar_queries(ColumnarChordCatalog(columns_path))),
+                 time_call(lambda: columnar_queries(catalog)), duckdb_times[1]),
+            ]
+            for name, size, cold, warm, sql in runs:
+                sql_text = f"{sql * 1e3:>10.1f}" if sql is not None else f"{'-':>10}"
+                print(f"{len(table):>9,} {name:<9} {size / 1024:>9,.0f} {cold * 1e3:>14.1f} {warm * 1e3:>10.1f} {sql_text}")
+
+
+if __name__ == "__main__":
+    main(tuple(int(arg) for arg in sys.argv[1:]) or (0, 570, 5860))
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+Benchmark ChordGenerator.find_chord against the old full-scan lookup.
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from chord_generator import ChordGenerator
+
+
+def linear_find_chord(generator, chord_name):
+    """The pre-index implementation: regenerate the catalog and scan it."""
+    for chord in generator.generate_all_chords():
+        if chord['chord'].lower() == chord_name.lower():
+            return chord
+    return None
+
+
+def main():
+    """Time both lookups over a mix of chord names."""
+    generator = ChordGenerator()
+    names = ['C#m', 'Dbm', 'F#maj7', 'Gbmaj7', 'Am7', 'Dm9',
+             'G7sus4', 'Bdim7', 'Eaug', 'Abmaj9', 'bm7b5', 'Xyz']
+    
+    rounds = 50
+    linear = timeit.timeit(
+        lambda: [linear_find_chord(generator, name) for name in names], number=rounds)
+    
+    generator.find_chord('C')  # build the index outside the timed loop
+    indexed = timeit.timeit(
+        lambda: [generator.find_chord(name) for name in names], number=rounds * 100)
+    
+    lookups = len(names) * rounds
+    linear_us = linear / lookups * 1e6
+    indexed_us = indexed / (lookups * 100) * 1e6
+    
+    print("FIND_CHORD BENCHMARK")
+    print("=" * 50)
+    print(f"{'linear scan':<16} {linear_us:>10.2f} us/lookup")
+    print(f"{'indexed':<16} {indexed_us:>10.2f} us/lookup")
+    print(f"{'speedup':<16} {linear_us / indexed_us:>10.0f}x")
+
+
+if __name__ == "__main__":
+    main()
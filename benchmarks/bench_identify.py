@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Benchmark ChordIdentifier single and batch queries.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from chord_identifier import ChordIdentifier
+
+
+def main(count=1_000_000):
+    """Identify `count` random catalog note sets in one batch."""
+    identifier = ChordIdentifier()
+    chords = identifier.generator.generate_all_chords()
+    
+    rng = random.Random(0)
+    note_sets = []
+    for _ in range(count):
+        notes = list(rng.choice(chords)['notes'])
+        rng.shuffle(notes)
+        note_sets.append(notes)
+    
+    start = time.perf_counter()
+    identifier.best_name_table()
+    build = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    names = identifier.identify_batch(note_sets)
+    batch = time.perf_counter() - start
+    
+    sample = note_sets[:10_000]
+    start = time.perf_counter()
+    for notes in sample:
+        identifier.identify(notes)
+    single = time.perf_counter() - start
+    
+    print("CHORD IDENTIFIER BENCHMARK")
+    print("=" * 50)
+    print(f"{'table build':<20} {build * 1e3:>10.1f} ms")
+    print(f"{'identify_batch':<20} {count / batch:>10,.0f} sets/sec")
+    print(f"{'identify':<20} {len(sample) / single:>10,.0f} sets/sec")
+    print(f"{'unmatched':<20} {names.count(None):>10}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Benchmark incremental catalog builds (chord_incremental.py) against a full
+save_chords() rewrite on a catalog scaled up with synthetic qualities.
+
+    python bench_incremental.py 10000     # synthetic qualities (17 chords each)
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+
+from bench_utils import add_synthetic_qualities
+
+from chord_generator import ChordGenerator
+from chord_incremental import build_catalog
+
+
+def timed(func):
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = func()
+    return time.perf_counter() - start, result
+
+
+def main(count=10000):
+    generator = ChordGenerator()
+    add_synthetic_qualities(generator, count)
+    chords = len(generator.chord_intervals) * 17
+
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_file = os.path.join(tmp, 'chords.csv')
+        txt_file = os.path.join(tmp, 'chords.txt')
+
+        steps = [('full save_chords', lambda: generator.save_chords(csv_file, txt_file)),
+                 ('incremental, no manifest', lambda: build_catalog(generator, csv_file, txt_file)),
+                 ('incremental, unchanged', lambda: build_catalog(generator, csv_file, txt_file))]
+
+        def add_quality():
+            generator.chord_intervals['minor_add13'] = [0, 3, 7, 9]
+            generator.chord_suffixes['minor_add13'] = 'madd13'
+            generator.chord_types['minor_add13'] = 'Minor'
+            generator.chord_extensions['minor_add13'] = 'Minor Add 13'
+            return build_catalog(generator, csv_file, txt_file)
+
+        def change_quality():
+            generator.chord_intervals['major7'] = [0, 4, 7, 11, 14]
+            return build_catalog(generator, csv_file, txt_file)
+
+        steps += [('incremental, 1 quality added', add_quality),
+                  ('incremental, 1 quality changed', change_quality)]
+
+        print("INCREMENTAL CATALOG BENCHMARK")
+        print("=" * 62)
+        print(f"{len(generator.chord_intervals):,} qualities, ~{chords:,} chords")
+        for name, step in steps:
+            elapsed, summary = timed(step)
+            detail = f"{summary['rebuilt']}/{summary['sections']} sections" if summary else ""
+            print(f"{name:<32} {elapsed * 1000:>10.1f} ms  {detail}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
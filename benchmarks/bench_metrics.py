@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Benchmark the overhead of chord_metrics instrumentation.
+
+Times the hot public calls with instrumentation never enabled, enabled, and
+enabled then disabled again (the original methods are restored, so this
+should match the first column within noise).
+"""
+
+import gc
+import os
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+import analyze_chords
+from chord_generator import ChordGenerator
+from chord_metrics import metrics
+
+
+def cases(generator, csv_file):
+    return {
+        'find_chord': (lambda: generator.find_chord('F#m7'), 200000),
+        'generate_chord_notes': (lambda: generator.generate_chord_notes('Db', 'minor7', False), 200000),
+        'generate_all_chords': (generator.generate_all_chords, 200),
+        'find_chords_by_criteria': (lambda: analyze_chords.find_chords_by_criteria(csv_file, chord_type='Minor'),
+                                    5000),
+    }
+
+
+def measure(generator, csv_file, repeat=5):
+    """Best per-call time in microseconds for each case."""
+    results = {}
+    for name, (call, number) in cases(generator, csv_file).items():
+        gc.collect()
+        results[name] = min(timeit.repeat(call, number=number, repeat=repeat)) / number * 1e6
+    return results
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_file = os.path.join(tmp, 'chords.csv')
+        generator = ChordGenerator()
+        generator.save_chords_to_csv(csv_file)
+
+        baseline = measure(generator, csv_file)
+        metrics.enable()
+        enabled = measure(generator, csv_file)
+        metrics.disable()
+        disabled = measure(generator, csv_file)
+
+    print("INSTRUMENTATION OVERHEAD BENCHMARK")
+    print("=" * 72)
+    print(f"{'call':<26} {'off':>10} {'enabled':>10} {'overhead':>10} {'disabled':>10}")
+    for name in baseline:
+        overhead = enabled[name] - baseline[name]
+        print(f"{name:<26} {baseline[name]:>8.2f}us {enabled[name]:>8.2f}us "
+              f"{overhead:>+8.2f}us {disabled[name]:>8.2f}us")
+
+
+if __name__ == "__main__":
+    main()
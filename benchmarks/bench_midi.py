@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Benchmark MIDI chord recognition on synthesized Standard MIDI Files.
+
+Writes a directory of two-track files (chords plus a drum track) built from
+random catalog chords, then reports events/sec and files/sec for a single
+file, the serial batch and the process-pool batch.
+"""
+
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from chord_generator import ChordGenerator
+from chord_midi import MidiChordRecognizer, label_directory
+
+DIVISION = 480
+
+
+def _varlen(value):
+    data = [value & 0x7F]
+    value >>= 7
+    while value:
+        data.append((value & 0x7F) | 0x80)
+        value >>= 7
+    return bytes(reversed(data))
+
+
+def _track(events):
+    """Encode (tick, bytes) events as an MTrk chunk."""
+    body = bytearray()
+    last = 0
+    for tick, message in sorted(events, key=lambda event: event[0]):
+        body += _varlen(tick - last) + message
+        last = tick
+    body += _varlen(0) + b'\xff\x2f\x00'
+    return b'MTrk' + struct.pack('>I', len(body)) + bytes(body)
+
+
+def write_synthetic_midi(filename, rng, chords, bars=64):
+    """A file with one random chord per beat and a drum hit on every beat."""
+    harmony = [(0, b'\xff\x51\x03' + (600000).to_bytes(3, 'big'))]
+    drums = []
+    for beat in range(bars * 4):
+        tick = beat * DIVISION
+        chord = rng.choice(chords)
+        base = 48 + chord['root_pc']
+        for interval in chord['intervals']:
+            harmony.append((tick, bytes([0x90, base + interval, 80])))
+            harmony.append((tick + DIVISION - 10, bytes([0x80, base + interval, 0])))
+        drums.append((tick, bytes([0x99, 36, 100])))
+        drums.append((tick + 60, bytes([0x89, 36, 0])))
+    header = b'MThd' + struct.pack('>IHHh', 6, 1, 2, DIVISION)
+    with open(filename, 'wb') as f:
+        f.write(header + _track(harmony) + _track(drums))
+    return len(harmony) + len(drums)
+
+
+def main(file_count=200, bars=64):
+    generator = ChordGenerator()
+    chords = [{'root_pc': root, 'intervals': intervals}
+              for root in range(12) for intervals in generator.chord_intervals.values()]
+    rng = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        midi_dir = os.path.join(tmp, 'midi')
+        os.makedirs(midi_dir)
+        total_events = 0
+        for i in range(file_count):
+            total_events += write_synthetic_midi(os.path.join(midi_dir, f'song_{i:04d}.mid'), rng, chords, bars)
+
+        recognizer = MidiChordRecognizer()
+        first = os.path.join(midi_dir, 'song_0000.mid')
+        start = time.perf_counter()
+        segments = recognizer.label_file(first)
+        single = time.perf_counter() - start
+        single_events = recognizer.event_count
+        labelled = sum(1 for segment in segments if segment.chord)
+
+        print("MIDI CHORD RECOGNITION BENCHMARK")
+        print("=" * 58)
+        print(f"{'files':<20} {file_count:>10,}")
+        print(f"{'events':<20} {total_events:>10,}")
+        print(f"{'labelled segments':<20} {labelled:>10,} of {len(segments)} in the first file")
+        print(f"{'single file':<20} {single_events / single:>12,.0f} events/s")
+
+        output = os.path.join(tmp, 'chords.csv')
+        for name, jobs in [('batch, 1 process', 1), (f'batch, {os.cpu_count()} processes', None)]:
+            start = time.perf_counter()
+            files, _, events, _ = label_directory(midi_dir, output, jobs=jobs)
+            elapsed = time.perf_counter() - start
+            print(f"{name:<20} {events / elapsed:>12,.0f} events/s {files / elapsed:>10,.1f} files/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark chord n-gram counting on a synthetic progression corpus.
+
+Writes a corpus of common progressions (ii-V-I, I-vi-IV-V, ...) in random
+keys mixed with random catalog chords, then runs chord_ngrams.py over it
+with each --jobs value and reports chords/sec and peak RSS.
+
+    python bench_ngrams.py 10000000 --jobs 1 4
+"""
+
+import argparse
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts')
+sys.path.insert(0, SCRIPTS_DIR)
+
+from chord_progressions import ProgressionEngine
+
+PATTERNS = ['ii7-V7-Imaj7', 'I-vi-IV-V', 'I-V-vi-IV', 'vi-IV-I-V', 'ii7-V7-Imaj7-vi7',
+            'I-IV-V-I', 'iii7-vi7-ii7-V7', 'Imaj7-IV7-iii7-vi7', 'I-bVII-IV-I', 'ii7-V7-iii7-vi7']
+
+
+def write_corpus(filename, chords, seed=0):
+    """Write about `chords` chords as progressions of 4-16 chords per line."""
+    rng = random.Random(seed)
+    engine = ProgressionEngine()
+    keys = [engine.key_name(tonic) for tonic in range(12)]
+    phrases = [engine.resolve(pattern, key) for pattern in PATTERNS for key in keys]
+    vocabulary = [name for table in engine.name_tables for name in table.ravel()]
+
+    written = 0
+    with open(filename, 'w', encoding='utf-8') as f:
+        lines = []
+        while written < chords:
+            line = []
+            while len(line) < rng.randint(4, 16):
+                line.extend(rng.choice(phrases) if rng.random() < 0.7 else [rng.choice(vocabulary)])
+            lines.append(" ".join(line))
+            written += len(line)
+            if len(lines) == 10000:
+                f.write("\n".join(lines) + "\n")
+                lines = []
+        if lines:
+            f.write("\n".join(lines) + "\n")
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('chords', type=int, nargs='?', default=10000000, help="corpus size in chords")
+    parser.add_argument('--jobs', type=int, nargs='+', default=[1], help="--jobs values to compare")
+    parser.add_argument('--orders', type=int, nargs='+', default=[2, 3])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        corpus = os.path.join(tmp, 'corpus.txt')
+        chords = write_corpus(corpus, args.chords)
+        output = os.path.join(tmp, 'ngrams.csv')
+
+        print("CHORD N-GRAM BENCHMARK")
+        print("=" * 50)
+        print(f"{chords:,} chords, {os.path.getsize(corpus) / 1e6:.0f} MB corpus, orders {args.orders}")
+        for jobs in args.jobs:
+            start = time.perf_counter()
+            process = subprocess.Popen([sys.executable, os.path.join(SCRIPTS_DIR, 'chord_ngrams.py'), corpus,
+                                        '--jobs', str(jobs), '--orders', *map(str, args.orders), '-o', output])
+            _, status, usage = os.wait4(process.pid, 0)
+            elapsed = time.perf_counter() - start
+            if status:
+                raise SystemExit(f"chord_ngrams.py failed with status {status}")
+            print(f"jobs={jobs:<3} {elapsed:>7.2f} s {chords / elapsed:>12,.0f} chords/s "
+                  f"{usage.ru_maxrss / 1024:>7.0f} MB peak RSS")
+
+        with open(output, encoding='utf-8') as f:
+            print("\nTop transposition-normalized n-grams:")
+            for line in list(f)[1:4]:
+                print("  " + line.strip())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Benchmark transposing a progression corpus into all 12 keys.
+"""
+
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from chord_progressions import ProgressionEngine
+
+PATTERNS = ['ii7-V7-Imaj7', 'I-V-vi-IV', 'vi-IV-I-V', 'I-vi-ii-V', 'i-iv-V7-i',
+            'I-IV-V-IV', 'iii7-vi7-ii7-V7-Imaj7', 'I-bVII-IV-I']
+
+
+def main(count=100_000):
+    """Encode, transpose and spell `count` progressions in all 12 keys."""
+    engine = ProgressionEngine()
+    rng = random.Random(0)
+    
+    start = time.perf_counter()
+    corpus = [rng.choice(PATTERNS) for _ in range(count)]
+    roots, qualities = engine.encode_corpus(corpus, 'C')
+    encode = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    transposed = engine.transpose_all_keys(roots)
+    transpose = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    for shift in range(12):
+        engine.spell(transposed[shift], qualities, engine.key_name(shift))
+    spell = time.perf_counter() - start
+    
+    start = time.perf_counter()
+    engine.analyze(roots, qualities, 'C')
+    analyze = time.perf_counter() - start
+    
+    print("PROGRESSION ENGINE BENCHMARK")
+    print("=" * 50)
+    print(f"{'progressions':<24} {count:>10,}")
+    print(f"{'chords x 12 keys':<24} {int(np.count_nonzero(transposed != -1)):>10,}")
+    print(f"{'encode':<24} {encode * 1e3:>10.1f} ms")
+    print(f"{'transpose (12 keys)':<24} {transpose * 1e3:>10.1f} ms")
+    print(f"{'spell (12 keys)':<24} {spell * 1e3:>10.1f} ms")
+    print(f"{'roman analysis':<24} {analyze * 1e3:>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
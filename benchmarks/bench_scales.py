@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark scale -> chord queries: precomputed bitmatrix versus a brute-force
+scan of generate_all_chords().
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from chord_parser import note_pitch_class
+from chord_scales import SCALE_INTERVALS, ScaleCatalog
+
+SCALES = ['C major', 'D dorian', 'A harmonic minor', 'G altered', 'F# whole tone', 'Eb blues']
+
+
+def brute_force(chords, scale):
+    """What callers did before: test every chord's notes against the scale."""
+    root, _, name = scale.partition(' ')
+    tonic = note_pitch_class(root)
+    scale_pcs = {(tonic + interval) % 12 for interval in SCALE_INTERVALS[name.replace(' ', '_')]}
+    return [chord['chord'] for chord in chords
+            if all(note_pitch_class(note) in scale_pcs for note in chord['notes'])]
+
+
+def main(rounds=200):
+    start = time.perf_counter()
+    catalog = ScaleCatalog()
+    build = time.perf_counter() - start
+    chords = catalog.generator.generate_all_chords()
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for scale in SCALES:
+            brute_force(chords, scale)
+    scan = (time.perf_counter() - start) / (rounds * len(SCALES))
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for scale in SCALES:
+            catalog.chords_in_scale(scale)
+    lookup = (time.perf_counter() - start) / (rounds * len(SCALES))
+
+    # Bulk: every (scale, chord) pair in one call
+    scale_ids = np.arange(len(catalog.scale_masks))[:, None]
+    chord_ids = np.arange(catalog.chord_count)[None, :]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        catalog.compatibility(scale_ids, chord_ids)
+    bulk = (time.perf_counter() - start) / rounds
+
+    print("SCALE CATALOG BENCHMARK")
+    print("=" * 50)
+    print(f"{'build catalog':<24} {build * 1e3:>10.1f} ms")
+    print(f"{'brute-force scan':<24} {scan * 1e6:>10.1f} us/scale")
+    print(f"{'chords_in_scale':<24} {lookup * 1e6:>10.1f} us/scale")
+    print(f"{'all pairs (vectorized)':<24} {bulk * 1e3:>10.2f} ms for {scale_ids.size * chord_ids.size:,} pairs")
+
+
+if __name__ == "__main__":
+    main()
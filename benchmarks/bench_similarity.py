@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+Benchmark building the chord similarity index and batched k-NN queries.
+"""
+
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+
+from chord_similarity import ChordSimilarity
+
+
+def main(count=100_000, k=10):
+    """Build the index, then find k neighbours for `count` random chords."""
+    start = time.perf_counter()
+    similarity = ChordSimilarity()
+    build = time.perf_counter() - start
+
+    rng = np.random.default_rng(0)
+    roots = rng.integers(0, 12, count)
+    qualities = rng.integers(0, len(similarity.qualities), count)
+
+    start = time.perf_counter()
+    similarity.nearest_keys(roots, qualities, k)
+    batch = time.perf_counter() - start
+
+    names = random.Random(0).choices(list(similarity.keys_by_name), k=1000)
+    start = time.perf_counter()
+    for name in names:
+        similarity.nearest(name, k)
+    single = time.perf_counter() - start
+
+    table_bytes = sum(table.nbytes for table in similarity.distances.values())
+    print("CHORD SIMILARITY BENCHMARK")
+    print("=" * 50)
+    print(f"{'build index':<24} {build * 1e3:>10.1f} ms")
+    print(f"{'distance tables':<24} {table_bytes:>10,} bytes")
+    print(f"{f'batched {k}-NN':<24} {count / batch:>10,.0f} queries/s")
+    print(f"{f'nearest() {k}-NN':<24} {len(names) / single:>10,.0f} queries/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
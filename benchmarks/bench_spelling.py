@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Benchmark the letter-correct spelling table: generate_chord_notes over the
+whole catalog with an empty table (every chord spelled note by note) and
+with a filled one (one list index per chord), plus export and find_chord
+costs, on the default catalog and with synthetic qualities.
+"""
+
+import io
+import timeit
+
+from bench_utils import add_synthetic_qualities, time_call
+
+from chord_generator import ChordGenerator
+
+
+def main(synthetic_counts=(0, 200, 1000)):
+    print("SPELLING TABLE BENCHMARK")
+    print("=" * 78)
+    print(f"{'qualities':>9} {'chords':>8} {'cold us':>8} {'warm us':>8} "
+          f"{'export ms':>10} {'find index ms':>14} {'find us':>8}")
+    for count in synthetic_counts:
+        generator = ChordGenerator()
+        add_synthetic_qualities(generator, count)
+        keys = [(chord['root'], chord['type'], 'b' not in chord['root'][1:])
+                for chord in generator.generate_all_chords()]
+
+        def spell_all():
+            for key in keys:
+                generator.generate_chord_notes(*key)
+
+        def cold_pass():
+            generator.invalidate_caches()
+            spell_all()
+        cold = time_call(cold_pass)
+        rounds = max(1, 20000 // len(keys))
+        warm = timeit.timeit(spell_all, number=rounds) / rounds
+
+        export = time_call(lambda: generator._write_export(generator.iter_chords(), io.StringIO(), io.StringIO()))
+
+        def build_index():
+            generator._chord_index = None
+            generator.find_chord('C')
+        index = time_call(build_index)
+        names = ['Gbdim', 'Cbmaj7', 'E#m', 'F#maj7', 'bbm7b5', 'Fbb7', 'Xyz'] * 100
+        find = timeit.timeit(lambda: [generator.find_chord(name) for name in names], number=10) / (10 * len(names))
+
+        print(f"{len(generator.chord_intervals):>9,} {len(keys):>8,} {cold / len(keys) * 1e6:>8.2f} "
+              f"{warm / len(keys) * 1e6:>8.2f} {export * 1e3:>10.1f} {index * 1e3:>14.1f} {find * 1e6:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
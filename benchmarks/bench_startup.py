@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Benchmark ChordGenerator startup: module import, instance creation and the
+first lookups, each measured in a fresh interpreter.
+
+    python bench_startup.py                         # the scripts/ in this tree
+    python bench_startup.py --scripts-dir /tmp/old  # e.g. an older checkout
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+DEFAULT_SCRIPTS = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts')
+
+PROBE = r'''
+import json, sys, time
+sys.path.insert(0, sys.argv[1])
+start = time.perf_counter()
+import chord_generator
+imported = time.perf_counter()
+generator = chord_generator.ChordGenerator()
+created = time.perf_counter()
+generator.get_note_at_interval('Eb', 7)
+first_note = time.perf_counter()
+generator.find_chord('F#m7')
+first_find = time.perf_counter()
+for _ in range(1000):
+    chord_generator.ChordGenerator()
+instances = time.perf_counter()
+print(json.dumps({
+    'import': imported - start,
+    'create': created - imported,
+    'first get_note_at_interval': first_note - created,
+    'first find_chord': first_find - first_note,
+    'import + first lookup': first_note - start,
+    'per instance': (instances - first_find) / 1000,
+}))
+'''
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scripts-dir', default=DEFAULT_SCRIPTS, help="directory containing chord_generator.py")
+    parser.add_argument('--runs', type=int, default=20, help="fresh interpreters to sample (default: 20)")
+    args = parser.parse_args()
+
+    samples = []
+    for _ in range(args.runs):
+        output = subprocess.run([sys.executable, '-c', PROBE, os.path.abspath(args.scripts_dir)],
+                                capture_output=True, text=True, check=True).stdout
+        samples.append(json.loads(output))
+
+    print("CHORD GENERATOR STARTUP BENCHMARK")
+    print("=" * 50)
+    print(f"median of {args.runs} fresh interpreters ({args.scripts_dir})")
+    for key in samples[0]:
+        print(f"{key:<28} {statistics.median(sample[key] for sample in samples) * 1e6:>10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""
+Shared helpers for the benchmark scripts.
+"""
+
+import os
+import random
+import sys
+import time
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts')
+if SCRIPTS_DIR not in sys.path:
+    sys.path.insert(0, SCRIPTS_DIR)
+
+
+def add_synthetic_qualities(generator, count, seed=0):
+    """Add `count` random chord qualities so the catalog can be scaled up.
+    
+    Each quality adds 17 chords (12 sharp roots + 5 flat spellings).
+    """
+    rng = random.Random(seed)
+    intervals = dict(generator.chord_intervals)
+    suffixes = dict(generator.chord_suffixes)
+    types = dict(generator.chord_types)
+    extensions = dict(generator.chord_extensions)
+    for i in range(count):
+        size = rng.randint(3, 6)
+        quality = f'synthetic{i}'
+        intervals[quality] = [0] + sorted(rng.sample(range(1, 24), size - 1))
+        suffixes[quality] = f'x{i}'
+        types[quality] = 'Synthetic'
+        extensions[quality] = f'Synthetic {size}-note'
+    generator.chord_intervals = intervals
+    generator.chord_suffixes = suffixes
+    generator.chord_types = types
+    generator.chord_extensions = extensions
+
+
+def time_call(func, repeat=3):
+    """Best wall time of `repeat` calls."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""
+Benchmark voicing generation for the full catalog, serial and sharded.
+"""
+
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from bench_utils import SCRIPTS_DIR  # noqa: F401  (puts scripts/ on sys.path)
+from chord_voicings import VoicingGenerator
+
+
+def main():
+    """Write every guitar and piano voicing of the 374-chord catalog."""
+    generator = VoicingGenerator()
+    cases = [
+        ('guitar', {'instrument': 'guitar'}),
+        ('guitar wide', {'instrument': 'guitar', 'max_fret': 15, 'max_span': 5}),
+        ('ukulele', {'instrument': 'ukulele'}),
+        ('piano', {'instrument': 'piano'}),
+    ]
+    
+    print("VOICING BENCHMARK")
+    print("=" * 50)
+    print(f"{'case':<14} {'jobs':>5} {'voicings':>10} {'seconds':>9} {'voicings/s':>12}")
+    with tempfile.TemporaryDirectory() as tmp:
+        output = os.path.join(tmp, 'voicings.csv')
+        for label, options in cases:
+            for jobs in (1, None):
+                start = time.perf_counter()
+                with contextlib.redirect_stdout(io.StringIO()):
+                    count = generator.write_voicings(output, jobs=jobs, **options)
+                elapsed = time.perf_counter() - start
+                print(f"{label:<14} {jobs or os.cpu_count():>5} {count:>10,} "
+                      f"{elapsed:>9.2f} {count / elapsed:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Load test for the chord lookup service (scripts/chord_server.py).
+
+Starts the server on a free local port (or targets --port), then runs
+concurrent keep-alive clients and reports p50/p99 latency and requests/sec
+for single lookups, criteria searches and batch requests.
+
+    python load_test.py                      # spawn a server and test it
+    python load_test.py --port 8765 --requests 50000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts')
+sys.path.insert(0, SCRIPTS_DIR)
+
+from chord_generator import ChordGenerator
+
+SEARCHES = [
+    'chord_type=Dominant&chord_extension=Dominant%207th',
+    'contains_note=C%23',
+    'chord_type=Minor&chord_extension=Minor%209th',
+    'chord_type=Suspended&limit=10',
+]
+
+
+def build_workloads(batch_size):
+    """Return {workload name: list of (method, path, body)} requests to cycle through."""
+    generator = ChordGenerator()
+    chords = generator.generate_all_chords()
+    names = [chord['chord'] for chord in chords]
+    rng = random.Random(0)
+
+    batch_bodies = []
+    for _ in range(64):
+        requests = [{'endpoint': 'chord', 'params': {'name': name}} for name in rng.sample(names, batch_size)]
+        batch_bodies.append(json.dumps({'requests': requests}).encode())
+
+    return {
+        'chord': [('GET', f"/chord?name={name.replace('#', '%23')}", b'') for name in names],
+        'notes': [('GET', f"/notes?root={chord['root'].replace('#', '%23')}&quality={chord['type']}", b'')
+                  for chord in chords],
+        'search': [('GET', f"/search?{query}", b'') for query in SEARCHES],
+        'batch': [('POST', '/batch', body) for body in batch_bodies],
+    }
+
+
+async def client(host, port, requests, count, latencies):
+    """Send `count` requests over one keep-alive connection."""
+    reader, writer = await asyncio.open_connection(host, port)
+    offset = random.randrange(len(requests))
+    for i in range(count):
+        method, path, body = requests[(offset + i) % len(requests)]
+        start = time.perf_counter()
+        writer.write(f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+        await writer.drain()
+
+        length = 0
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b''):
+                break
+            if line.lower().startswith(b'content-length:'):
+                length = int(line.split(b':')[1])
+        await reader.readexactly(length)
+        latencies.append(time.perf_counter() - start)
+    writer.close()
+
+
+async def run_workload(host, port, requests, total, concurrency):
+    """Return (latencies, elapsed seconds) for `total` requests."""
+    latencies = []
+    per_client = max(1, total // concurrency)
+    start = time.perf_counter()
+    await asyncio.gather(*(client(host, port, requests, per_client, latencies) for _ in range(concurrency)))
+    return latencies, time.perf_counter() - start
+
+
+def start_server():
+    """Spawn chord_server.py on a free port and return (process, port)."""
+    process = subprocess.Popen([sys.executable, os.path.join(SCRIPTS_DIR, 'chord_server.py'), '--port', '0'],
+                               stdout=subprocess.PIPE, text=True)
+    line = process.stdout.readline()
+    return process, int(line.rsplit(':', 1)[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the chord lookup service")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, help="test a running server instead of spawning one")
+    parser.add_argument('--requests', type=int, default=20000, help="requests per workload")
+    parser.add_argument('--concurrency', type=int, default=32, help="concurrent keep-alive connections")
+    parser.add_argument('--batch-size', type=int, default=50, help="lookups per batch request")
+    args = parser.parse_args()
+
+    process = None
+    port = args.port
+    if port is None:
+        process, port = start_server()
+
+    try:
+        print("CHORD SERVICE LOAD TEST")
+        print("=" * 62)
+        print(f"{'workload':<10} {'requests':>10} {'req/s':>10} {'lookups/s':>12} {'p50 ms':>8} {'p99 ms':>8}")
+        for name, requests in build_workloads(args.batch_size).items():
+            latencies, elapsed = asyncio.run(run_workload(args.host, port, requests, args.requests, args.concurrency))
+            latencies.sort()
+            p50 = latencies[len(latencies) // 2] * 1e3
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1e3
+            rate = len(latencies) / elapsed
+            lookups = rate * (args.batch_size if name == 'batch' else 1)
+            print(f"{name:<10} {len(latencies):>10,} {rate:>10,.0f} {lookups:>12,.0f} {p50:>8.2f} {p99:>8.2f}")
+    finally:
+        if process is not None:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
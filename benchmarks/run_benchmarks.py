@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Benchmark regression suite for the chord_generator and analyze_chords hot paths.
+
+Times each hot path at several catalog scales (synthetic qualities push the
+catalog from 374 chords up to ~1M), records ops/sec and tracemalloc peak
+memory, and compares the run against a JSON baseline.
+
+    python run_benchmarks.py --save-baseline           # record baseline.json
+    python run_benchmarks.py                           # compare, exit 1 on regression
+    python run_benchmarks.py --scales base,10k,100k,1m --threshold 0.3
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from bench_utils import add_synthetic_qualities
+
+import analyze_chords
+from chord_generator import ChordGenerator
+
+# Catalog scale name -> synthetic qualities added (17 chords each)
+SCALES = {
+    'base': 0,        # 374 chords
+    '10k': 570,       # ~10k chords
+    '100k': 5860,     # ~100k chords
+    '1m': 58800,      # ~1M chords
+}
+
+DEFAULT_SCALES = 'base,10k'
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+
+CRITERIA_QUERIES = [
+    {'chord_type': 'Dominant', 'chord_extension': 'Dominant 7th'},
+    {'contains_note': 'C#'},
+    {'chord_type': 'Minor', 'chord_extension': 'Minor 9th'},
+    {'chord_type': 'Suspended'},
+]
+
+
+def build_cases(generator, csv_file):
+    """Return (name, operations per call, setup, function) benchmark cases."""
+    roots = generator.chromatic_notes_sharp
+    qualities = list(generator.chord_intervals)
+    names = [chord['chord'] for chord in generator.generate_all_chords()[::97]][:200]
+
+    def note_at_interval():
+        for root in roots:
+            for interval in range(24):
+                generator.get_note_at_interval(root, interval)
+
+    def chord_notes():
+        for root in roots:
+            for quality in qualities[:50]:
+                generator.generate_chord_notes(root, quality)
+
+    def find_chords():
+        for name in names:
+            generator.find_chord(name)
+
+    def cold_find_chord():
+        generator.invalidate_caches()
+        generator.find_chord(names[0])
+
+    def save_csv():
+        with contextlib.redirect_stdout(io.StringIO()):
+            generator.save_chords_to_csv(csv_file)
+
+    def criteria_queries():
+        for query in CRITERIA_QUERIES:
+            analyze_chords.find_chords_by_criteria(csv_file, **query)
+
+    def analyze_data():
+        analyze_chords.analyze_chord_data(csv_file)
+
+    def reload_table():
+        analyze_chords._table_cache.clear()
+        analyze_chords.load_chord_table(csv_file)
+
+    return [
+        ('get_note_at_interval', len(roots) * 24, None, note_at_interval),
+        ('generate_chord_notes', len(roots) * len(qualities[:50]), None, chord_notes),
+        ('generate_all_chords', 1, None, generator.generate_all_chords),
+        ('find_chord', len(names), lambda: generator.find_chord(names[0]), find_chords),
+        ('find_chord_cold', 1, None, cold_find_chord),
+        ('save_chords_to_csv', 1, None, save_csv),
+        ('load_chord_table', 1, save_csv, reload_table),
+        ('find_chords_by_criteria', len(CRITERIA_QUERIES), save_csv, criteria_queries),
+        ('analyze_chord_data', 1, save_csv, analyze_data),
+    ]
+
+
+def measure(setup, func, ops, min_time=0.2, repeat=3):
+    """Return (ops/sec, peak bytes) for a benchmark case."""
+    if setup:
+        setup()
+    func()  # warm up caches and imports
+
+    # Run enough calls to fill min_time, best of `repeat` rounds
+    start = time.perf_counter()
+    func()
+    once = max(time.perf_counter() - start, 1e-9)
+    calls = max(1, int(min_time / once))
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, (time.perf_counter() - start) / calls)
+
+    # Peak memory of a single traced call
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return ops / best, peak
+
+
+def run(scales):
+    """Run every case at every scale and return the results dict."""
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in scales:
+            generator = ChordGenerator()
+            add_synthetic_qualities(generator, SCALES[scale])
+            csv_file = os.path.join(tmp, f'{scale}.csv')
+            chord_count = len(generator.generate_all_chords())
+
+            print(f"\n{scale.upper()} ({chord_count:,} chords)")
+            print("-" * 50)
+            for name, ops, setup, func in build_cases(generator, csv_file):
+                ops_per_sec, peak = measure(setup, func, ops)
+                results[f'{scale}/{name}'] = {
+                    'chords': chord_count,
+                    'ops_per_sec': ops_per_sec,
+                    'peak_kb': peak / 1024
+                }
+                print(f"{name:<26} {ops_per_sec:>14,.1f} ops/s {peak / 1024:>12,.0f} KB")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Return regressions: slower or more memory than baseline by more than threshold."""
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if previous is None:
+            continue
+        if current['ops_per_sec'] < previous['ops_per_sec'] * (1 - threshold):
+            regressions.append(f"{key}: {current['ops_per_sec']:,.1f} ops/s "
+                               f"(baseline {previous['ops_per_sec']:,.1f})")
+        # Ignore noise on tiny allocations
+        if current['peak_kb'] > max(previous['peak_kb'] * (1 + threshold), previous['peak_kb'] + 64):
+            regressions.append(f"{key}: {current['peak_kb']:,.0f} KB peak "
+                               f"(baseline {previous['peak_kb']:,.0f} KB)")
+    return regressions
+
+
+def main():
+    """Run the suite and compare against (or record) the baseline."""
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--scales', default=DEFAULT_SCALES,
+                        help=f"comma-separated scales from {', '.join(SCALES)} (default: {DEFAULT_SCALES})")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="baseline JSON file")
+    parser.add_argument('--save-baseline', action='store_true', help="write this run as the new baseline")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="allowed fractional slowdown / memory growth (default: 0.25)")
+    parser.add_argument('--output', help="also write this run's results to a JSON file")
+    args = parser.parse_args()
+
+    scales = [scale.strip() for scale in args.scales.split(',') if scale.strip()]
+    unknown = [scale for scale in scales if scale not in SCALES]
+    if unknown:
+        parser.error(f"unknown scale(s): {', '.join(unknown)}")
+
+    print("CHORDSENSE BENCHMARK SUITE")
+    print("=" * 50)
+    results = run(scales)
+    report = {
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+
+    if args.save_baseline or not os.path.exists(args.baseline):
+        # Merge so that baselines for other scales are kept
+        baseline = {'results': {}}
+        if os.path.exists(args.baseline):
+            with open(args.baseline) as f:
+                baseline = json.load(f)
+        baseline.update({key: value for key, value in report.items() if key != 'results'})
+        baseline['results'].update(results)
+        with open(args.baseline, 'w') as f:
+            json.dump(baseline, f, indent=2)
+        print(f"\nBaseline saved to {args.baseline}")
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline['results'], args.threshold)
+
+    if regressions:
+        print(f"\nREGRESSIONS (threshold {args.threshold:.0%}):")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+
+    print(f"\nNo regressions against {args.baseline} (threshold {args.threshold:.0%})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
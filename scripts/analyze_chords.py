@@ -5,57 +5,159 @@ with the new chord_type and chord_extension columns.
 """
 
 import csv
+import os
 from collections import defaultdict
 
+from chord_binary import BinaryChordCatalog
+from chord_generator import ChordGenerator
+
+
+def _bitset(row_numbers, size):
+    """Int bitset with the given row numbers set."""
+    bits = bytearray((size + 7) // 8)
+    for row in row_numbers:
+        bits[row >> 3] |= 1 << (row & 7)
+    return int.from_bytes(bits, 'little')
+
+
+class ChordTable:
+    """In-memory chord table with inverted indexes for fast criteria queries.
+    
+    Each index maps a value (chord type, chord extension or single note) to a
+    bitset of row numbers stored in a Python int, so combined criteria are
+    answered by AND-ing a few ints instead of scanning every row. Bitsets
+    are filled as bytearrays and converted once, so building stays linear in
+    the number of rows.
+    """
+    
+    def __init__(self, rows):
+        # rows: dicts with chord_name, notes, chord_type and chord_extension
+        self.records = []
+        row_numbers = {'type': defaultdict(list), 'extension': defaultdict(list), 'note': defaultdict(list)}
+        
+        for row_number, row in enumerate(rows):
+            self.records.append({
+                'name': row['chord_name'],
+                'notes': row['notes'],
+                'type': row['chord_type'],
+                'extension': row['chord_extension']
+            })
+            row_numbers['type'][row['chord_type']].append(row_number)
+            row_numbers['extension'][row['chord_extension']].append(row_number)
+            for note in row['notes'].split(', '):
+                row_numbers['note'][note].append(row_number)
+        
+        size = len(self.records)
+        self.by_type = {value: _bitset(numbers, size) for value, numbers in row_numbers['type'].items()}
+        self.by_extension = {value: _bitset(numbers, size) for value, numbers in row_numbers['extension'].items()}
+        self.by_note = {value: _bitset(numbers, size) for value, numbers in row_numbers['note'].items()}
+        self.all_rows = (1 << size) - 1
+    
+    @classmethod
+    def from_csv(cls, csv_file="comprehensive_chords.csv"):
+        """Load the table from a chord CSV file (read once)."""
+        with open(csv_file, 'r') as f:
+            return cls(list(csv.DictReader(f)))
+    
+    @classmethod
+    def from_binary(cls, bin_file="comprehensive_chords.bin"):
+        """Load the table from a binary catalog written by save_chords_to_binary."""
+        with BinaryChordCatalog(bin_file) as catalog:
+            return cls(list(catalog))
+    
+    @classmethod
+    def from_generator(cls, generator=None):
+        """Build the table straight from a ChordGenerator, in CSV row order."""
+        generator = generator or ChordGenerator()
+        return cls({
+            'chord_name': chord['chord'],
+            'notes': ", ".join(chord['notes']),
+            'chord_type': generator.chord_types[chord['type']],
+            'chord_extension': generator.chord_extensions[chord['type']]
+        } for chord in generator.iter_chords())
+    
+    def __len__(self):
+        return len(self.records)
+    
+    def match_rows(self, chord_type=None, chord_extension=None, contains_note=None):
+        """Return the bitset of rows matching every given criterion.
+        
+        contains_note is an exact note name ("C" does not match "C#"), or a
+        list of notes that must all be present.
+        """
+        rows = self.all_rows
+        if chord_type:
+            rows &= self.by_type.get(chord_type, 0)
+        if chord_extension:
+            rows &= self.by_extension.get(chord_extension, 0)
+        if contains_note:
+            notes = [contains_note] if isinstance(contains_note, str) else contains_note
+            for note in notes:
+                rows &= self.by_note.get(note, 0)
+        return rows
+    
+    def count(self, chord_type=None, chord_extension=None, contains_note=None):
+        """Count matching chords without building result dicts."""
+        return bin(self.match_rows(chord_type, chord_extension, contains_note)).count('1')
+    
+    def find(self, chord_type=None, chord_extension=None, contains_note=None):
+        """Find chords matching specific criteria, in table order."""
+        rows = self.match_rows(chord_type, chord_extension, contains_note)
+        # Bit string with row 0 first; str.find skips the unset rows
+        bits = bin(rows)[:1:-1]
+        matching_chords = []
+        row = bits.find('1')
+        while row >= 0:
+            matching_chords.append(dict(self.records[row]))
+            row = bits.find('1', row + 1)
+        return matching_chords
+    
+    def analyze(self):
+        """Group chords by type, extension, and type + extension."""
+        chords_by_type = defaultdict(list)
+        chords_by_extension = defaultdict(list)
+        chords_by_type_and_extension = defaultdict(lambda: defaultdict(list))
+        
+        for record in self.records:
+            entry = (record['name'], record['notes'])
+            chords_by_type[record['type']].append(entry)
+            chords_by_extension[record['extension']].append(entry)
+            chords_by_type_and_extension[record['type']][record['extension']].append(entry)
+        
+        return chords_by_type, chords_by_extension, chords_by_type_and_extension
+
+
+# Tables loaded by the module-level helpers, keyed by file path
+_table_cache = {}
+
+def load_chord_table(csv_file="comprehensive_chords.csv"):
+    """Return a ChordTable for a chord file, re-reading it only when it changes.
+    
+    Files ending in .bin are read as binary catalogs, anything else as CSV.
+    """
+    path = os.path.abspath(csv_file)
+    stat = os.stat(path)
+    signature = (stat.st_mtime_ns, stat.st_size)
+    
+    cached = _table_cache.get(path)
+    if cached is None or cached[0] != signature:
+        if path.endswith('.bin'):
+            table = ChordTable.from_binary(path)
+        else:
+            table = ChordTable.from_csv(path)
+        cached = (signature, table)
+        _table_cache[path] = cached
+    return cached[1]
+
 def analyze_chord_data(csv_file="comprehensive_chords.csv"):
     """Analyze the chord data from the CSV file."""
-    
-    # Data structures for analysis
-    chords_by_type = defaultdict(list)
-    chords_by_extension = defaultdict(list)
-    chords_by_type_and_extension = defaultdict(lambda: defaultdict(list))
-    
-    # Read the CSV file
-    with open(csv_file, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            chord_name = row['chord_name']
-            notes = row['notes']
-            chord_type = row['chord_type']
-            chord_extension = row['chord_extension']
-            
-            chords_by_type[chord_type].append((chord_name, notes))
-            chords_by_extension[chord_extension].append((chord_name, notes))
-            chords_by_type_and_extension[chord_type][chord_extension].append((chord_name, notes))
-    
-    return chords_by_type, chords_by_extension, chords_by_type_and_extension
+    return load_chord_table(csv_file).analyze()
 
 def find_chords_by_criteria(csv_file="comprehensive_chords.csv", 
                            chord_type=None, chord_extension=None, 
                            contains_note=None):
     """Find chords matching specific criteria."""
-    
-    matching_chords = []
-    
-    with open(csv_file, 'r') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            # Check criteria
-            if chord_type and row['chord_type'] != chord_type:
-                continue
-            if chord_extension and row['chord_extension'] != chord_extension:
-                continue
-            if contains_note and contains_note not in row['notes']:
-                continue
-            
-            matching_chords.append({
-                'name': row['chord_name'],
-                'notes': row['notes'],
-                'type': row['chord_type'],
-                'extension': row['chord_extension']
-            })
-    
-    return matching_chords
+    return load_chord_table(csv_file).find(chord_type, chord_extension, contains_note)
 
 def main():
     """Demonstrate chord analysis capabilities."""
@@ -63,8 +165,15 @@ def main():
     print("CHORD DATA ANALYSIS")
     print("=" * 50)
     
+    # Load the chord file once and answer every query from its indexes;
+    # the binary catalog is preferred when it has been generated
+    if os.path.exists("comprehensive_chords.bin"):
+        table = load_chord_table("comprehensive_chords.bin")
+    else:
+        table = load_chord_table()
+    
     # Basic analysis
-    by_type, by_extension, by_type_ext = analyze_chord_data()
+    by_type, by_extension, by_type_ext = table.analyze()
     
     print("\n1. CHORD TYPES SUMMARY:")
     print("-" * 30)
@@ -83,7 +192,7 @@ def main():
     print("-" * 30)
     
     # Find all dominant 7th chords
-    dom7_chords = find_chords_by_criteria(
+    dom7_chords = table.find(
         chord_type="Dominant", 
         chord_extension="Dominant 7th"
     )
@@ -94,7 +203,7 @@ def main():
         print(f"  ... and {len(dom7_chords) - 5} more")
     
     # Find all chords containing C# note
-    cs_chords = find_chords_by_criteria(contains_note="C#")
+    cs_chords = table.find(contains_note="C#")
     print(f"\nChords containing C# ({len(cs_chords)}):")
     for chord in cs_chords[:5]:  # Show first 5
         print(f"  {chord['name']:<8} = {chord['notes']}")
@@ -102,7 +211,7 @@ def main():
         print(f"  ... and {len(cs_chords) - 5} more")
     
     # Find all minor 9th chords
-    min9_chords = find_chords_by_criteria(
+    min9_chords = table.find(
         chord_type="Minor", 
         chord_extension="Minor 9th"
     )
@@ -111,7 +220,7 @@ def main():
         print(f"  {chord['name']:<8} = {chord['notes']}")
     
     # Find all suspended chords
-    sus_chords = find_chords_by_criteria(chord_type="Suspended")
+    sus_chords = table.find(chord_type="Suspended")
     print(f"\nSuspended chords ({len(sus_chords)}):")
     for chord in sus_chords[:6]:  # Show first 6
         print(f"  {chord['name']:<8} = {chord['notes']}")
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Audio Chord Recognition
+Labels the chords in WAV recordings with chroma templates. WavReader
+streams PCM samples in blocks with the standard library wave module; each
+block is cut into overlapping Hann-windowed frames, transformed with one
+batched NumPy FFT and folded into 12-bin chroma vectors. Every distinct
+pitch-class set in the catalog (all roots x all qualities) becomes a
+normalized template row, so all frames of a block are scored against all
+chords with a single matrix multiply. Frame labels are smoothed with a
+fixed-lag Viterbi decoder (a sticky HMM) or a median filter on the chroma,
+and the lowest strong note in the bass range picks the chord name when a
+pitch-class set has several (C6 / Am7).
+
+Only one block of audio plus a few dozen frames of decoder state are held
+at a time, so memory stays flat however long the file is.
+"""
+
+import wave
+from collections import deque, namedtuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from chord_identifier import ChordIdentifier
+
+AudioSegment = namedtuple('AudioSegment', [
+    'start_time',    # seconds
+    'end_time',
+    'chord'          # chord name, or None for silence / no matching chord
+])
+
+SMOOTHING = ('hmm', 'median', None)
+
+MIN_FREQUENCY = 55.0       # A1
+MAX_FREQUENCY = 2000.0
+BASS_FREQUENCY = 260.0     # upper limit of the bass range (about C4)
+
+
+class WavReader:
+    """Streams a PCM WAV file as mono float32 blocks in [-1, 1]."""
+
+    def __init__(self, filename):
+        self._wav = wave.open(str(filename), 'rb')
+        self.sample_rate = self._wav.getframerate()
+        self.channels = self._wav.getnchannels()
+        self.sample_width = self._wav.getsampwidth()
+        self.frames = self._wav.getnframes()
+        if self.sample_width not in (1, 2, 3, 4):
+            self._wav.close()
+            raise ValueError(f"Unsupported sample width: {self.sample_width} bytes")
+
+    @property
+    def duration(self):
+        return self.frames / self.sample_rate
+
+    def _decode(self, data):
+        width = self.sample_width
+        if width == 1:
+            samples = np.frombuffer(data, dtype=np.uint8).astype(np.float32) - 128.0
+        elif width == 3:
+            raw = np.frombuffer(data, dtype=np.uint8).reshape(-1, 3).astype(np.int32)
+            samples = (raw[:, 0] | (raw[:, 1] << 8) | (raw[:, 2] << 16)) << 8 >> 8
+            samples = samples.astype(np.float32)
+        else:
+            samples = np.frombuffer(data, dtype='<i2' if width == 2 else '<i4').astype(np.float32)
+        samples *= 1.0 / (1 << (8 * width - 1))
+        if self.channels > 1:
+            samples = samples.reshape(-1, self.channels).mean(axis=1)
+        return samples
+
+    def blocks(self, block_size=1 << 18):
+        """Yield mono sample blocks of up to block_size samples."""
+        self._wav.rewind()
+        while True:
+            data = self._wav.readframes(block_size)
+            if not data:
+                return
+            yield self._decode(data)
+
+    def close(self):
+        self._wav.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class _MedianFilter:
+    """Centered running median over frames, fed block by block."""
+
+    def __init__(self, width):
+        self.width = width
+        self.buffer = None
+
+    def push(self, frames):
+        half = self.width // 2
+        if self.buffer is None:
+            # Repeat the first frame so the first output is centered on it
+            self.buffer = np.concatenate([np.repeat(frames[:1], half, axis=0), frames])
+        else:
+            self.buffer = np.concatenate([self.buffer, frames])
+        return self._drain()
+
+    def flush(self):
+        if self.buffer is None:
+            return np.empty((0, 13), dtype=np.float32)
+        self.buffer = np.concatenate([self.buffer, np.repeat(self.buffer[-1:], self.width // 2, axis=0)])
+        return self._drain()
+
+    def _drain(self):
+        if len(self.buffer) < self.width:
+            return np.empty((0,) + self.buffer.shape[1:], dtype=self.buffer.dtype)
+        windows = sliding_window_view(self.buffer, self.width, axis=0)
+        filtered = np.median(windows, axis=-1).astype(self.buffer.dtype)
+        self.buffer = self.buffer[len(filtered):]
+        return filtered
+
+
+class _FixedLagViterbi:
+    """Streaming Viterbi decoder for a sticky HMM.
+
+    Every state keeps itself with probability `stay` and jumps to any other
+    state with the rest split evenly, so one step only needs the best
+    previous state rather than a full transition matrix. A frame's state is
+    decided once `lag` newer frames have been seen, which bounds memory.
+    """
+
+    def __init__(self, states, stay=0.9, lag=32):
+        self.log_stay = np.log(stay)
+        self.log_switch = np.log((1 - stay) / (states - 1))
+        self.lag = lag
+        self.delta = None
+        self.backpointers = deque()
+
+    def push(self, log_likelihoods):
+        """Add frames of per-state log likelihoods; return decided states."""
+        for frame in log_likelihoods:
+            if self.delta is None:
+                self.delta = frame.copy()
+                self.backpointers.append(None)
+                continue
+            best = int(np.argmax(self.delta))
+            stay = self.delta + self.log_stay
+            switch = self.delta[best] + self.log_switch
+            keep = stay >= switch
+            self.backpointers.append(np.where(keep, np.arange(len(frame)), best))
+            self.delta = np.where(keep, stay, switch) + frame
+            # Keep the numbers small over hour-long inputs
+            self.delta -= self.delta.max()
+        if len(self.backpointers) <= self.lag:
+            return []
+        return self._decide(len(self.backpointers) - self.lag)
+
+    def flush(self):
+        return self._decide(len(self.backpointers))
+
+    def _decide(self, count):
+        """Backtrack from the current best state and emit the oldest count frames."""
+        if not count:
+            return []
+        state = int(np.argmax(self.delta))
+        path = []
+        for pointers in reversed(self.backpointers):
+            path.append(state)
+            if pointers is not None:
+                state = int(pointers[state])
+        path.reverse()
+        for _ in range(count):
+            self.backpointers.popleft()
+        if self.backpointers:
+            self.backpointers[0] = None
+        return path[:count]
+
+
+class AudioChordRecognizer:
+    def __init__(self, identifier=None, use_sharps=True, frame_size=8192, hop_size=4096,
+                 smoothing='hmm', median_frames=9, stay_probability=0.9, lag=32,
+                 no_chord_score=0.6, silence=1e-3):
+        """
+        frame_size and hop_size are in samples (8192 / 4096 suit 44.1 and
+        48 kHz). Frames whose best template similarity is below
+        no_chord_score, or whose RMS is below silence, get no chord.
+        """
+        if smoothing not in SMOOTHING:
+            raise ValueError(f"Unknown smoothing: {smoothing} (expected one of {SMOOTHING})")
+        self.identifier = identifier or ChordIdentifier()
+        self.names = self.identifier.best_name_table(use_sharps)
+        self.frame_size = frame_size
+        self.hop_size = hop_size
+        self.smoothing = smoothing
+        self.median_frames = median_frames
+        self.stay_probability = stay_probability
+        self.lag = lag
+        self.no_chord_score = no_chord_score
+        self.silence = silence
+        self.window = np.hanning(frame_size).astype(np.float32)
+
+        # One template per distinct pitch-class set, in catalog order
+        self.template_masks = list(dict.fromkeys(self.identifier.chord_masks))
+        bits = (np.array(self.template_masks)[:, None] >> np.arange(12)) & 1
+        self.templates = (bits / np.sqrt(bits.sum(axis=1, keepdims=True))).astype(np.float32)
+        self._chroma_maps = {}
+        self.frame_count = 0
+
+    def _chroma_map(self, sample_rate):
+        """FFT bin -> pitch class folding matrices (all notes, bass range) for a sample rate."""
+        if sample_rate not in self._chroma_maps:
+            frequencies = np.fft.rfftfreq(self.frame_size, 1.0 / sample_rate)
+            audible = (frequencies >= MIN_FREQUENCY) & (frequencies <= MAX_FREQUENCY)
+            pitch_classes = np.zeros(len(frequencies), dtype=np.int64)
+            midi = 69 + 12 * np.log2(frequencies[audible] / 440.0)
+            pitch_classes[audible] = np.rint(midi).astype(np.int64) % 12
+            chroma_map = np.zeros((len(frequencies), 12), dtype=np.float32)
+            chroma_map[np.flatnonzero(audible), pitch_classes[audible]] = 1.0
+            bass_bins = np.flatnonzero(audible & (frequencies <= BASS_FREQUENCY))
+            self._chroma_maps[sample_rate] = (chroma_map, bass_bins, pitch_classes[bass_bins])
+        return self._chroma_maps[sample_rate]
+
+    def features(self, blocks, sample_rate):
+        """Yield (chroma, bass pitch class, rms) arrays for the frames of each sample block."""
+        chroma_map, bass_bins, bass_classes = self._chroma_map(sample_rate)
+        size, hop = self.frame_size, self.hop_size
+        carry = np.zeros(size // 2, dtype=np.float32)   # centre the first frame on t=0
+
+        def analyse(samples):
+            frames = sliding_window_view(samples, size)[::hop]
+            rms = np.sqrt(np.mean(np.square(frames), axis=1))
+            power = np.abs(np.fft.rfft(frames * self.window, axis=1)) ** 2
+            chroma = np.sqrt(power @ chroma_map)
+            chroma /= np.linalg.norm(chroma, axis=1, keepdims=True) + 1e-12
+            # Bass: lowest bass-range bin holding half of the range's peak
+            bass_power = power[:, bass_bins]
+            strong = bass_power >= 0.5 * bass_power.max(axis=1, keepdims=True)
+            bass = bass_classes[np.argmax(strong, axis=1)] if len(bass_bins) else np.zeros(len(frames), np.int64)
+            return chroma.astype(np.float32), bass, rms
+
+        for block in blocks:
+            samples = np.concatenate([carry, block])
+            if len(samples) < size:
+                carry = samples
+                continue
+            count = (len(samples) - size) // hop + 1
+            yield analyse(samples)
+            carry = samples[count * hop:]
+        # Pad the tail so every remaining sample gets a frame centred up to it
+        remaining = len(carry) - size // 2
+        if remaining > 0:
+            count = -(-remaining // hop)
+            padding = np.zeros((count - 1) * hop + size - len(carry), dtype=np.float32)
+            yield analyse(np.concatenate([carry, padding]))
+
+    def frame_labels(self, blocks, sample_rate):
+        """Yield one chord name (or None) per hop of audio."""
+        names = self.names
+        masks = self.template_masks
+        no_chord = len(masks)
+        median = _MedianFilter(self.median_frames) if self.smoothing == 'median' else None
+        decoder = _FixedLagViterbi(no_chord + 1, self.stay_probability, self.lag) if self.smoothing == 'hmm' else None
+        # Bass notes wait here until smoothing has decided their frames
+        pending_bass = deque()
+
+        def score(features):
+            # features: 12 chroma columns plus frame RMS
+            scores = features[:, :12] @ self.templates.T
+            scores = np.concatenate([scores, np.full((len(scores), 1), self.no_chord_score, np.float32)], axis=1)
+            silent = features[:, 12] < self.silence
+            scores[silent] = 0.0
+            scores[silent, no_chord] = 1.0
+            if decoder is None:
+                return np.argmax(scores, axis=1).tolist()
+            # Sharpened similarities as HMM emission log likelihoods
+            return decoder.push(scores * 20.0)
+
+        def emit(states):
+            for state in states:
+                bass = pending_bass.popleft()
+                yield None if state == no_chord else names[masks[state] * 12 + bass]
+
+        for chroma, bass, rms in self.features(blocks, sample_rate):
+            self.frame_count += len(chroma)
+            pending_bass.extend(bass.tolist())
+            features = np.concatenate([chroma, rms[:, None].astype(np.float32)], axis=1)
+            if median is not None:
+                features = median.push(features)
+            yield from emit(score(features))
+        if median is not None:
+            yield from emit(score(median.flush()))
+        if decoder is not None:
+            yield from emit(decoder.flush())
+
+    def segments(self, blocks, sample_rate):
+        """Yield AudioSegments, merging consecutive frames with the same chord.
+
+        Silence and unrecognised frames come out as segments with chord None.
+        """
+        hop_seconds = self.hop_size / sample_rate
+        current = None
+        start = end = 0
+        for index, chord in enumerate(self.frame_labels(blocks, sample_rate)):
+            # index > 0: a chord None is a label too, not "no segment yet"
+            if index and chord != current:
+                yield AudioSegment(start * hop_seconds, index * hop_seconds, current)
+                start = index
+            current = chord
+            end = index + 1
+        if end:
+            yield AudioSegment(start * hop_seconds, end * hop_seconds, current)
+
+    def label_file(self, filename):
+        """Return the chord segments of a WAV file (silence included as chord None)."""
+        with WavReader(filename) as reader:
+            return list(self.segments(reader.blocks(), reader.sample_rate))
+
+
+def main():
+    """Label the chords of WAV files given on the command line."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Label chords in WAV recordings")
+    parser.add_argument('paths', nargs='+', help="PCM WAV files")
+    parser.add_argument('--smoothing', choices=['hmm', 'median', 'none'], default='hmm',
+                        help="frame smoothing (default: hmm)")
+    parser.add_argument('--flats', action='store_true', help="spell chords with flats")
+    args = parser.parse_args()
+
+    smoothing = None if args.smoothing == 'none' else args.smoothing
+    recognizer = AudioChordRecognizer(use_sharps=not args.flats, smoothing=smoothing)
+    for path in args.paths:
+        print(f"\n{path}")
+        for segment in recognizer.label_file(path):
+            if segment.chord:
+                print(f"  {segment.start_time:>8.2f}s  {segment.chord}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,375 @@
+#!/usr/bin/env python3
+"""
+Chord Autocomplete
+Type-ahead search over chord names for the web front end. Every chord name
+in the catalog, its common aliases (CM7, C-7, C°) and its slash chords
+(inversions such as C/E and other basses such as C/D) become entries in a
+case-folded, sorted array. A trie over that array stores, at every node,
+the entry range below it and its most popular entries, so a prefix query
+is one walk down the trie plus a small re-rank. Typos are handled with a
+bounded edit-distance search (insertions, deletions, substitutions and
+swapped neighbours) that walks the same trie and prunes any branch already
+more than max_edits away.
+
+The sorted entries serialize to a compact JSON file that the front end
+loads once (app/chord-search.tsx); the trie is rebuilt from it on load.
+
+    python chord_autocomplete.py                 # writes public/chord_index.json
+    python chord_autocomplete.py "cmj7" "f#m"    # print completions
+"""
+
+import json
+import os
+from bisect import bisect_left
+
+from chord_generator import ChordGenerator, note_pitch_class
+from chord_parser import ACCIDENTAL_MAP
+
+INDEX_VERSION = 1
+
+# Relative popularity of the built-in qualities; other qualities get DEFAULT_QUALITY_WEIGHT
+QUALITY_WEIGHTS = {
+    'major': 100, 'minor': 90, 'dominant7': 80, 'minor7': 70, 'major7': 60,
+    'sus4': 40, 'sus2': 30, 'major6': 25, 'minor6': 20, 'dominant9': 20,
+    'diminished': 20, 'half_diminished7': 18, 'diminished7': 15, 'augmented': 12,
+    'dominant7sus4': 12, 'minor9': 10, 'major9': 10, 'minormajor7': 6,
+    'dominant11': 5, 'minor11': 5, 'major11': 4, 'augmented7': 4,
+}
+DEFAULT_QUALITY_WEIGHT = 2
+
+# Roots by how often they appear in common keys
+ROOT_WEIGHTS = {
+    'C': 1.0, 'G': 1.0, 'D': 0.95, 'A': 0.95, 'E': 0.9, 'F': 0.9, 'B': 0.8,
+    'Bb': 0.85, 'Eb': 0.8, 'Ab': 0.7, 'F#': 0.7, 'C#': 0.65, 'Db': 0.6,
+    'Gb': 0.4, 'D#': 0.35, 'G#': 0.45, 'A#': 0.35,
+}
+DEFAULT_ROOT_WEIGHT = 0.3
+
+ALIAS_WEIGHT = 0.8
+INVERSION_WEIGHT = 0.25
+SLASH_WEIGHT = 0.05
+
+# Ranked entries kept per trie node (queries re-rank these for case)
+NODE_TOP = 32
+
+
+def fold(text):
+    """Matching form of a query or label: ASCII accidentals, case-folded."""
+    return text.translate(ACCIDENTAL_MAP).casefold()
+
+
+class ChordAutocomplete:
+    def __init__(self, labels, chords, scores, names, notes):
+        """Build from serialized arrays; use build() or load() instead of calling this directly.
+
+        labels/chords/scores are parallel entry arrays sorted by fold(label):
+        the text a user types, an index into names/notes, and a popularity
+        score.
+        """
+        self.labels = labels
+        self.chords = chords
+        self.scores = scores
+        self.names = names
+        self.notes = notes
+        self.keys = [fold(label) for label in labels]
+        self._build_trie()
+
+    @classmethod
+    def build(cls, generator=None, slash_chords=True, popularity=None):
+        """Index every chord name, alias and (optionally) slash chord of a generator.
+
+        popularity maps canonical chord names to weights (e.g. corpus
+        counts) and replaces the built-in quality/root heuristic for them.
+        """
+        generator = generator or ChordGenerator()
+        popularity = popularity or {}
+        names = []
+        notes = []
+        entries = []
+
+        def score(name, root, quality):
+            if name in popularity:
+                return popularity[name]
+            return (QUALITY_WEIGHTS.get(quality, DEFAULT_QUALITY_WEIGHT)
+                    * ROOT_WEIGHTS.get(root, DEFAULT_ROOT_WEIGHT))
+
+        for chord in generator.generate_all_chords():
+            root, quality = chord['root'], chord['type']
+            chord_id = len(names)
+            names.append(chord['chord'])
+            notes.append(chord['notes'])
+            weight = score(chord['chord'], root, quality)
+            entries.append((chord['chord'], chord_id, weight))
+            for alias in generator.chord_suffix_aliases.get(quality, ()):
+                entries.append((root + alias, chord_id, weight * ALIAS_WEIGHT))
+
+            if not slash_chords:
+                continue
+            # Basses spelled the way the chord itself is spelled: chord tones
+            # as in its notes (Dbm/Fb), other basses from its sharp or flat scale
+            note_list = generator.chromatic_notes_flat if 'b' in root[1:] else generator.chromatic_notes_sharp
+            tones = {note_pitch_class(note): note for note in chord['notes']}
+            root_index = note_pitch_class(root)
+            for bass_index, bass in enumerate(note_list):
+                if bass_index == root_index:
+                    continue
+                if bass_index in tones:
+                    bass = tones[bass_index]
+                    slash_notes = [bass] + [note for note in chord['notes'] if note != bass]
+                    slash_weight = weight * INVERSION_WEIGHT
+                else:
+                    slash_notes = [bass] + chord['notes']
+                    slash_weight = weight * SLASH_WEIGHT
+                name = f"{chord['chord']}/{bass}"
+                entries.append((name, len(names), popularity.get(name, slash_weight)))
+                names.append(name)
+                notes.append(slash_notes)
+
+        # Keep the best-scoring chord per label (aliases can collide)
+        best = {}
+        for label, chord_id, weight in entries:
+            if label not in best or weight > best[label][1]:
+                best[label] = (chord_id, weight)
+        labels = sorted(best, key=lambda label: (fold(label), label))
+        return cls(labels, [best[label][0] for label in labels],
+                   [round(best[label][1] * 100) for label in labels], names, notes)
+
+    def _build_trie(self):
+        """Trie nodes as [children, lo, hi, top entry ids]; children map one character to a node."""
+        keys = self.keys
+        scores = self.scores
+        root = [{}, 0, len(keys), None]
+        for entry, key in enumerate(keys):
+            node = root
+            for char in key:
+                child = node[0].get(char)
+                if child is None:
+                    child = node[0][char] = [{}, entry, entry + 1, None]
+                else:
+                    child[2] = entry + 1
+                node = child
+        self.trie = root
+
+        # Top entries per node, bottom-up: a node merges its children's
+        # lists with the entries ending exactly at it. Iterative post-order
+        # keeps long keys clear of the recursion limit.
+        stack = [(root, 0, False)]
+        while stack:
+            node, depth, done = stack.pop()
+            if not done:
+                stack.append((node, depth, True))
+                for child in node[0].values():
+                    stack.append((child, depth + 1, False))
+                continue
+            candidates = [entry for child in node[0].values() for entry in child[3]]
+            for entry in range(node[1], node[2]):
+                if len(keys[entry]) == depth:
+                    candidates.append(entry)
+                else:
+                    break
+            candidates.sort(key=lambda entry: -scores[entry])
+            node[3] = candidates[:NODE_TOP]
+
+    def _node(self, key):
+        node = self.trie
+        for char in key:
+            node = node[0].get(char)
+            if node is None:
+                return None
+        return node
+
+    def _result(self, entry, distance):
+        chord_id = self.chords[entry]
+        return {
+            'label': self.labels[entry],
+            'chord': self.names[chord_id],
+            'notes': self.notes[chord_id],
+            'distance': distance,
+        }
+
+    def prefix(self, text, limit=10):
+        """Entries starting with text (case-insensitive), exact-case matches first, then by popularity."""
+        node = self._node(fold(text))
+        if node is None:
+            return []
+        typed = text.translate(ACCIDENTAL_MAP)
+        ranked = sorted(node[3], key=lambda entry: (not self.labels[entry].startswith(typed), -self.scores[entry]))
+        results = []
+        seen = set()
+        for entry in ranked:
+            if self.chords[entry] in seen:
+                continue
+            seen.add(self.chords[entry])
+            results.append(self._result(entry, 0))
+            if len(results) == limit:
+                break
+        return results
+
+    def fuzzy(self, text, max_edits=1, limit=10):
+        """Entries with a prefix within max_edits edits of text, closest and most popular first.
+
+        Edits are insertions, deletions, substitutions and swaps of two
+        neighbouring characters. The first character (the root letter) has
+        to match, which is where almost nobody mistypes and which keeps the
+        search small.
+        """
+        key = fold(text)
+        size = len(key)
+        far = max_edits + 1
+        best = {}                   # entry -> smallest distance seen
+        start = self.trie[0].get(key[:1])
+        if start is None:
+            return []
+
+        # Depth-first walk from the root letter. Each node carries the
+        # edit-distance column between text and the path to it as bit
+        # vectors of +1/-1 steps (Myers/Hyyro), so extending the path by one
+        # character is a handful of integer operations whatever the length.
+        full = (1 << size) - 1
+        top = 1 << (size - 1)
+        matches = {}
+        for position, char in enumerate(key):
+            matches[char] = matches.get(char, 0) | (1 << position)
+
+        def step(plus, minus, score, match, previous_match, previous_diagonal):
+            swap = (((~previous_diagonal) & match) << 1) & previous_match
+            diagonal = ((((match & plus) + plus) ^ plus) | match | minus | swap) & full
+            right_plus = minus | (~(diagonal | plus) & full)
+            right_minus = plus & diagonal
+            if right_plus & top:
+                score += 1
+            elif right_minus & top:
+                score -= 1
+            right_plus = ((right_plus << 1) | 1) & full
+            right_minus = (right_minus << 1) & full
+            return (right_minus | (~(diagonal | right_plus) & full), right_plus & diagonal,
+                    score, match, diagonal)
+
+        stack = [(start, 1) + step(full, 0, size, matches.get(key[0], 0), 0, 0)]
+        while stack:
+            node, depth, plus, minus, distance, match, diagonal = stack.pop()
+            # Only rows within max_edits of the depth can still be in range
+            low = max(0, depth - max_edits)
+            high = min(size, depth + max_edits)
+            if low > high:
+                continue
+            below = (1 << low) - 1
+            value = depth + (plus & below).bit_count() - (minus & below).bit_count()
+            nearest = value
+            bit = 1 << low
+            for _ in range(low, high):
+                if plus & bit:
+                    value += 1
+                elif minus & bit:
+                    value -= 1
+                    if value < nearest:
+                        nearest = value
+                bit <<= 1
+
+            if distance <= max_edits:
+                # Everything below matches too; only go deeper if it could match more closely
+                for entry in node[3]:
+                    if best.get(entry, far) > distance:
+                        best[entry] = distance
+                if nearest >= distance:
+                    continue
+            if nearest <= max_edits:
+                for char, child in node[0].items():
+                    stack.append((child, depth + 1)
+                                 + step(plus, minus, distance, matches.get(char, 0), match, diagonal))
+
+        ranked = sorted(best, key=lambda entry: (best[entry], -self.scores[entry]))
+        results = []
+        seen = set()
+        for entry in ranked:
+            if self.chords[entry] in seen:
+                continue
+            seen.add(self.chords[entry])
+            results.append(self._result(entry, best[entry]))
+            if len(results) == limit:
+                break
+        return results
+
+    def complete(self, text, limit=10, max_edits=None):
+        """Prefix matches, or typo-tolerant matches when nothing starts with text.
+
+        max_edits defaults to 0 for one-character queries, 1 up to seven
+        characters and 2 beyond. Wider searches only run when the narrower
+        one found fewer than limit chords; fuzzy() ranks by distance first,
+        so the results are the same.
+        """
+        results = self.prefix(text, limit)
+        if results:
+            return results
+        if max_edits is None:
+            max_edits = 0 if len(text) <= 1 else 1 if len(text) <= 7 else 2
+        for edits in range(1, max_edits + 1):
+            results = self.fuzzy(text, edits, limit)
+            if len(results) == limit:
+                break
+        return results
+
+    def lookup(self, text):
+        """Exact (case-insensitive) label match, preferring the exact-case label."""
+        key = fold(text)
+        position = bisect_left(self.keys, key)
+        match = None
+        while position < len(self.keys) and self.keys[position] == key:
+            if match is None or self.labels[position] == text:
+                match = position
+            position += 1
+        return None if match is None else self._result(match, 0)
+
+    def to_json(self):
+        """Compact JSON: parallel entry arrays plus the chord table (notes joined by spaces)."""
+        return json.dumps({
+            'version': INDEX_VERSION,
+            'labels': self.labels,
+            'chords': self.chords,
+            'scores': self.scores,
+            'names': self.names,
+            'notes': [" ".join(chord_notes) for chord_notes in self.notes],
+        }, ensure_ascii=False, separators=(',', ':'))
+
+    def save(self, filename):
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(filename, 'w', encoding='utf-8') as f:
+            f.write(self.to_json())
+
+    @classmethod
+    def load(cls, filename):
+        with open(filename, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != INDEX_VERSION:
+            raise ValueError(f"Unsupported chord index version: {data.get('version')}")
+        return cls(data['labels'], data['chords'], data['scores'], data['names'],
+                   [chord_notes.split() for chord_notes in data['notes']])
+
+
+def main():
+    import argparse
+
+    default_output = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'public', 'chord_index.json')
+    parser = argparse.ArgumentParser(description="Build the chord autocomplete index or query it")
+    parser.add_argument('queries', nargs='*', help="queries to complete instead of writing the index")
+    parser.add_argument('-o', '--output', default=default_output, help="index file (default: public/chord_index.json)")
+    parser.add_argument('--no-slash', action='store_true', help="leave slash chords out of the index")
+    args = parser.parse_args()
+
+    index = ChordAutocomplete.build(slash_chords=not args.no_slash)
+    if not args.queries:
+        index.save(args.output)
+        print(f"Indexed {len(index.labels)} labels for {len(index.names)} chords -> {os.path.normpath(args.output)}")
+        return
+
+    for query in args.queries:
+        print(f"\n{query}")
+        for result in index.complete(query):
+            marker = f" (~{result['distance']})" if result['distance'] else ""
+            print(f"  {result['label']:<14} {result['chord']:<12} {' '.join(result['notes'])}{marker}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Batch Chord Generator
+Builds the whole chord catalog with NumPy instead of one note at a time.
+chord_intervals is stored as a padded integer matrix, every (root, quality)
+pitch-class matrix comes from a single broadcasted add, and spelling is a
+gather into a (letter, pitch class) name table, with the letters coming
+from each root's letter plus each quality's scale degrees.
+"""
+
+import numpy as np
+
+from chord_generator import LETTER_SPELLINGS, NOTE_LETTERS, SPELLED_ROOTS, ChordGenerator
+
+
+class ChordBatchGenerator:
+    def __init__(self, generator=None):
+        # Snapshot of the generator's tables; build a new batch generator
+        # after changing chord_intervals.
+        self.generator = generator or ChordGenerator()
+        self.qualities = list(self.generator.chord_intervals.keys())
+
+        # Padded (qualities x max chord size) interval matrix plus a validity mask
+        self.chord_sizes = np.array(
+            [len(self.generator.chord_intervals[q]) for q in self.qualities], dtype=np.int16)
+        width = int(self.chord_sizes.max()) if len(self.qualities) else 0
+        self.interval_matrix = np.zeros((len(self.qualities), width), dtype=np.int16)
+        for row, quality in enumerate(self.qualities):
+            intervals = self.generator.chord_intervals[quality]
+            self.interval_matrix[row, :len(intervals)] = intervals
+        self.valid = np.arange(width)[None, :] < self.chord_sizes[:, None]
+
+        # Letters above the root of every note (scale degree - 1), same layout
+        self.step_matrix = np.zeros((len(self.qualities), width), dtype=np.int16)
+        for row, quality in enumerate(self.qualities):
+            degrees = self.generator._degrees(quality)
+            self.step_matrix[row, :len(degrees)] = degrees
+        self.step_matrix -= self.valid
+
+        self.sharp_table = np.array(self.generator.chromatic_notes_sharp, dtype=object)
+        self.flat_table = np.array(self.generator.chromatic_notes_flat, dtype=object)
+        # (letter, pitch class) -> name, None past two accidentals
+        self.letter_table = np.array(LETTER_SPELLINGS, dtype=object)
+        # Letter index of each sharp/flat root, -1 for names outside SPELLED_ROOTS
+        self.sharp_letters = np.array([NOTE_LETTERS.index(note[0]) if note in SPELLED_ROOTS else -1
+                                       for note in self.generator.chromatic_notes_sharp], dtype=np.int16)
+        self.flat_letters = np.array([NOTE_LETTERS.index(note[0]) if note in SPELLED_ROOTS else -1
+                                      for note in self.generator.chromatic_notes_flat], dtype=np.int16)
+
+    def pitch_class_matrix(self, roots=None):
+        """Return a (roots x qualities x max size) int8 array of pitch classes.
+
+        Padding slots (past each chord's size) hold the root and should be
+        ignored using self.valid.
+        """
+        if roots is None:
+            roots = np.arange(12)
+        roots = np.asarray(roots, dtype=np.int16)
+        return ((roots[:, None, None] + self.interval_matrix[None, :, :]) % 12).astype(np.int8)
+
+    def pitch_class_masks(self, roots=None):
+        """Return a (roots x qualities) array of 12-bit pitch-class masks."""
+        pcs = self.pitch_class_matrix(roots).astype(np.int32)
+        bits = np.where(self.valid[None, :, :], np.left_shift(1, pcs), 0)
+        return np.bitwise_or.reduce(bits, axis=2)
+
+    def letter_matrix(self, roots=None, use_sharps=True):
+        """Return a (roots x qualities x max size) array of note letters (0 = C ... 6 = B).
+
+        Letters are the root's letter in the sharp or flat note table plus
+        each note's scale degree, as generate_chord_notes spells them; notes
+        of roots outside SPELLED_ROOTS get -1.
+        """
+        if roots is None:
+            roots = np.arange(12)
+        root_letters = (self.sharp_letters if use_sharps else self.flat_letters)[np.asarray(roots)]
+        letters = (root_letters[:, None, None] + self.step_matrix[None, :, :]) % 7
+        return np.where(root_letters[:, None, None] < 0, -1, letters)
+
+    def spell(self, pitch_classes, use_sharps=True, letters=None):
+        """Gather note names for an integer pitch-class array of any shape.
+
+        With letters (same shape, e.g. from letter_matrix) every note gets
+        its letter and the accidentals it needs, like generate_chord_notes;
+        notes without a letter (-1), needing more than two accidentals, or
+        spelled without letters come from the sharp or flat note table.
+        """
+        table = self.sharp_table if use_sharps else self.flat_table
+        names = table[pitch_classes]
+        if letters is None:
+            return names
+        letters = np.asarray(letters)
+        spelled = self.letter_table[letters, pitch_classes]
+        return np.where((letters >= 0) & np.not_equal(spelled, None), spelled, names)
+
+    def chord_arrays(self):
+        """Return the catalog as flat integer arrays, one row per (root, quality).
+
+        Keys: root, quality (index into self.qualities), size, mask and
+        pitch_classes (padded with -1).
+        """
+        pcs = self.pitch_class_matrix()
+        roots, qualities = np.meshgrid(np.arange(12), np.arange(len(self.qualities)), indexing='ij')
+        padded = np.where(self.valid[None, :, :], pcs, -1).astype(np.int8)
+        return {
+            'root': roots.reshape(-1).astype(np.int8),
+            'quality': qualities.reshape(-1).astype(np.int32),
+            'size': np.broadcast_to(self.chord_sizes, roots.shape).reshape(-1).copy(),
+            'mask': self.pitch_class_masks().reshape(-1).astype(np.int16),
+            'pitch_classes': padded.reshape(12 * len(self.qualities), -1)
+        }
+
+    def generate_all_chords(self):
+        """Generate the same chord dicts, in the same order, as ChordGenerator.generate_all_chords."""
+        pcs = self.pitch_class_matrix()
+        sharp_names = self.spell(pcs, True, self.letter_matrix(use_sharps=True)).tolist()
+        flat_names = self.spell(pcs, False, self.letter_matrix(use_sharps=False)).tolist()
+        sizes = self.chord_sizes.tolist()
+        suffixes = [self.generator.chord_suffixes.get(q, '') for q in self.qualities]
+        enharmonic_map = self.generator.enharmonic_map
+
+        all_chords = []
+        for root_index, root_note in enumerate(self.generator.chromatic_notes_sharp):
+            flat_root = enharmonic_map.get(root_note)
+            for quality_index, chord_type in enumerate(self.qualities):
+                size = sizes[quality_index]
+                all_chords.append({
+                    'chord': f"{root_note}{suffixes[quality_index]}",
+                    'notes': sharp_names[root_index][quality_index][:size],
+                    'type': chord_type,
+                    'root': root_note
+                })
+                if flat_root is not None:
+                    all_chords.append({
+                        'chord': f"{flat_root}{suffixes[quality_index]}",
+                        'notes': flat_names[root_index][quality_index][:size],
+                        'type': chord_type,
+                        'root': flat_root
+                    })
+
+        return all_chords
+
+
+def main():
+    """Show the batch arrays and check them against ChordGenerator."""
+    batch = ChordBatchGenerator()
+
+    print("BATCH CHORD GENERATION")
+    print("=" * 50)
+    print(f"Interval matrix: {batch.interval_matrix.shape}")
+    print(f"Pitch-class matrix: {batch.pitch_class_matrix().shape}")
+
+    arrays = batch.chord_arrays()
+    print(f"Chord rows: {len(arrays['root'])}")
+    print(f"Distinct pitch-class sets: {len(np.unique(arrays['mask']))}")
+
+    matches = batch.generate_all_chords() == batch.generator.generate_all_chords()
+    print(f"Matches ChordGenerator.generate_all_chords: {matches}")
+
+
+if __name__ == "__main__":
+    main()
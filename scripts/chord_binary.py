@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Binary Chord Catalog
+A fixed-width binary alternative to comprehensive_chords.csv. The file is a
+header, two string tables (chord names; qualities, types, extensions and
+note names) and one 32-byte record per chord. BinaryChordCatalog memory-maps
+the file, so opening it costs a header read and records are unpacked on
+demand.
+
+Layout (little endian):
+    header   magic 'CHRD', version, record size, chord count, then count,
+             offsets position and data position of the name table and of
+             the label table, records position
+    strings  per table, (string count + 1) uint32 offsets, then UTF-8 data
+    records  name id (uint32), quality id, chord type id, chord extension id
+             (uint16 label ids), root pitch class, note count (uint8),
+             pitch-class mask (uint16), up to 8 note name ids (uint16 label
+             ids, 0xFFFF = unused), 2 bytes padding
+"""
+
+import mmap
+import struct
+
+MAGIC = b'CHRD'
+VERSION = 2
+MAX_NOTES = 8
+NO_NOTE = 0xFFFF
+
+HEADER = struct.Struct('<4sHHIIIIIIII')
+RECORD = struct.Struct(f'<IHHHBBH{MAX_NOTES}H2x')
+
+
+def _encode_strings(strings, offsets_pos):
+    """Return (offsets + data bytes, data position) for one string table."""
+    encoded = [value.encode('utf-8') for value in strings]
+    offsets = [0]
+    for data in encoded:
+        offsets.append(offsets[-1] + len(data))
+    data_pos = offsets_pos + 4 * len(offsets)
+    return struct.pack(f'<{len(offsets)}I', *offsets) + b''.join(encoded), data_pos
+
+
+def write_binary_catalog(chords, filename):
+    """Write chord rows to a binary catalog file.
+
+    Each row is a dict with chord_name, quality, chord_type, chord_extension,
+    root (pitch class), notes (list of names) and mask. Chord names get
+    uint32 ids; the other strings share a uint16 table, which holds up to
+    65,535 distinct values.
+    """
+    names = []
+    labels = []
+    label_ids = {}
+
+    def label_id(value):
+        if value not in label_ids:
+            if len(labels) == NO_NOTE:
+                raise ValueError(f"More than {NO_NOTE} distinct qualities, types, extensions and notes")
+            label_ids[value] = len(labels)
+            labels.append(value)
+        return label_ids[value]
+
+    records = bytearray()
+    count = 0
+    for chord in chords:
+        notes = chord['notes']
+        if len(notes) > MAX_NOTES:
+            raise ValueError(f"Chord {chord['chord_name']} has more than {MAX_NOTES} notes")
+        note_ids = [label_id(note) for note in notes] + [NO_NOTE] * (MAX_NOTES - len(notes))
+        records += RECORD.pack(
+            len(names),
+            label_id(chord['quality']),
+            label_id(chord['chord_type']),
+            label_id(chord['chord_extension']),
+            chord['root'],
+            len(notes),
+            chord['mask'],
+            *note_ids
+        )
+        names.append(chord['chord_name'])
+        count += 1
+
+    names_pos = HEADER.size
+    name_table, name_data_pos = _encode_strings(names, names_pos)
+    labels_pos = names_pos + len(name_table)
+    label_table, label_data_pos = _encode_strings(labels, labels_pos)
+    # Keep records 8-byte aligned for zero-copy NumPy views
+    records_pos = (labels_pos + len(label_table) + 7) // 8 * 8
+
+    with open(filename, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, RECORD.size, count,
+                            len(names), names_pos, name_data_pos,
+                            len(labels), labels_pos, label_data_pos, records_pos))
+        f.write(name_table)
+        f.write(label_table)
+        f.write(b'\0' * (records_pos - labels_pos - len(label_table)))
+        f.write(records)
+
+
+class _StringTable:
+    """Zero-copy view of one string table; strings decode on first use."""
+
+    def __init__(self, buffer, count, offsets_pos, data_pos):
+        self._buffer = buffer
+        self._data_pos = data_pos
+        self._offsets = memoryview(buffer)[offsets_pos:offsets_pos + 4 * (count + 1)].cast('I')
+        self._strings = [None] * count
+
+    def __len__(self):
+        return len(self._strings)
+
+    def __getitem__(self, string_id):
+        value = self._strings[string_id]
+        if value is None:
+            start = self._data_pos + self._offsets[string_id]
+            end = self._data_pos + self._offsets[string_id + 1]
+            value = self._buffer[start:end].decode('utf-8')
+            self._strings[string_id] = value
+        return value
+
+    def release(self):
+        self._offsets.release()
+
+
+class BinaryChordCatalog:
+    # NumPy equivalent of RECORD
+    NUMPY_DTYPE = [
+        ('name', '<u4'), ('quality', '<u2'), ('chord_type', '<u2'),
+        ('chord_extension', '<u2'), ('root', 'u1'), ('size', 'u1'),
+        ('mask', '<u2'), ('notes', '<u2', (MAX_NOTES,)), ('pad', 'V2')
+    ]
+
+    def __init__(self, filename):
+        self._file = open(filename, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        (magic, version, record_size, self.count, name_count, names_pos, name_data_pos,
+         label_count, labels_pos, label_data_pos, self._records_pos) = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a binary chord catalog: {filename}")
+        if version != VERSION or record_size != RECORD.size:
+            raise ValueError(f"Unsupported chord catalog version {version} in {filename}")
+
+        self.names = _StringTable(self._map, name_count, names_pos, name_data_pos)
+        self.labels = _StringTable(self._map, label_count, labels_pos, label_data_pos)
+
+    def close(self):
+        """Release the memory map and file.
+
+        While a to_numpy() array or an unfinished iteration still refers to
+        the map, it stays open and is unmapped once those are garbage
+        collected.
+        """
+        self.names.release()
+        self.labels.release()
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.count
+
+    def record(self, index):
+        """Return the raw record tuple for a chord."""
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        return RECORD.unpack_from(self._map, self._records_pos + index * RECORD.size)
+
+    def __getitem__(self, index):
+        """Return a chord as a dict with the same columns as the CSV."""
+        name_id, _, type_id, extension_id, _, size, _, *note_ids = self.record(index)
+        labels = self.labels
+        return {
+            'chord_name': self.names[name_id],
+            'notes': ", ".join(labels[note_id] for note_id in note_ids[:size]),
+            'chord_type': labels[type_id],
+            'chord_extension': labels[extension_id]
+        }
+
+    def __iter__(self):
+        # Decode the label table once and unpack records in bulk
+        names = self.names
+        labels = [self.labels[label_id] for label_id in range(len(self.labels))]
+        start = self._records_pos
+        with memoryview(self._map)[start:start + self.count * RECORD.size] as records:
+            for name_id, _, type_id, extension_id, _, size, _, *note_ids in RECORD.iter_unpack(records):
+                yield {
+                    'chord_name': names[name_id],
+                    'notes': ", ".join([labels[note_id] for note_id in note_ids[:size]]),
+                    'chord_type': labels[type_id],
+                    'chord_extension': labels[extension_id]
+                }
+
+    def to_numpy(self):
+        """Return the records as a zero-copy NumPy structured array (requires numpy).
+
+        The array reads the memory map directly, so it stays valid after close().
+        """
+        import numpy as np
+
+        return np.frombuffer(self._map, dtype=np.dtype(self.NUMPY_DTYPE),
+                             count=self.count, offset=self._records_pos)
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Compact Chord Catalog
+Stores the chord catalog in columnar arrays instead of one dict + list per
+chord. Each chord is a (root, quality, spelling) triple of small ints plus a
+12-bit pitch-class mask; names and notes are gathered on demand from the
+catalog's interned note-name tables and per-quality interval and letter-step
+tables, spelled letter by letter like ChordGenerator.generate_chord_notes.
+"""
+
+import sys
+from array import array
+
+from chord_generator import DEFAULT_DEGREES, LETTER_SPELLINGS, NOTE_LETTERS, SPELLED_ROOTS, ChordGenerator
+
+
+class Chord:
+    """Immutable chord record backed by its catalog's shared tables."""
+
+    __slots__ = ('root', 'quality', 'flat', 'mask', 'catalog')
+
+    def __init__(self, catalog, root, quality, flat, mask):
+        object.__setattr__(self, 'catalog', catalog)
+        object.__setattr__(self, 'root', root)
+        object.__setattr__(self, 'quality', quality)
+        object.__setattr__(self, 'flat', flat)
+        object.__setattr__(self, 'mask', mask)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Chord objects are immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Chord objects are immutable")
+
+    @property
+    def root_note(self):
+        return self.catalog.note_names[self.flat][self.root]
+
+    @property
+    def name(self):
+        return self.root_note + self.catalog.suffixes[self.quality]
+
+    @property
+    def notes(self):
+        note_list = self.catalog.note_names[self.flat]
+        root = self.root
+        intervals = self.catalog.intervals[self.quality]
+        letter = self.catalog.root_letters[self.flat][root]
+        if letter is None:
+            return tuple(note_list[(root + interval) % 12] for interval in intervals)
+        steps = self.catalog.letter_steps[self.quality]
+        if steps is None:
+            steps = [DEFAULT_DEGREES[interval % 12] - 1 + 7 * (interval // 12) for interval in intervals]
+        # Past two accidentals the generator falls back to the chromatic name
+        return tuple(LETTER_SPELLINGS[(letter + step) % 7][(root + interval) % 12] or note_list[(root + interval) % 12]
+                     for interval, step in zip(intervals, steps))
+
+    @property
+    def type(self):
+        return self.catalog.qualities[self.quality]
+
+    def to_dict(self):
+        """Return the chord in ChordGenerator.generate_all_chords format."""
+        return {
+            'chord': self.name,
+            'notes': list(self.notes),
+            'type': self.type,
+            'root': self.root_note
+        }
+
+    def __eq__(self, other):
+        if not isinstance(other, Chord):
+            return NotImplemented
+        return (self.root, self.quality, self.flat, self.mask) == (other.root, other.quality, other.flat, other.mask)
+
+    def __hash__(self):
+        return hash((self.root, self.quality, self.flat, self.mask))
+
+    def __repr__(self):
+        return f"Chord({self.name!r}, notes={list(self.notes)!r})"
+
+
+class ChordCatalog:
+    def __init__(self, generator=None):
+        # Snapshot of the generator's tables; build a new catalog after
+        # changing chord_intervals.
+        self.generator = generator or ChordGenerator()
+        self.qualities = list(self.generator.chord_intervals.keys())
+
+        # Shared tables every Chord reads from: interned note names per
+        # spelling (index 0 = sharps, 1 = flats) with each root's letter
+        # index (None for names outside SPELLED_ROOTS), suffixes, intervals
+        # and, for qualities with CHORD_DEGREES entries, the letters above
+        # the root of every note (None means DEFAULT_DEGREES)
+        self.note_names = (
+            tuple(sys.intern(note) for note in self.generator.chromatic_notes_sharp),
+            tuple(sys.intern(note) for note in self.generator.chromatic_notes_flat)
+        )
+        self.root_letters = tuple(
+            tuple(NOTE_LETTERS.index(note[0]) if note in SPELLED_ROOTS else None for note in note_list)
+            for note_list in self.note_names
+        )
+        self.suffixes = [sys.intern(self.generator.chord_suffixes.get(q, '')) for q in self.qualities]
+        self.intervals = [tuple(self.generator.chord_intervals[q]) for q in self.qualities]
+        self.letter_steps = [
+            tuple(degree - 1 for degree in self.generator._degrees(q)) if q in self.generator.chord_degrees else None
+            for q in self.qualities
+        ]
+
+        # Columnar chord storage, in generate_all_chords order
+        self.roots = array('b')
+        self.quality_ids = array('H')
+        self.flats = array('b')
+        self.masks = array('H')
+
+        flat_roots = {
+            self.generator.chromatic_notes_sharp.index(note)
+            for note in self.generator.enharmonic_map if '#' in note
+        }
+        for root in range(12):
+            for quality_index, quality in enumerate(self.qualities):
+                mask = 0
+                for interval in self.generator.chord_intervals[quality]:
+                    mask |= 1 << ((root + interval) % 12)
+                for flat in ((False, True) if root in flat_roots else (False,)):
+                    self.roots.append(root)
+                    self.quality_ids.append(quality_index)
+                    self.flats.append(flat)
+                    self.masks.append(mask)
+
+        self._rows_by_name = None
+
+    def __len__(self):
+        return len(self.roots)
+
+    def __getitem__(self, row):
+        return Chord(self, self.roots[row], self.quality_ids[row], bool(self.flats[row]), self.masks[row])
+
+    def __iter__(self):
+        for row in range(len(self.roots)):
+            yield self[row]
+
+    def find(self, chord_name):
+        """Return the Chord with this exact name, or None."""
+        if self._rows_by_name is None:
+            self._rows_by_name = {}
+            for row, chord in enumerate(self):
+                self._rows_by_name.setdefault(chord.name, row)
+        row = self._rows_by_name.get(chord_name)
+        return None if row is None else self[row]
+
+    def to_dicts(self):
+        """Return the catalog in ChordGenerator.generate_all_chords format."""
+        return [chord.to_dict() for chord in self]
+
+
+def main():
+    """Show the catalog layout."""
+    catalog = ChordCatalog()
+
+    print("COMPACT CHORD CATALOG")
+    print("=" * 50)
+    print(f"Chords: {len(catalog)}")
+    print(f"Column bytes: {sum(col.itemsize * len(col) for col in (catalog.roots, catalog.quality_ids, catalog.flats, catalog.masks))}")
+
+    for name in ['C#m', 'Dbm', 'F#maj7']:
+        print(catalog.find(name))
+
+    print(f"Matches generate_all_chords: {catalog.to_dicts() == catalog.generator.generate_all_chords()}")
+
+
+if __name__ == "__main__":
+    main()
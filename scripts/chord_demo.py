@@ -4,6 +4,7 @@ Demo script showing various ways to use the ChordGenerator class.
 """
 
 from chord_generator import ChordGenerator
+from chord_progressions import ProgressionEngine
 
 def demo_enharmonic_equivalents():
     """Demonstrate enharmonic equivalent chords (sharp vs flat)."""
@@ -41,32 +42,24 @@ def demo_enharmonic_equivalents():
 def demo_chord_progressions():
     """Demonstrate common chord progressions."""
     generator = ChordGenerator()
+    engine = ProgressionEngine()
     
     print("\n\nCOMMON CHORD PROGRESSIONS")
     print("=" * 40)
     
-    # Common progressions in different keys
+    # Common progressions as roman numerals, each resolved in a key
     progressions = {
-        "vi-IV-I-V (C major)": [('Am', 'minor'), ('F', 'major'), ('C', 'major'), ('G', 'major')],
-        "I-V-vi-IV (G major)": [('G', 'major'), ('D', 'major'), ('Em', 'minor'), ('C', 'major')],
-        "ii-V-I (jazz, C major)": [('Dm', 'minor7'), ('G', 'dominant7'), ('C', 'major7')],
-        "I-VI-ii-V (doo-wop, C major)": [('C', 'major'), ('A', 'major'), ('Dm', 'minor'), ('G', 'major')]
+        "vi-IV-I-V (C major)": ('vi-IV-I-V', 'C'),
+        "I-V-vi-IV (G major)": ('I-V-vi-IV', 'G'),
+        "ii-V-I (jazz, C major)": ('ii7-V7-Imaj7', 'C'),
+        "I-VI-ii-V (doo-wop, C major)": ('I-VI-ii-V', 'C')
     }
     
-    for progression_name, chords in progressions.items():
+    for progression_name, (numerals, key) in progressions.items():
         print(f"\n{progression_name}:")
         chord_info = []
-        for root_note, chord_type in chords:
-            # Extract root note (handle cases like 'Am' where 'm' is part of chord name)
-            if root_note.endswith('m'):
-                actual_root = root_note[:-1]
-                actual_type = 'minor'
-            else:
-                actual_root = root_note
-                actual_type = chord_type
-            
-            notes = generator.generate_chord_notes(actual_root, actual_type)
-            chord_name = generator.format_chord_name(actual_root, actual_type)
+        for chord_name in engine.resolve(numerals, key):
+            notes = generator.find_chord(chord_name)['notes']
             chord_info.append(f"{chord_name} ({', '.join(notes)})")
         
         print(" → ".join(chord_info))
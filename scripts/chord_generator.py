@@ -5,210 +5,517 @@ Generates chords with both sharp and flat variations and their corresponding not
 Based on standard chord structures for various chord types.
 """
 
-import csv
+from collections.abc import Mapping
+from types import MappingProxyType
+
+# All 12 chromatic notes in both sharp and flat notations
+CHROMATIC_NOTES_SHARP = ('C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B')
+CHROMATIC_NOTES_FLAT = ('C', 'Db', 'D', 'Eb', 'E', 'F', 'Gb', 'G', 'Ab', 'A', 'Bb', 'B')
+
+# Note letters in order and their natural pitch classes
+NOTE_LETTERS = 'CDEFGAB'
+NATURAL_PITCH_CLASSES = MappingProxyType({'C': 0, 'D': 2, 'E': 4, 'F': 5, 'G': 7, 'A': 9, 'B': 11})
+
+# The 35 practical roots: every letter with up to two sharps or flats
+SPELLED_ROOTS = tuple(letter + accidental
+                      for letter in NOTE_LETTERS
+                      for accidental in ('', '#', 'b', '##', 'bb'))
+
+# LETTER_SPELLINGS[letter index][pitch class]: that pitch class written with
+# that letter, or None when it would take more than two accidentals
+LETTER_SPELLINGS = tuple(
+    tuple(
+        letter + ('#' * offset if offset > 0 else 'b' * -offset) if -2 <= offset <= 2 else None
+        for offset in ((pc - NATURAL_PITCH_CLASSES[letter] + 6) % 12 - 6 for pc in range(12))
+    )
+    for letter in NOTE_LETTERS
+)
+
+# Enharmonic equivalents mapping
+ENHARMONIC_MAP = MappingProxyType({
+    'C#': 'Db', 'Db': 'C#',
+    'D#': 'Eb', 'Eb': 'D#',
+    'F#': 'Gb', 'Gb': 'F#',
+    'G#': 'Ab', 'Ab': 'G#',
+    'A#': 'Bb', 'Bb': 'A#'
+})
+
+# Chord intervals (in semitones from root)
+CHORD_INTERVALS = MappingProxyType({
+    # Major chords
+    'major': (0, 4, 7),                    # 1 • 3 • 5
+    'major6': (0, 4, 7, 9),               # 1 • 3 • 5 • 6
+    'major7': (0, 4, 7, 11),              # 1 • 3 • 5 • 7
+    'major9': (0, 4, 7, 11, 14),          # 1 • 3 • 5 • 7 • 9
+    'major11': (0, 4, 7, 11, 14, 17),     # 1 • 3 • 5 • 7 • 9 • 11
+
+    # Suspended chords
+    'sus2': (0, 2, 7),                    # 1 • 2 • 5
+    'sus4': (0, 5, 7),                    # 1 • 4 • 5
+
+    # Dominant chords
+    'dominant7': (0, 4, 7, 10),           # 1 • 3 • 5 • b7
+    'dominant9': (0, 4, 7, 10, 14),       # 1 • 3 • 5 • b7 • 9
+    'dominant11': (0, 4, 7, 10, 14, 17),  # 1 • 3 • 5 • b7 • 9 • 11
+
+    # Minor chords
+    'minor': (0, 3, 7),                   # 1 • b3 • 5
+    'minor6': (0, 3, 7, 9),               # 1 • b3 • 5 • 6
+    'minor7': (0, 3, 7, 10),              # 1 • b3 • 5 • b7
+    'minormajor7': (0, 3, 7, 11),         # 1 • b3 • 5 • 7
+    'minor9': (0, 3, 7, 10, 14),          # 1 • b3 • 5 • b7 • 9
+    'minor11': (0, 3, 7, 10, 14, 17),     # 1 • b3 • 5 • b7 • 9 • 11
+
+    # Diminished chords
+    'diminished': (0, 3, 6),              # 1 • b3 • b5
+    'diminished7': (0, 3, 6, 9),          # 1 • b3 • b5 • bb7
+    'half_diminished7': (0, 3, 6, 10),    # 1 • b3 • b5 • b7
+
+    # Augmented chords
+    'augmented': (0, 4, 8),               # 1 • 3 • #5
+    'augmented7': (0, 4, 8, 10),          # 1 • 3 • #5 • b7
+
+    # Special chord
+    'dominant7sus4': (0, 5, 7, 10),       # 1 • 4 • 5 • b7
+})
+
+# Scale degree of each interval (3 = third, 9 = ninth ...), which fixes the
+# letter of every note: Gbdim is Gb, Bbb, Dbb rather than Gb, A, C
+CHORD_DEGREES = MappingProxyType({
+    'major': (1, 3, 5),
+    'major6': (1, 3, 5, 6),
+    'major7': (1, 3, 5, 7),
+    'major9': (1, 3, 5, 7, 9),
+    'major11': (1, 3, 5, 7, 9, 11),
+    'sus2': (1, 2, 5),
+    'sus4': (1, 4, 5),
+    'dominant7': (1, 3, 5, 7),
+    'dominant9': (1, 3, 5, 7, 9),
+    'dominant11': (1, 3, 5, 7, 9, 11),
+    'minor': (1, 3, 5),
+    'minor6': (1, 3, 5, 6),
+    'minor7': (1, 3, 5, 7),
+    'minormajor7': (1, 3, 5, 7),
+    'minor9': (1, 3, 5, 7, 9),
+    'minor11': (1, 3, 5, 7, 9, 11),
+    'diminished': (1, 3, 5),
+    'diminished7': (1, 3, 5, 7),
+    'half_diminished7': (1, 3, 5, 7),
+    'augmented': (1, 3, 5),
+    'augmented7': (1, 3, 5, 7),
+    'dominant7sus4': (1, 4, 5, 7)
+})
+
+# Degrees for qualities missing from chord_degrees, by semitones above the
+# root (b2, 2, b3, 3, 4, b5, 5, #5, 6, b7, 7), plus 7 per octave
+DEFAULT_DEGREES = (1, 2, 2, 3, 3, 4, 5, 5, 5, 6, 7, 7)
+
+# Chord suffix mapping for display
+CHORD_SUFFIXES = MappingProxyType({
+    'major': '',
+    'major6': '6',
+    'major7': 'maj7',
+    'major9': 'maj9',
+    'major11': 'maj11',
+    'sus2': 'sus2',
+    'sus4': 'sus4',
+    'dominant7': '7',
+    'dominant9': '9',
+    'dominant11': '11',
+    'minor': 'm',
+    'minor6': 'm6',
+    'minor7': 'm7',
+    'minormajor7': 'm(maj7)',
+    'minor9': 'm9',
+    'minor11': 'm11',
+    'diminished': 'dim',
+    'diminished7': 'dim7',
+    'half_diminished7': 'm7b5',
+    'augmented': 'aug',
+    'augmented7': 'aug7',
+    'dominant7sus4': '7sus4'
+})
+
+# Chord type mapping (broad categories)
+CHORD_TYPES = MappingProxyType({
+    'major': 'Major',
+    'major6': 'Major',
+    'major7': 'Major',
+    'major9': 'Major',
+    'major11': 'Major',
+    'sus2': 'Suspended',
+    'sus4': 'Suspended',
+    'dominant7': 'Dominant',
+    'dominant9': 'Dominant',
+    'dominant11': 'Dominant',
+    'minor': 'Minor',
+    'minor6': 'Minor',
+    'minor7': 'Minor',
+    'minormajor7': 'Minor',
+    'minor9': 'Minor',
+    'minor11': 'Minor',
+    'diminished': 'Diminished',
+    'diminished7': 'Diminished',
+    'half_diminished7': 'Diminished',
+    'augmented': 'Augmented',
+    'augmented7': 'Augmented',
+    'dominant7sus4': 'Dominant'
+})
+
+# Chord extension mapping (specific variations)
+CHORD_EXTENSIONS = MappingProxyType({
+    'major': 'Triad',
+    'major6': '6th',
+    'major7': 'Major 7th',
+    'major9': 'Major 9th',
+    'major11': 'Major 11th',
+    'sus2': 'Sus2',
+    'sus4': 'Sus4',
+    'dominant7': 'Dominant 7th',
+    'dominant9': 'Dominant 9th',
+    'dominant11': 'Dominant 11th',
+    'minor': 'Triad',
+    'minor6': '6th',
+    'minor7': 'Minor 7th',
+    'minormajor7': 'Minor Major 7th',
+    'minor9': 'Minor 9th',
+    'minor11': 'Minor 11th',
+    'diminished': 'Triad',
+    'diminished7': 'Diminished 7th',
+    'half_diminished7': 'Half Diminished 7th',
+    'augmented': 'Triad',
+    'augmented7': 'Augmented 7th',
+    'dominant7sus4': 'Dominant 7th Sus4'
+})
+
+# Alternative suffixes accepted by find_chord (e.g. CM7 / C△7 for Cmaj7)
+CHORD_SUFFIX_ALIASES = MappingProxyType({
+    'major': ('maj', 'M'),
+    'major6': ('maj6', 'M6'),
+    'major7': ('M7', 'Maj7', 'ma7', '△7', 'Δ7', '△', 'Δ'),
+    'major9': ('M9', 'Maj9', '△9', 'Δ9'),
+    'major11': ('M11', 'Maj11', '△11', 'Δ11'),
+    'sus4': ('sus',),
+    'dominant7': ('dom7',),
+    'dominant9': ('dom9',),
+    'dominant11': ('dom11',),
+    'minor': ('min', 'mi', '-'),
+    'minor6': ('min6', '-6'),
+    'minor7': ('min7', 'mi7', '-7'),
+    'minormajor7': ('mM7', 'm(M7)', 'mmaj7', 'minmaj7', '-maj7', '-△7', '-Δ7'),
+    'minor9': ('min9', '-9'),
+    'minor11': ('min11', '-11'),
+    'diminished': ('°', 'o'),
+    'diminished7': ('°7', 'o7'),
+    'half_diminished7': ('ø', 'ø7', 'min7b5', '-7b5'),
+    'augmented': ('+',),
+    'augmented7': ('+7', '7#5', '7+'),
+    'dominant7sus4': ('7sus',)
+})
+
+
+def note_pitch_class(note):
+    """Pitch class of a note name such as 'C', 'F#', 'Bb' or 'Ebb'."""
+    pc = NATURAL_PITCH_CLASSES[note[0]]
+    for accidental in note[1:]:
+        pc += 1 if accidental == '#' else -1
+    return pc % 12
+
+
+class _ObservedDict(dict):
+    """Dict that calls back to its owner whenever it is modified."""
+
+    def __init__(self, data, on_change):
+        super().__init__(data)
+        self._on_change = on_change
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._on_change()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self._on_change()
+
+    def clear(self):
+        super().clear()
+        self._on_change()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self._on_change()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self._on_change()
+        return item
+
+    def setdefault(self, key, default=None):
+        value = super().setdefault(key, default)
+        self._on_change()
+        return value
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self._on_change()
+
+    def __reduce__(self):
+        # Pickle restores dict items before attributes, so rebuild through
+        # __init__ instead; the callback pickles as a reference to its owner
+        return type(self), (dict(self), self._on_change)
+
 
 class ChordGenerator:
+    # The default theory tables are shared, read-only module-level tables,
+    # so creating a generator copies nothing. Assigning a table on an
+    # instance (generator.chord_intervals = {...}) gives that instance its
+    # own modifiable copy.
+    chromatic_notes_sharp = CHROMATIC_NOTES_SHARP
+    chromatic_notes_flat = CHROMATIC_NOTES_FLAT
+    enharmonic_map = ENHARMONIC_MAP
+    chord_intervals = CHORD_INTERVALS
+    chord_suffixes = CHORD_SUFFIXES
+    chord_types = CHORD_TYPES
+    chord_extensions = CHORD_EXTENSIONS
+    chord_suffix_aliases = CHORD_SUFFIX_ALIASES
+    chord_degrees = CHORD_DEGREES
+    
     def __init__(self):
-        # Define all 12 chromatic notes in both sharp and flat notations
-        self.chromatic_notes_sharp = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
-        self.chromatic_notes_flat = ['C', 'Db', 'D', 'Eb', 'E', 'F', 'Gb', 'G', 'Ab', 'A', 'Bb', 'B']
-        
-        # Enharmonic equivalents mapping
-        self.enharmonic_map = {
-            'C#': 'Db', 'Db': 'C#',
-            'D#': 'Eb', 'Eb': 'D#',
-            'F#': 'Gb', 'Gb': 'F#',
-            'G#': 'Ab', 'Ab': 'G#',
-            'A#': 'Bb', 'Bb': 'A#'
-        }
-        
-        # Chord intervals (in semitones from root)
-        self.chord_intervals = {
-            # Major chords
-            'major': [0, 4, 7],                    # 1 • 3 • 5
-            'major6': [0, 4, 7, 9],               # 1 • 3 • 5 • 6
-            'major7': [0, 4, 7, 11],              # 1 • 3 • 5 • 7
-            'major9': [0, 4, 7, 11, 14],          # 1 • 3 • 5 • 7 • 9
-            'major11': [0, 4, 7, 11, 14, 17],     # 1 • 3 • 5 • 7 • 9 • 11
-            
-            # Suspended chords
-            'sus2': [0, 2, 7],                    # 1 • 2 • 5
-            'sus4': [0, 5, 7],                    # 1 • 4 • 5
-            
-            # Dominant chords
-            'dominant7': [0, 4, 7, 10],           # 1 • 3 • 5 • b7
-            'dominant9': [0, 4, 7, 10, 14],       # 1 • 3 • 5 • b7 • 9
-            'dominant11': [0, 4, 7, 10, 14, 17],  # 1 • 3 • 5 • b7 • 9 • 11
-            
-            # Minor chords
-            'minor': [0, 3, 7],                   # 1 • b3 • 5
-            'minor6': [0, 3, 7, 9],               # 1 • b3 • 5 • 6
-            'minor7': [0, 3, 7, 10],              # 1 • b3 • 5 • b7
-            'minormajor7': [0, 3, 7, 11],         # 1 • b3 • 5 • 7
-            'minor9': [0, 3, 7, 10, 14],          # 1 • b3 • 5 • b7 • 9
-            'minor11': [0, 3, 7, 10, 14, 17],     # 1 • b3 • 5 • b7 • 9 • 11
-            
-            # Diminished chords
-            'diminished': [0, 3, 6],              # 1 • b3 • b5
-            'diminished7': [0, 3, 6, 9],          # 1 • b3 • b5 • bb7
-            'half_diminished7': [0, 3, 6, 10],    # 1 • b3 • b5 • b7
-            
-            # Augmented chords
-            'augmented': [0, 4, 8],               # 1 • 3 • #5
-            'augmented7': [0, 4, 8, 10],          # 1 • 3 • #5 • b7
-            
-            # Special chord
-            'dominant7sus4': [0, 5, 7, 10],       # 1 • 4 • 5 • b7
-        }
-        
-        # Chord suffix mapping for display
-        self.chord_suffixes = {
-            'major': '',
-            'major6': '6',
-            'major7': 'maj7',
-            'major9': 'maj9',
-            'major11': 'maj11',
-            'sus2': 'sus2',
-            'sus4': 'sus4',
-            'dominant7': '7',
-            'dominant9': '9',
-            'dominant11': '11',
-            'minor': 'm',
-            'minor6': 'm6',
-            'minor7': 'm7',
-            'minormajor7': 'm(maj7)',
-            'minor9': 'm9',
-            'minor11': 'm11',
-            'diminished': 'dim',
-            'diminished7': 'dim7',
-            'half_diminished7': 'm7b5',
-            'augmented': 'aug',
-            'augmented7': 'aug7',
-            'dominant7sus4': '7sus4'
-        }
-        
-        # Chord type mapping (broad categories)
-        self.chord_types = {
-            'major': 'Major',
-            'major6': 'Major',
-            'major7': 'Major',
-            'major9': 'Major',
-            'major11': 'Major',
-            'sus2': 'Suspended',
-            'sus4': 'Suspended',
-            'dominant7': 'Dominant',
-            'dominant9': 'Dominant',
-            'dominant11': 'Dominant',
-            'minor': 'Minor',
-            'minor6': 'Minor',
-            'minor7': 'Minor',
-            'minormajor7': 'Minor',
-            'minor9': 'Minor',
-            'minor11': 'Minor',
-            'diminished': 'Diminished',
-            'diminished7': 'Diminished',
-            'half_diminished7': 'Diminished',
-            'augmented': 'Augmented',
-            'augmented7': 'Augmented',
-            'dominant7sus4': 'Dominant'
-        }
-        
-        # Chord extension mapping (specific variations)
-        self.chord_extensions = {
-            'major': 'Triad',
-            'major6': '6th',
-            'major7': 'Major 7th',
-            'major9': 'Major 9th',
-            'major11': 'Major 11th',
-            'sus2': 'Sus2',
-            'sus4': 'Sus4',
-            'dominant7': 'Dominant 7th',
-            'dominant9': 'Dominant 9th',
-            'dominant11': 'Dominant 11th',
-            'minor': 'Triad',
-            'minor6': '6th',
-            'minor7': 'Minor 7th',
-            'minormajor7': 'Minor Major 7th',
-            'minor9': 'Minor 9th',
-            'minor11': 'Minor 11th',
-            'diminished': 'Triad',
-            'diminished7': 'Diminished 7th',
-            'half_diminished7': 'Half Diminished 7th',
-            'augmented': 'Triad',
-            'augmented7': 'Augmented 7th',
-            'dominant7sus4': 'Dominant 7th Sus4'
-        }
-    
-    def get_note_at_interval(self, root_note, interval, use_sharps=True):
-        """Get the note at a specific interval from the root note."""
-        note_list = self.chromatic_notes_sharp if use_sharps else self.chromatic_notes_flat
-        
-        try:
-            root_index = note_list.index(root_note)
-        except ValueError:
-            # If note not found in current list, try the other list
-            other_list = self.chromatic_notes_flat if use_sharps else self.chromatic_notes_sharp
-            try:
-                root_index = other_list.index(root_note)
-                note_list = other_list
-            except ValueError:
-                raise ValueError(f"Invalid note: {root_note}")
+        # Lazily built lookup tables (see get_note_at_interval, find_chord
+        # and iter_chords)
+        self.invalidate_caches()
+    
+    # Tables the cached lookups (note index, spelling table, find_chord
+    # index, export order) are derived from; replacing or mutating any of
+    # them drops the caches.
+    _cached_from = ('chromatic_notes_sharp', 'chromatic_notes_flat', 'enharmonic_map',
+                    'chord_intervals', 'chord_suffixes', 'chord_suffix_aliases',
+                    'chord_types', 'chord_extensions', 'chord_degrees')
+    
+    def __setattr__(self, name, value):
+        if name in self._cached_from:
+            if isinstance(value, Mapping):
+                value = _ObservedDict(value, self.invalidate_caches)
+            else:
+                value = tuple(value)
+        super().__setattr__(name, value)
+        if name in self._cached_from:
+            self.invalidate_caches()
+    
+    def invalidate_caches(self):
+        """Drop cached lookup tables so they are rebuilt on next use.
         
-        target_index = (root_index + interval) % 12
-        return note_list[target_index]
+        Called automatically when one of the chord tables is reassigned or
+        modified; call it by hand after editing an interval list in place.
+        """
+        self._note_lookup = None
+        self._spelling_roots = None
+        self._spelling_qualities = None
+        self._spelling_tables = {}
+        self._spelling_steps = {}
+        self._chord_index = None
+        self._chord_index_folded = None
+        self._export_order_cache = None
     
-    def generate_chord_notes(self, root_note, chord_type, use_sharps=True):
-        """Generate the notes for a specific chord."""
-        if chord_type not in self.chord_intervals:
-            raise ValueError(f"Unknown chord type: {chord_type}")
+    def invalidate_chord_index(self):
+        """Alias of invalidate_caches, kept for existing callers."""
+        self.invalidate_caches()
+    
+    def _build_note_lookup(self):
+        """Build root note -> (root index, note list) maps for sharp and flat output."""
+        sharps = {note: (i, self.chromatic_notes_sharp) for i, note in enumerate(self.chromatic_notes_sharp)}
+        flats = {note: (i, self.chromatic_notes_flat) for i, note in enumerate(self.chromatic_notes_flat)}
+        # A root missing from the requested spelling keeps its own spelling
+        self._note_lookup = {True: {**flats, **sharps}, False: {**sharps, **flats}}
+    
+    def get_note_at_interval(self, root_note, interval, use_sharps=True, degree=None):
+        """Get the note at a specific interval from the root note.
+        
+        With a scale degree (3 for a third, 9 for a ninth ...) the note gets
+        that degree's letter and whatever accidentals it needs, up to two
+        sharps or flats, so any of the 35 SPELLED_ROOTS can be used. Without
+        one, or when more than two accidentals would be needed, the note is
+        taken from the sharp or flat chromatic scale.
+        """
+        if degree is not None and root_note in SPELLED_ROOTS:
+            letter = NOTE_LETTERS.index(root_note[0])
+            note = LETTER_SPELLINGS[(letter + degree - 1) % 7][(note_pitch_class(root_note) + interval) % 12]
+            if note is not None:
+                return note
+        
+        if self._note_lookup is None:
+            self._build_note_lookup()
         
+        found = self._note_lookup[bool(use_sharps)].get(root_note)
+        if found is None:
+            if root_note not in SPELLED_ROOTS:
+                raise ValueError(f"Invalid note: {root_note}")
+            found = (note_pitch_class(root_note),
+                     self.chromatic_notes_sharp if use_sharps else self.chromatic_notes_flat)
+        root_index, note_list = found
+        return note_list[(root_index + interval) % 12]
+    
+    def _degrees(self, chord_type):
+        """Scale degree of each interval of a quality (see CHORD_DEGREES)."""
+        degrees = self.chord_degrees.get(chord_type)
         intervals = self.chord_intervals[chord_type]
-        notes = []
+        if degrees is not None and len(degrees) == len(intervals):
+            return degrees
+        return tuple(DEFAULT_DEGREES[interval % 12] + 7 * (interval // 12) for interval in intervals)
+    
+    def _build_spelling_table(self, use_sharps):
+        """Create the flat (root, quality) spelling table for one use_sharps setting.
         
-        for interval in intervals:
-            note = self.get_note_at_interval(root_note, interval, use_sharps)
-            notes.append(note)
+        Entry root index * len(chord_intervals) + quality index holds the
+        chord's notes, for the 35 SPELLED_ROOTS plus any other name in the
+        chromatic tables (indices from _spelling_roots and
+        _spelling_qualities). Entries are spelled on first use, so a build
+        that only touches a few qualities only pays for those.
+        """
+        if self._spelling_roots is None:
+            roots = dict.fromkeys(SPELLED_ROOTS)
+            roots.update(dict.fromkeys(self.chromatic_notes_sharp))
+            roots.update(dict.fromkeys(self.chromatic_notes_flat))
+            self._spelling_roots = {root: i for i, root in enumerate(roots)}
+            self._spelling_qualities = {quality: i for i, quality in enumerate(self.chord_intervals)}
+        table = [None] * (len(self._spelling_roots) * len(self._spelling_qualities))
+        self._spelling_tables[use_sharps] = table
+        return table
+    
+    def _spell_chord(self, root_note, chord_type, use_sharps):
+        """Spell one chord note by note (the table entry generate_chord_notes caches)."""
+        steps = self._spelling_steps.get(chord_type)
+        if steps is None:
+            # (interval, letters above the root) per note, shared by all roots
+            steps = self._spelling_steps[chord_type] = tuple(
+                (interval, degree - 1)
+                for interval, degree in zip(self.chord_intervals[chord_type], self._degrees(chord_type))
+            )
+        if root_note not in SPELLED_ROOTS:
+            # Names from custom chromatic tables are spelled chromatically
+            return tuple(self.get_note_at_interval(root_note, interval, use_sharps) for interval, _ in steps)
+        letter = NOTE_LETTERS.index(root_note[0])
+        root_pc = note_pitch_class(root_note)
+        return tuple(
+            LETTER_SPELLINGS[(letter + step) % 7][(root_pc + interval) % 12]
+            or self.get_note_at_interval(root_note, interval, use_sharps)
+            for interval, step in steps
+        )
+    
+    def generate_chord_notes(self, root_note, chord_type, use_sharps=True):
+        """Generate the notes for a specific chord.
+        
+        Notes are spelled by scale degree, so every third is a third letter
+        up (Gbdim is Gb, Bbb, Dbb); use_sharps only matters for notes that
+        would need more than two accidentals. Each chord is spelled once and
+        then served from a flat lookup table.
+        """
+        use_sharps = bool(use_sharps)
+        table = self._spelling_tables.get(use_sharps)
+        if table is None:
+            table = self._build_spelling_table(use_sharps)
         
-        return notes
+        quality_index = self._spelling_qualities.get(chord_type)
+        if quality_index is None:
+            raise ValueError(f"Unknown chord type: {chord_type}")
+        root_index = self._spelling_roots.get(root_note)
+        if root_index is None:
+            raise ValueError(f"Invalid note: {root_note}")
+        index = root_index * len(self._spelling_qualities) + quality_index
+        notes = table[index]
+        if notes is None:
+            notes = table[index] = self._spell_chord(root_note, chord_type, use_sharps)
+        return list(notes)
     
     def format_chord_name(self, root_note, chord_type):
         """Format the chord name with proper suffix."""
         suffix = self.chord_suffixes.get(chord_type, '')
         return f"{root_note}{suffix}"
     
+    def _root_spellings(self, root_note):
+        """Return the (root note, use_sharps) spellings of a root: sharp, then flat if any."""
+        spellings = [(root_note, True)]
+        # Add the flat spelling if the root note has an enharmonic equivalent
+        if root_note in self.enharmonic_map:
+            spellings.append((self.enharmonic_map[root_note], False))
+        return spellings
+    
+    def _export_order(self):
+        """Return (chord name, root note, quality, use_sharps) keys in export order.
+        
+        Chords are ordered by chord type, then chord extension, then quality
+        and chord name, so each quality's chords are contiguous.
+        Only the small per-group key lists are sorted, once; notes are
+        generated later, one chord at a time, by iter_chords.
+        """
+        if self._export_order_cache is not None:
+            return self._export_order_cache
+        
+        groups = {}
+        for chord_type in self.chord_intervals:
+            group = (self.chord_types[chord_type], self.chord_extensions[chord_type])
+            groups.setdefault(group, []).append(chord_type)
+        
+        order = []
+        for group in sorted(groups):
+            order.extend(self._section_order(groups[group]))
+        self._export_order_cache = order
+        return order
+    
+    def _section_order(self, qualities):
+        """Export-order keys for the qualities of one (chord type, extension) section.
+        
+        Keys are sorted by quality, then chord name, so qualities sharing a
+        section (major and a custom add9) don't interleave.
+        """
+        return sorted(
+            ((self.format_chord_name(root_note, chord_type), root_note, chord_type, use_sharps)
+             for chord_type in qualities
+             for sharp_root in self.chromatic_notes_sharp
+             for root_note, use_sharps in self._root_spellings(sharp_root)),
+            key=lambda key: (key[2], key)
+        )
+    
+    def iter_chords(self, root=None, quality=None, chord_type=None, sort=True):
+        """Yield chords one at a time instead of building the whole list.
+        
+        root, quality and chord_type each take a value or a collection of
+        values: root note spellings ('C#', 'Db'), chord_intervals keys
+        ('minor7') and broad chord types ('Minor'). With sort=True chords come
+        in export order (type, extension, quality, name); with sort=False
+        they come in generation order (root, then quality).
+        """
+        roots = {root} if isinstance(root, str) else root
+        qualities = {quality} if isinstance(quality, str) else quality
+        types = {chord_type} if isinstance(chord_type, str) else chord_type
+        
+        if sort:
+            keys = ((root_note, quality_key, use_sharps)
+                    for _, root_note, quality_key, use_sharps in self._export_order())
+        else:
+            keys = ((root_note, quality_key, use_sharps)
+                    for sharp_root in self.chromatic_notes_sharp
+                    for quality_key in self.chord_intervals
+                    for root_note, use_sharps in self._root_spellings(sharp_root))
+        
+        for root_note, quality_key, use_sharps in keys:
+            if roots is not None and root_note not in roots:
+                continue
+            if qualities is not None and quality_key not in qualities:
+                continue
+            if types is not None and self.chord_types.get(quality_key) not in types:
+                continue
+            yield {
+                'chord': self.format_chord_name(root_note, quality_key),
+                'notes': self.generate_chord_notes(root_note, quality_key, use_sharps),
+                'type': quality_key,
+                'root': root_note
+            }
+    
     def generate_all_chords(self):
         """Generate all chords in both sharp and flat variations."""
-        all_chords = []
-        
-        # Generate chords for each root note
-        for root_note in self.chromatic_notes_sharp:
-            # Skip notes that don't have enharmonic equivalents (C, D, E, F, G, A, B)
-            natural_notes = ['C', 'D', 'E', 'F', 'G', 'A', 'B']
-            
-            for chord_type in self.chord_intervals.keys():
-                # Generate sharp version
-                chord_name = self.format_chord_name(root_note, chord_type)
-                notes = self.generate_chord_notes(root_note, chord_type, use_sharps=True)
-                all_chords.append({
-                    'chord': chord_name,
-                    'notes': notes,
-                    'type': chord_type,
-                    'root': root_note
-                })
-                
-                # Generate flat version if the root note has an enharmonic equivalent
-                if root_note in self.enharmonic_map:
-                    flat_root = self.enharmonic_map[root_note]
-                    flat_chord_name = self.format_chord_name(flat_root, chord_type)
-                    flat_notes = self.generate_chord_notes(flat_root, chord_type, use_sharps=False)
-                    all_chords.append({
-                        'chord': flat_chord_name,
-                        'notes': flat_notes,
-                        'type': chord_type,
-                        'root': flat_root
-                    })
-        
-        return all_chords
+        return list(self.iter_chords(sort=False))
     
     def print_chords_by_type(self, chord_type=None):
         """Print chords organized by type."""
@@ -238,80 +545,217 @@ class ChordGenerator:
                 notes_str = ", ".join(chord['notes'])
                 print(f"{chord['chord']:<12} ({notes_str})")
     
-    def save_chords_to_csv(self, filename="comprehensive_chords.csv"):
-        """Save all chords to a CSV file with chord name, notes, chord type, and chord extension."""
-        all_chords = self.generate_all_chords()
+    def export_chords(self, csv_filename=None, txt_filename=None, jsonl_filename=None, **filters):
+        """Write any combination of CSV, text and JSON Lines files in one pass.
+        
+        All files are fed from a single iter_chords() stream in export order
+        (chord type, chord extension, quality, chord name), so memory stays
+        bounded however large the catalog is. Keyword filters are passed to
+        iter_chords.
+        """
+        # Imported here to keep module import cheap for lookup-only callers
+        from contextlib import ExitStack
         
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
+        with ExitStack() as stack:
+            csv_file = txt_file = jsonl_file = None
+            if csv_filename:
+                csv_file = stack.enter_context(open(csv_filename, 'w', newline='', encoding='utf-8'))
+            if txt_filename:
+                txt_file = stack.enter_context(open(txt_filename, 'w', encoding='utf-8'))
+            if jsonl_filename:
+                jsonl_file = stack.enter_context(open(jsonl_filename, 'w', encoding='utf-8'))
+            self._write_export(self.iter_chords(**filters), csv_file, txt_file, jsonl_file)
+        
+        for filename in (csv_filename, txt_filename, jsonl_filename):
+            if filename:
+                print(f"Chords saved to {filename}")
+    
+    def _write_export(self, chords, csv_file=None, txt_file=None, jsonl_file=None, header=True):
+        """Write chords to open CSV, text and JSON Lines streams (any may be None).
+        
+        With header=False the CSV header row and the text title are left out,
+        so a section of the catalog can be rendered on its own (see
+        chord_incremental.py).
+        """
+        import csv
+        import json
+        
+        csv_writer = None
+        if csv_file:
             fieldnames = ['chord_name', 'notes', 'chord_type', 'chord_extension']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            
-            # Write header
-            writer.writeheader()
-            
-            # Sort chords by chord type, then by chord extension, then by chord name
-            sorted_chords = sorted(all_chords, key=lambda x: (
-                self.chord_types[x['type']], 
-                self.chord_extensions[x['type']], 
-                x['chord']
-            ))
+            csv_writer = csv.DictWriter(csv_file, fieldnames=fieldnames)
+            if header:
+                csv_writer.writeheader()
+        
+        if txt_file and header:
+            txt_file.write("COMPREHENSIVE CHORD LIST\n")
+            txt_file.write("=" * 50 + "\n\n")
+        
+        current_section = None
+        for chord in chords:
+            notes_str = ", ".join(chord['notes'])
+            chord_type = self.chord_types[chord['type']]
+            chord_extension = self.chord_extensions[chord['type']]
             
-            # Write chord data
-            for chord in sorted_chords:
-                notes_str = ", ".join(chord['notes'])
-                chord_type = self.chord_types[chord['type']]
-                chord_extension = self.chord_extensions[chord['type']]
-                
-                writer.writerow({
+            if csv_writer:
+                csv_writer.writerow({
                     'chord_name': chord['chord'],
                     'notes': notes_str,
                     'chord_type': chord_type,
                     'chord_extension': chord_extension
                 })
+            
+            if txt_file:
+                # Export order keeps each quality's chords together, so a
+                # header goes before the first chord of each quality
+                if chord['type'] != current_section:
+                    current_section = chord['type']
+                    txt_file.write(f"\n{current_section.upper().replace('_', ' ')} CHORDS:\n")
+                    txt_file.write("-" * 50 + "\n")
+                txt_file.write(f"{chord['chord']:<12} ({notes_str})\n")
+            
+            if jsonl_file:
+                jsonl_file.write(json.dumps({
+                    'chord_name': chord['chord'],
+                    'notes': chord['notes'],
+                    'chord_type': chord_type,
+                    'chord_extension': chord_extension,
+                    'quality': chord['type'],
+                    'root': chord['root']
+                }, ensure_ascii=False) + "\n")
+    
+    def save_chords_to_csv(self, filename="comprehensive_chords.csv"):
+        """Save all chords to a CSV file with chord name, notes, chord type, and chord extension."""
+        self.export_chords(csv_filename=filename)
+    
+    def save_chords_to_jsonl(self, filename="comprehensive_chords.jsonl"):
+        """Save all chords to a JSON Lines file, one chord object per line."""
+        self.export_chords(jsonl_filename=filename)
+    
+    def _catalog_rows(self):
+        """Yield export-order rows with root pitch class and pitch-class mask."""
+        pitch_classes = {note: note_pitch_class(note) for note in SPELLED_ROOTS}
+        pitch_classes.update({note: i for i, note in enumerate(self.chromatic_notes_sharp)})
+        pitch_classes.update({note: i for i, note in enumerate(self.chromatic_notes_flat)})
         
+        for chord in self.iter_chords():
+            mask = 0
+            for note in chord['notes']:
+                mask |= 1 << pitch_classes[note]
+            yield {
+                'chord_name': chord['chord'],
+                'quality': chord['type'],
+                'chord_type': self.chord_types[chord['type']],
+                'chord_extension': self.chord_extensions[chord['type']],
+                'root': pitch_classes[chord['root']],
+                'notes': chord['notes'],
+                'mask': mask
+            }
+    
+    def save_chords_to_binary(self, filename="comprehensive_chords.bin"):
+        """Save all chords to a fixed-width binary catalog (see chord_binary.py)."""
+        from chord_binary import write_binary_catalog
+        
+        write_binary_catalog(self._catalog_rows(), filename)
         print(f"Chords saved to {filename}")
     
-    def save_chords_to_file(self, filename="comprehensive_chords.txt"):
-        """Save all chords to a text file."""
-        all_chords = self.generate_all_chords()
+    def save_chords_to_columns(self, filename="comprehensive_chords.parquet"):
+        """Save all chords as typed columns for analytics (see chord_columnar.py).
         
-        with open(filename, 'w') as f:
-            f.write("COMPREHENSIVE CHORD LIST\n")
-            f.write("=" * 50 + "\n\n")
-            
-            # Group by chord type
-            chords_by_type = {}
-            for chord in all_chords:
-                chord_type_key = chord['type']
-                if chord_type_key not in chords_by_type:
-                    chords_by_type[chord_type_key] = []
-                chords_by_type[chord_type_key].append(chord)
-            
-            # Write organized output
-            for chord_type_key in sorted(chords_by_type.keys()):
-                f.write(f"\n{chord_type_key.upper().replace('_', ' ')} CHORDS:\n")
-                f.write("-" * 50 + "\n")
-                
-                for chord in sorted(chords_by_type[chord_type_key], key=lambda x: x['chord']):
-                    notes_str = ", ".join(chord['notes'])
-                    f.write(f"{chord['chord']:<12} ({notes_str})\n")
+        Writes Parquet when pyarrow is installed, otherwise a directory of
+        .npy column files. Requires numpy. Returns the path written.
+        """
+        from chord_columnar import write_columnar_catalog
         
-        print(f"Chords saved to {filename}")
+        path = write_columnar_catalog(self._catalog_rows(), filename)
+        print(f"Chords saved to {path}")
+        return path
+    
+    def save_chords_to_file(self, filename="comprehensive_chords.txt"):
+        """Save all chords to a text file."""
+        self.export_chords(txt_filename=filename)
     
     def save_chords(self, csv_filename="comprehensive_chords.csv", txt_filename="comprehensive_chords.txt"):
-        """Save chords to both CSV and text files."""
-        self.save_chords_to_csv(csv_filename)
-        self.save_chords_to_file(txt_filename)
+        """Save chords to both CSV and text files in a single pass."""
+        self.export_chords(csv_filename=csv_filename, txt_filename=txt_filename)
+    
+    def save_chords_incremental(self, csv_filename="comprehensive_chords.csv",
+                                txt_filename="comprehensive_chords.txt", manifest_filename=None):
+        """Like save_chords, but only regenerates qualities changed since the last run.
+    
+        Keeps a content-hash manifest next to the CSV file (see
+        chord_incremental.py). Returns the build summary.
+        """
+        from chord_incremental import build_catalog
+    
+        summary = build_catalog(self, csv_filename, txt_filename, manifest_filename)
+        if summary['rebuilt'] or summary['removed']:
+            print(f"Chords saved to {csv_filename} and {txt_filename} "
+                  f"({summary['rebuilt']} of {summary['sections']} sections regenerated)")
+        return summary
+    
+    def _build_chord_index(self):
+        """Build the exact and case-folded name -> chord lookup tables.
+        
+        Entries start out as (root, quality, use_sharps) keys, in
+        generate_all_chords order followed by the roots the catalog leaves
+        out (Cb, E#, Fbb ...); find_chord spells a chord on first lookup.
+        """
+        index = {}
+        folded = {}
+        
+        keys = [(root_note, quality, use_sharps)
+                for sharp_root in self.chromatic_notes_sharp
+                for quality in self.chord_intervals
+                for root_note, use_sharps in self._root_spellings(sharp_root)]
+        catalog_roots = {root_note for root_note, _, _ in keys}
+        keys.extend((root_note, quality, 'b' not in root_note[1:])
+                    for root_note in SPELLED_ROOTS if root_note not in catalog_roots
+                    for quality in self.chord_intervals)
+        
+        for key in keys:
+            # Canonical names win over aliases; earlier chords win over later ones
+            name = self.format_chord_name(key[0], key[1])
+            index.setdefault(name, key)
+            folded.setdefault(name.casefold(), key)
+        
+        for key in list(index.values()):
+            for alias in self.chord_suffix_aliases.get(key[1], []):
+                alias_name = f"{key[0]}{alias}"
+                index.setdefault(alias_name, key)
+                folded.setdefault(alias_name.casefold(), key)
+        
+        self._chord_index = index
+        self._chord_index_folded = folded
     
     def find_chord(self, chord_name):
-        """Find a specific chord and return its notes."""
-        all_chords = self.generate_all_chords()
+        """Find a specific chord and return its notes.
+        
+        Lookups go through a cached index, so they cost O(1) after the first
+        call. Exact (case-sensitive) names and aliases are tried first, so
+        "CM7" resolves to Cmaj7 while "cm7" still falls back to Cm7.
+        """
+        if self._chord_index is None:
+            self._build_chord_index()
         
-        for chord in all_chords:
-            if chord['chord'].lower() == chord_name.lower():
-                return chord
+        index, key = self._chord_index, chord_name
+        chord = index.get(key)
+        if chord is None:
+            index, key = self._chord_index_folded, chord_name.casefold()
+            chord = index.get(key)
+        if chord is None:
+            return None
+        if isinstance(chord, tuple):
+            root_note, quality, use_sharps = chord
+            chord = index[key] = {
+                'chord': self.format_chord_name(root_note, quality),
+                'notes': self.generate_chord_notes(root_note, quality, use_sharps),
+                'type': quality,
+                'root': root_note
+            }
         
-        return None
+        # Hand out a copy so callers cannot corrupt the cached entry
+        return {**chord, 'notes': list(chord['notes'])}
 
 
 def main():
@@ -339,6 +783,7 @@ def main():
     # Generate and save all chords to both CSV and text files
     print(f"\nGenerating comprehensive chord list...")
     generator.save_chords()  # This now saves to both CSV and TXT by default
+    generator.save_chords_to_binary()
     
     # Show total count
     all_chords = generator.generate_all_chords()
@@ -346,6 +791,7 @@ def main():
     print("Files created:")
     print("- comprehensive_chords.csv (CSV format with chord types and extensions)")
     print("- comprehensive_chords.txt (Text format for reading)")
+    print("- comprehensive_chords.bin (Binary catalog for fast loading)")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+"""
+Chord Identifier
+Names chords from a set of notes (the reverse of ChordGenerator.find_chord).
+Every chord in the catalog is encoded as a 12-bit pitch-class mask, and all
+4096 possible masks are mapped to their candidate chords up front, so a query
+is a single table lookup no matter how many chord types are defined.
+"""
+
+from chord_generator import SPELLED_ROOTS, ChordGenerator, note_pitch_class
+
+# Match kinds, in the order they are ranked
+MATCH_EXACT = 'exact'            # same pitch classes, bass is the root
+MATCH_INVERSION = 'inversion'    # same pitch classes, bass is another chord tone
+MATCH_SLASH = 'slash'            # chord plus a non-chord bass note (e.g. C/D)
+MATCH_SUBSET = 'subset'          # notes are part of the chord (e.g. no 5th)
+MATCH_SUPERSET = 'superset'      # notes contain the chord plus extra tones
+
+ALL_MASKS = 1 << 12
+
+
+def pitch_class_mask(pitch_classes):
+    """Encode an iterable of pitch classes (0-11) as a 12-bit mask."""
+    mask = 0
+    for pc in pitch_classes:
+        mask |= 1 << (pc % 12)
+    return mask
+
+
+class ChordIdentifier:
+    def __init__(self, generator=None):
+        # The identifier takes a snapshot of the generator's chord tables;
+        # build a new one after changing chord_intervals.
+        self.generator = generator or ChordGenerator()
+        self.qualities = list(self.generator.chord_intervals.keys())
+
+        sharps = self.generator.chromatic_notes_sharp
+        flats = self.generator.chromatic_notes_flat
+
+        # Note name -> pitch class for both spellings and for every letter
+        # with up to two accidentals (the generator spells Gbdim Gb, Bbb, Dbb)
+        self.note_to_pc = {note: note_pitch_class(note) for note in SPELLED_ROOTS}
+        for pc in range(12):
+            self.note_to_pc[sharps[pc]] = pc
+            self.note_to_pc[flats[pc]] = pc
+
+        # Chord id = root * len(qualities) + quality index
+        self.chord_masks = []
+        for root in range(12):
+            for quality in self.qualities:
+                intervals = self.generator.chord_intervals[quality]
+                self.chord_masks.append(pitch_class_mask(root + i for i in intervals))
+
+        # mask -> chord ids with exactly those pitch classes
+        exact = [[] for _ in range(ALL_MASKS)]
+        for chord_id, mask in enumerate(self.chord_masks):
+            exact[mask].append(chord_id)
+        self.exact_table = [tuple(sorted(ids, key=self._rank_key)) for ids in exact]
+
+        # Partial-match tables are larger, so they are built on first use
+        self._subset_table = None
+        self._superset_table = None
+        self._best_names = {}
+
+    def _rank_key(self, chord_id):
+        """Order candidates by quality (catalog order) and then root."""
+        root, quality_index = divmod(chord_id, len(self.qualities))
+        return (quality_index, root)
+
+    def _build_subset_table(self):
+        """mask -> chords that contain every note of the mask."""
+        table = [[] for _ in range(ALL_MASKS)]
+        for chord_id, mask in enumerate(self.chord_masks):
+            # Walk every non-empty submask of the chord
+            sub = mask
+            while sub:
+                if sub != mask:
+                    table[sub].append(chord_id)
+                sub = (sub - 1) & mask
+        self._subset_table = [self._rank_partial(ids, mask) for mask, ids in enumerate(table)]
+
+    def _build_superset_table(self):
+        """mask -> chords whose notes are all contained in the mask."""
+        table = [[] for _ in range(ALL_MASKS)]
+        full = ALL_MASKS - 1
+        for chord_id, mask in enumerate(self.chord_masks):
+            # Walk every non-empty set of extra notes outside the chord
+            free = full & ~mask
+            extra = free
+            while extra:
+                table[mask | extra].append(chord_id)
+                extra = (extra - 1) & free
+        self._superset_table = [self._rank_partial(ids, mask) for mask, ids in enumerate(table)]
+
+    def _rank_partial(self, chord_ids, mask):
+        """Closest chords (fewest differing notes) first."""
+        mask_size = bin(mask).count('1')
+        return tuple(sorted(chord_ids, key=lambda chord_id: (
+            abs(bin(self.chord_masks[chord_id]).count('1') - mask_size),
+            self._rank_key(chord_id)
+        )))
+
+    def parse_note(self, note):
+        """Return (pitch class, absolute pitch or None) for a note.
+
+        Accepts names ('C#', 'Db'), names with an octave ('E3') or MIDI
+        note numbers (52). Only octave-qualified notes have a pitch.
+        """
+        if isinstance(note, int):
+            return note % 12, note
+
+        name = note.strip()
+        octave_start = len(name)
+        while octave_start > 1 and (name[octave_start - 1].isdigit() or name[octave_start - 1] == '-'):
+            octave_start -= 1
+
+        pc = self.note_to_pc.get(name[:octave_start])
+        if pc is None:
+            raise ValueError(f"Invalid note: {note}")
+        if octave_start == len(name):
+            return pc, None
+        return pc, (int(name[octave_start:]) + 1) * 12 + pc
+
+    def notes_to_mask(self, notes):
+        """Return (mask, bass pitch class or None) for a collection of notes.
+
+        The bass is the lowest note when octaves or MIDI numbers are given.
+        """
+        mask = 0
+        bass = None
+        lowest = None
+        for note in notes:
+            pc, pitch = self.parse_note(note)
+            mask |= 1 << pc
+            if pitch is not None and (lowest is None or pitch < lowest):
+                lowest = pitch
+                bass = pc
+        return mask, bass
+
+    def _describe(self, chord_id, match, bass, use_sharps):
+        """Build the chord dict for a candidate, in find_chord's format."""
+        root, quality_index = divmod(chord_id, len(self.qualities))
+        quality = self.qualities[quality_index]
+        note_list = self.generator.chromatic_notes_sharp if use_sharps else self.generator.chromatic_notes_flat
+
+        root_note = note_list[root]
+        chord_name = self.generator.format_chord_name(root_note, quality)
+        notes = self.generator.generate_chord_notes(root_note, quality, use_sharps)
+        bass_note = None
+        if bass is not None and bass != root:
+            # An inversion keeps the chord's own spelling of the bass note
+            bass_note = next((note for note in notes if self.note_to_pc.get(note) == bass), note_list[bass])
+            chord_name = f"{chord_name}/{bass_note}"
+
+        return {
+            'chord': chord_name,
+            'notes': notes,
+            'type': quality,
+            'root': root_note,
+            'bass': bass_note,
+            'match': match
+        }
+
+    def identify_mask(self, mask, bass=None, partial=False, root_hint=None):
+        """Return ranked (chord id, match kind) pairs for a pitch-class mask.
+
+        Without a bass, exact matches rooted on root_hint (usually the first
+        note given) are ranked first, so A-C-E-G reads as Am7 rather than C6.
+        An explicit bass counts as one of the notes, so C-E-G over D reads as
+        the slash chord C/D and C-E-G over Bb as C7/Bb.
+        """
+        matches = []
+        seen = set()
+        if bass is not None:
+            mask |= 1 << bass
+
+        exact = self.exact_table[mask]
+        if bass is None and root_hint is not None:
+            exact = sorted(exact, key=lambda chord_id: chord_id // len(self.qualities) != root_hint)
+        seen.update(exact)
+
+        if bass is not None:
+            # Root-position readings first, then inversions
+            for chord_id in exact:
+                if chord_id // len(self.qualities) == bass:
+                    matches.append((chord_id, MATCH_EXACT))
+            for chord_id in exact:
+                if chord_id // len(self.qualities) != bass:
+                    matches.append((chord_id, MATCH_INVERSION))
+            # Slash chords: the bass is not one of the chord tones
+            for chord_id in self.exact_table[mask & ~(1 << bass)]:
+                if chord_id not in seen and not self.chord_masks[chord_id] & (1 << bass):
+                    matches.append((chord_id, MATCH_SLASH))
+        else:
+            matches.extend((chord_id, MATCH_EXACT) for chord_id in exact)
+        seen.update(chord_id for chord_id, _ in matches)
+
+        if partial:
+            if self._subset_table is None:
+                self._build_subset_table()
+            if self._superset_table is None:
+                self._build_superset_table()
+            for chord_id in self._subset_table[mask]:
+                if chord_id not in seen:
+                    matches.append((chord_id, MATCH_SUBSET))
+            for chord_id in self._superset_table[mask]:
+                if chord_id not in seen:
+                    matches.append((chord_id, MATCH_SUPERSET))
+
+        return matches
+
+    def identify(self, notes, bass=None, partial=False, use_sharps=None, limit=None):
+        """Name the chords formed by a collection of notes, best match first.
+
+        Notes may be in any order or octave. The bass defaults to the lowest
+        note when octaves are given; pass bass='E' to force a slash reading.
+        With partial=True, incomplete chords (subset) and chords with extra
+        notes (superset) are returned after the exact matches.
+        """
+        notes = list(notes)
+        if not notes:
+            return []
+        mask, lowest = self.notes_to_mask(notes)
+        if bass is None:
+            bass = lowest
+        elif not isinstance(bass, int):
+            bass = self.parse_note(bass)[0]
+        else:
+            bass %= 12
+
+        if use_sharps is None:
+            # Follow the spelling of the input
+            use_sharps = not any(isinstance(note, str) and 'b' in note[1:] for note in notes)
+
+        root_hint = self.parse_note(notes[0])[0]
+        matches = self.identify_mask(mask, bass, partial, root_hint)
+        if limit is not None:
+            matches = matches[:limit]
+        return [self._describe(chord_id, match, bass, use_sharps) for chord_id, match in matches]
+
+    def best_name_table(self, use_sharps=True):
+        """Return a table mapping mask * 12 + first-note pitch class to the best chord name.
+
+        Entries are None when no chord has exactly those pitch classes.
+        """
+        if use_sharps not in self._best_names:
+            note_list = self.generator.chromatic_notes_sharp if use_sharps else self.generator.chromatic_notes_flat
+            names = [None] * (ALL_MASKS * 12)
+            for mask, candidates in enumerate(self.exact_table):
+                if not candidates:
+                    continue
+                roots = {}
+                for chord_id in candidates:
+                    roots.setdefault(chord_id // len(self.qualities), chord_id)
+                for hint in range(12):
+                    chord_id = roots.get(hint, candidates[0])
+                    root, quality_index = divmod(chord_id, len(self.qualities))
+                    names[mask * 12 + hint] = self.generator.format_chord_name(
+                        note_list[root], self.qualities[quality_index])
+            self._best_names[use_sharps] = names
+        return self._best_names[use_sharps]
+
+    def identify_masks(self, masks, root_hints=None, use_sharps=True):
+        """Batch lookup: best exact chord name for each pitch-class mask."""
+        names = self.best_name_table(use_sharps)
+        if root_hints is None:
+            root_hints = [0] * len(masks)
+        return [names[mask * 12 + hint] for mask, hint in zip(masks, root_hints)]
+
+    def identify_batch(self, note_sets, use_sharps=True):
+        """Batch lookup: best exact chord name for each collection of notes.
+
+        Designed for millions of note sets: each one costs a mask build and
+        a single list index.
+        """
+        names = self.best_name_table(use_sharps)
+        note_to_pc = self.note_to_pc
+        results = []
+        for notes in note_sets:
+            mask = 0
+            first = None
+            for note in notes:
+                pc = note_to_pc.get(note)
+                if pc is None:
+                    pc = self.parse_note(note)[0]
+                if first is None:
+                    first = pc
+                mask |= 1 << pc
+            results.append(names[mask * 12 + first] if first is not None else None)
+        return results
+
+
+def main():
+    """Demonstrate chord identification."""
+    identifier = ChordIdentifier()
+
+    print("CHORD IDENTIFICATION")
+    print("=" * 50)
+
+    examples = [
+        ['G', 'E', 'C'],
+        ['E3', 'G3', 'C4'],
+        ['Bb', 'D', 'F', 'Ab'],
+        ['A', 'C', 'E', 'G'],
+        [50, 60, 64, 67],
+    ]
+    for notes in examples:
+        matches = identifier.identify(notes, limit=3)
+        names = ", ".join(f"{m['chord']} ({m['match']})" for m in matches) or "No match"
+        print(f"{str(notes):<24} -> {names}")
+
+    print("\nPartial matches for C, E, B (no 5th):")
+    for match in identifier.identify(['C', 'E', 'B'], partial=True, limit=3):
+        print(f"  {match['chord']:<10} {match['match']:<10} ({', '.join(match['notes'])})")
+
+    print("\nBatch lookup:")
+    note_sets = [['C', 'E', 'G'], ['D', 'F', 'A', 'C'], ['C', 'D', 'E']]
+    for notes, name in zip(note_sets, identifier.identify_batch(note_sets)):
+        print(f"  {', '.join(notes):<16} -> {name}")
+
+
+if __name__ == "__main__":
+    main()
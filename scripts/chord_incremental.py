@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Incremental Catalog Builds
+Rebuilds comprehensive_chords.csv and .txt after a change to the chord
+tables without regenerating every chord.
+
+Each quality's definition (intervals, suffix, chord type, extension) is
+hashed into a manifest stored next to the data files, together with the
+byte range each (chord type, chord extension) section occupies in both
+files. Export order sorts sections independently, so on the next run only
+sections with a new, changed or removed quality are regenerated; the rest
+are copied byte for byte from the previous files. When nothing changed
+the build only reads the manifest and stats the two files.
+
+    python chord_incremental.py                  # writes into the current directory
+    python chord_incremental.py --full           # ignore the manifest and rebuild
+"""
+
+import hashlib
+import io
+import json
+import os
+
+MANIFEST_VERSION = 1
+
+
+def default_manifest_path(csv_filename):
+    return os.path.splitext(csv_filename)[0] + '.manifest.json'
+
+
+def _digest(value):
+    return hashlib.sha256(json.dumps(value, ensure_ascii=False).encode('utf-8')).hexdigest()[:16]
+
+
+def table_hash(generator):
+    """Hash of the note tables every chord depends on (a change rebuilds everything)."""
+    return _digest([MANIFEST_VERSION, list(generator.chromatic_notes_sharp),
+                    list(generator.chromatic_notes_flat), sorted(generator.enharmonic_map.items())])
+
+
+def quality_hashes(generator):
+    """quality -> hash of everything that affects its rows in the CSV and text files."""
+    return {
+        quality: _digest([list(intervals), list(generator._degrees(quality)), generator.chord_suffixes.get(quality, ''),
+                          generator.chord_types[quality], generator.chord_extensions[quality]])
+        for quality, intervals in generator.chord_intervals.items()
+    }
+
+
+def catalog_groups(generator):
+    """(chord type, chord extension) -> sorted qualities, in export order."""
+    groups = {}
+    for quality in generator.chord_intervals:
+        group = (generator.chord_types[quality], generator.chord_extensions[quality])
+        groups.setdefault(group, []).append(quality)
+    return {group: sorted(groups[group]) for group in sorted(groups)}
+
+
+def section_chords(generator, qualities):
+    """Chords of one section in export order, without building the whole export order."""
+    for name, root_note, quality, use_sharps in generator._section_order(qualities):
+        yield {
+            'chord': name,
+            'notes': generator.generate_chord_notes(root_note, quality, use_sharps),
+            'type': quality,
+            'root': root_note
+        }
+
+
+def _file_state(filename):
+    stat = os.stat(filename)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+
+def load_manifest(manifest_filename, csv_filename, txt_filename):
+    """The previous manifest, or None if it is missing, stale or the files were touched since."""
+    try:
+        with open(manifest_filename, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') != MANIFEST_VERSION:
+            return None
+        for key, filename in (('csv', csv_filename), ('txt', txt_filename)):
+            if manifest['files'][key] != _file_state(filename):
+                return None
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return manifest
+
+
+def build_catalog(generator, csv_filename="comprehensive_chords.csv", txt_filename="comprehensive_chords.txt",
+                  manifest_filename=None, full=False):
+    """Bring the CSV and text catalogs up to date, regenerating only changed sections.
+
+    Output is byte-identical to ChordGenerator.save_chords(). Returns a
+    summary dict: 'sections' and 'rebuilt' section counts, 'qualities'
+    regenerated, 'removed' qualities and 'full' (no usable manifest).
+    """
+    manifest_filename = manifest_filename or default_manifest_path(csv_filename)
+    previous = None if full else load_manifest(manifest_filename, csv_filename, txt_filename)
+    tables = table_hash(generator)
+    if previous is not None and previous['tables'] != tables:
+        previous = None
+
+    hashes = quality_hashes(generator)
+    groups = catalog_groups(generator)
+    old_hashes = previous['qualities'] if previous else {}
+    old_sections = {(section['chord_type'], section['chord_extension']): section
+                    for section in previous['sections']} if previous else {}
+
+    def is_clean(group, qualities):
+        section = old_sections.get(group)
+        return (section is not None and section['qualities'] == qualities
+                and all(old_hashes.get(quality) == hashes[quality] for quality in qualities))
+
+    dirty = [group for group, qualities in groups.items() if not is_clean(group, qualities)]
+    summary = {
+        'sections': len(groups),
+        'rebuilt': len(dirty),
+        'qualities': sorted(quality for group in dirty for quality in groups[group]),
+        'removed': sorted(set(old_hashes) - set(hashes)),
+        'full': previous is None,
+    }
+    if previous is not None and not dirty and len(old_sections) == len(groups):
+        return summary
+
+    outputs = {'csv': csv_filename, 'txt': txt_filename}
+    sources = {}
+    sinks = {}
+    try:
+        if previous is not None:
+            for key, filename in outputs.items():
+                sources[key] = open(filename, 'rb')
+        for key, filename in outputs.items():
+            sinks[key] = open(filename + '.tmp', 'wb')
+
+        def render(chords, header=False):
+            csv_buffer = io.StringIO(newline='')
+            txt_buffer = io.StringIO()
+            generator._write_export(chords, csv_buffer, txt_buffer, header=header)
+            return {'csv': csv_buffer.getvalue().encode('utf-8'),
+                    'txt': txt_buffer.getvalue().encode('utf-8')}
+
+        for key, data in render((), header=True).items():
+            sinks[key].write(data)
+
+        sections = []
+        for group, qualities in groups.items():
+            section = {'chord_type': group[0], 'chord_extension': group[1], 'qualities': qualities}
+            if group in dirty:
+                chunks = render(section_chords(generator, qualities))
+            else:
+                chunks = {}
+                for key, source in sources.items():
+                    offset, length = old_sections[group][key]
+                    source.seek(offset)
+                    chunks[key] = source.read(length)
+            for key, data in chunks.items():
+                section[key] = [sinks[key].tell(), len(data)]
+                sinks[key].write(data)
+            sections.append(section)
+    finally:
+        for f in list(sources.values()) + list(sinks.values()):
+            f.close()
+
+    for key, filename in outputs.items():
+        os.replace(filename + '.tmp', filename)
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'tables': tables,
+        'qualities': hashes,
+        'sections': sections,
+        'files': {key: _file_state(filename) for key, filename in outputs.items()},
+    }
+    with open(manifest_filename + '.tmp', 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, ensure_ascii=False)
+    os.replace(manifest_filename + '.tmp', manifest_filename)
+    return summary
+
+
+def main():
+    import argparse
+    import time
+
+    from chord_generator import ChordGenerator
+
+    parser = argparse.ArgumentParser(description="Incrementally rebuild the CSV and text chord catalogs")
+    parser.add_argument('--csv', default="comprehensive_chords.csv", help="CSV catalog path")
+    parser.add_argument('--txt', default="comprehensive_chords.txt", help="text catalog path")
+    parser.add_argument('--manifest', help="manifest path (default: next to the CSV file)")
+    parser.add_argument('--full', action='store_true', help="ignore the manifest and rebuild everything")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    summary = build_catalog(ChordGenerator(), args.csv, args.txt, args.manifest, args.full)
+    elapsed = (time.perf_counter() - start) * 1000
+    if summary['rebuilt'] == 0 and not summary['removed']:
+        print(f"Catalog up to date ({summary['sections']} sections, {elapsed:.1f} ms)")
+    else:
+        print(f"Rebuilt {summary['rebuilt']} of {summary['sections']} sections "
+              f"({len(summary['qualities'])} qualities) in {elapsed:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Chord Metrics
+Opt-in instrumentation for ChordGenerator and analyze_chords. enable()
+swaps the public methods for timed wrappers that record call counts,
+latency histograms, rows produced and cache hits/misses; disable() puts
+the original methods back, so there is no overhead at all while it is off.
+Snapshots export as JSON or Prometheus text format, and profiled() wraps
+a single run in cProfile.
+
+    from chord_metrics import metrics, profiled
+
+    metrics.enable()
+    ...
+    print(metrics.to_prometheus())
+    metrics.disable()
+
+Functions imported with `from analyze_chords import ...` before enable()
+keep pointing at the uninstrumented originals.
+"""
+
+import cProfile
+import functools
+import io
+import json
+import os
+import pstats
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+
+import analyze_chords
+from chord_generator import ChordGenerator
+
+# Histogram bucket upper bounds in seconds (Prometheus style, plus +Inf)
+LATENCY_BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+GENERATOR_METHODS = (
+    'generate_all_chords', 'find_chord', 'generate_chord_notes', 'iter_chords',
+    'export_chords', 'save_chords', 'save_chords_to_csv', 'save_chords_to_jsonl',
+    'save_chords_to_file', 'save_chords_to_binary', 'save_chords_to_columns',
+)
+ANALYZE_FUNCTIONS = ('load_chord_table', 'analyze_chord_data', 'find_chords_by_criteria')
+
+
+class MethodStats:
+    """Counters and a latency histogram for one method."""
+
+    __slots__ = ('calls', 'errors', 'seconds', 'buckets', 'rows')
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.calls = 0
+        self.errors = 0
+        self.seconds = 0.0
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.rows = 0
+
+    def observe(self, seconds):
+        self.calls += 1
+        self.seconds += seconds
+        self.buckets[bisect_left(LATENCY_BUCKETS, seconds)] += 1
+
+
+class Instrumentation:
+    def __init__(self):
+        self.enabled = False
+        self._originals = []
+        self.methods = {}
+        self.caches = {}
+
+    def reset(self):
+        """Clear every recorded metric.
+
+        Installed wrappers hold on to their MethodStats, so those are
+        cleared in place rather than replaced.
+        """
+        for stats in self.methods.values():
+            stats.clear()
+        self.caches = {}
+
+    def _stats(self, name):
+        stats = self.methods.get(name)
+        if stats is None:
+            stats = self.methods[name] = MethodStats()
+        return stats
+
+    def _cache(self, name, hit):
+        counts = self.caches.setdefault(name, [0, 0])
+        counts[0 if hit else 1] += 1
+
+    # -- wrappers -----------------------------------------------------------
+
+    def _timed(self, name, func, rows=None, cache=None):
+        """Wrap func to record latency, rows(result) and a cache probe taken before the call."""
+        stats = self._stats(name)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            probe = cache(args, kwargs) if cache else None
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                stats.errors += 1
+                raise
+            finally:
+                stats.observe(time.perf_counter() - start)
+            if rows:
+                stats.rows += rows(result)
+            if probe:
+                probe()
+            return result
+
+        return wrapper
+
+    def _timed_generator(self, name, func):
+        """Wrap iter_chords: time spent producing rows, rows yielded, export-order cache."""
+        stats = self._stats(name)
+
+        @functools.wraps(func)
+        def wrapper(generator, *args, **kwargs):
+            sort = kwargs.get('sort', args[3] if len(args) > 3 else True)
+            cached = generator._export_order_cache is not None
+            iterator = func(generator, *args, **kwargs)
+            elapsed = 0.0
+            count = 0
+            try:
+                while True:
+                    start = time.perf_counter()
+                    try:
+                        chord = next(iterator)
+                    except StopIteration:
+                        elapsed += time.perf_counter() - start
+                        break
+                    elapsed += time.perf_counter() - start
+                    if count == 0 and sort:
+                        self._cache('export_order', cached)
+                    count += 1
+                    yield chord
+            finally:
+                stats.observe(elapsed)
+                stats.rows += count
+
+        return wrapper
+
+    def _find_chord_cache(self, args, kwargs):
+        generator = args[0]
+        hit = generator._chord_index is not None
+        return lambda: self._cache('chord_index', hit)
+
+    def _table_cache(self, args, kwargs):
+        path = os.path.abspath(args[0] if args else kwargs.get('csv_file', "comprehensive_chords.csv"))
+        before = analyze_chords._table_cache.get(path)
+        return lambda: self._cache('chord_table', before is not None and analyze_chords._table_cache.get(path) is before)
+
+    # -- switching ----------------------------------------------------------
+
+    def enable(self):
+        """Install the instrumented methods (no-op if already enabled)."""
+        if self.enabled:
+            return
+        for name in GENERATOR_METHODS:
+            if not hasattr(ChordGenerator, name):
+                continue
+            original = getattr(ChordGenerator, name)
+            if name == 'iter_chords':
+                wrapped = self._timed_generator(f'ChordGenerator.{name}', original)
+            elif name == 'find_chord':
+                wrapped = self._timed(f'ChordGenerator.{name}', original,
+                                      rows=lambda result: 1 if result else 0, cache=self._find_chord_cache)
+            elif name == 'generate_all_chords':
+                wrapped = self._timed(f'ChordGenerator.{name}', original, rows=len)
+            else:
+                wrapped = self._timed(f'ChordGenerator.{name}', original)
+            self._originals.append((ChordGenerator, name, original))
+            setattr(ChordGenerator, name, wrapped)
+
+        for name in ANALYZE_FUNCTIONS:
+            original = getattr(analyze_chords, name)
+            if name == 'load_chord_table':
+                wrapped = self._timed(f'analyze_chords.{name}', original, rows=len, cache=self._table_cache)
+            elif name == 'analyze_chord_data':
+                wrapped = self._timed(f'analyze_chords.{name}', original,
+                                      rows=lambda result: sum(len(chords) for chords in result[0].values()))
+            else:
+                wrapped = self._timed(f'analyze_chords.{name}', original, rows=len)
+            self._originals.append((analyze_chords, name, original))
+            setattr(analyze_chords, name, wrapped)
+        self.enabled = True
+
+    def disable(self):
+        """Restore the original methods; recorded metrics are kept."""
+        for owner, name, original in reversed(self._originals):
+            setattr(owner, name, original)
+        self._originals = []
+        self.enabled = False
+
+    @contextmanager
+    def recording(self):
+        """Enable instrumentation for the duration of a with block."""
+        was_enabled = self.enabled
+        self.enable()
+        try:
+            yield self
+        finally:
+            if not was_enabled:
+                self.disable()
+
+    # -- export -------------------------------------------------------------
+
+    def snapshot(self):
+        """Plain-dict copy of every metric."""
+        methods = {}
+        for name, stats in self.methods.items():
+            if not stats.calls:
+                continue
+            cumulative = 0
+            buckets = {}
+            for bound, count in zip(LATENCY_BUCKETS + (float('inf'),), stats.buckets):
+                cumulative += count
+                buckets['+Inf' if bound == float('inf') else repr(bound)] = cumulative
+            methods[name] = {
+                'calls': stats.calls,
+                'errors': stats.errors,
+                'total_seconds': stats.seconds,
+                'mean_seconds': stats.seconds / stats.calls,
+                'rows': stats.rows,
+                'latency_buckets': buckets
+            }
+        caches = {}
+        for name, (hits, misses) in self.caches.items():
+            caches[name] = {'hits': hits, 'misses': misses, 'hit_ratio': hits / (hits + misses)}
+        return {'methods': methods, 'caches': caches}
+
+    def to_json(self, indent=2):
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self, prefix='chordsense'):
+        """Snapshot in the Prometheus text exposition format."""
+        snapshot = self.snapshot()
+        lines = [
+            f"# HELP {prefix}_calls_total Calls per method.",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        for name, method in snapshot['methods'].items():
+            lines.append(f'{prefix}_calls_total{{method="{name}"}} {method["calls"]}')
+        lines += [f"# HELP {prefix}_errors_total Calls that raised.", f"# TYPE {prefix}_errors_total counter"]
+        for name, method in snapshot['methods'].items():
+            lines.append(f'{prefix}_errors_total{{method="{name}"}} {method["errors"]}')
+        lines += [f"# HELP {prefix}_rows_total Rows produced or scanned.", f"# TYPE {prefix}_rows_total counter"]
+        for name, method in snapshot['methods'].items():
+            lines.append(f'{prefix}_rows_total{{method="{name}"}} {method["rows"]}')
+        lines += [f"# HELP {prefix}_latency_seconds Call latency.", f"# TYPE {prefix}_latency_seconds histogram"]
+        for name, method in snapshot['methods'].items():
+            for bound, count in method['latency_buckets'].items():
+                lines.append(f'{prefix}_latency_seconds_bucket{{method="{name}",le="{bound}"}} {count}')
+            lines.append(f'{prefix}_latency_seconds_sum{{method="{name}"}} {method["total_seconds"]:.9f}')
+            lines.append(f'{prefix}_latency_seconds_count{{method="{name}"}} {method["calls"]}')
+        lines += [f"# HELP {prefix}_cache_requests_total Cache lookups by result.",
+                  f"# TYPE {prefix}_cache_requests_total counter"]
+        for name, cache in snapshot['caches'].items():
+            lines.append(f'{prefix}_cache_requests_total{{cache="{name}",result="hit"}} {cache["hits"]}')
+            lines.append(f'{prefix}_cache_requests_total{{cache="{name}",result="miss"}} {cache["misses"]}')
+        return "\n".join(lines) + "\n"
+
+
+# Shared instance used by the helpers below
+metrics = Instrumentation()
+
+
+@contextmanager
+def profiled(sort='cumulative', limit=25, filename=None, stream=None):
+    """Profile a with block with cProfile.
+
+    Prints the top `limit` entries sorted by `sort` to stream (default
+    stdout), and also dumps the raw stats to filename if given (for
+    snakeviz, gprof2dot, pstats).
+    """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        if filename:
+            profiler.dump_stats(filename)
+        output = io.StringIO()
+        pstats.Stats(profiler, stream=output).sort_stats(sort).print_stats(limit)
+        print(output.getvalue(), file=stream)
+
+
+def main():
+    """Record metrics for a typical session and print both export formats."""
+    import tempfile
+
+    with metrics.recording():
+        generator = ChordGenerator()
+        for name in ['C#m', 'Dbm', 'F#maj7', 'Gbmaj7', 'Cmaj7', 'Xyz']:
+            generator.find_chord(name)
+        generator.generate_chord_notes('Db', 'minor7', use_sharps=False)
+        generator.generate_all_chords()
+
+        with tempfile.TemporaryDirectory() as tmp:
+            csv_file = os.path.join(tmp, 'chords.csv')
+            generator.save_chords_to_csv(csv_file)
+            analyze_chords.analyze_chord_data(csv_file)
+            analyze_chords.find_chords_by_criteria(csv_file, chord_type='Minor')
+            analyze_chords.find_chords_by_criteria(csv_file, contains_note='C#')
+
+    print("\nJSON SNAPSHOT")
+    print("=" * 50)
+    print(metrics.to_json())
+    print("\nPROMETHEUS")
+    print("=" * 50)
+    print(metrics.to_prometheus())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+MIDI Chord Recognition
+Labels the chords in Standard MIDI Files. MidiFile memory-maps the file and
+decodes track events lazily (multi-track files are merged by time with
+heapq.merge), so a file is never loaded into Python objects. The recognizer
+collects the notes sounding in each window (one beat by default), turns
+them into a 12-bit pitch-class mask and names it with one lookup in
+ChordIdentifier's precomputed mask table. label_directory shards a folder
+of files across a process pool.
+"""
+
+import csv
+import heapq
+import mmap
+import os
+import struct
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from chord_identifier import ChordIdentifier
+
+# Event kinds; tempo sorts first so it applies before notes on the same tick
+TEMPO = 0
+NOTE_OFF = 1
+NOTE_ON = 2
+
+DRUM_CHANNEL = 9
+DEFAULT_TEMPO = 500000      # microseconds per beat (120 bpm)
+
+MIDI_EXTENSIONS = ('.mid', '.midi', '.smf')
+
+ChordSegment = namedtuple('ChordSegment', [
+    'start_tick',
+    'end_tick',
+    'start_time',    # seconds
+    'end_time',
+    'chord'          # chord name, or None when the notes don't form a catalog chord
+])
+
+CHUNK_HEADER = struct.Struct('>4sI')
+FILE_HEADER = struct.Struct('>HHh')
+
+
+def _read_varlen(data, pos):
+    """Decode a variable-length quantity; return (value, next position)."""
+    value = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        value = (value << 7) | (byte & 0x7F)
+        if not byte & 0x80:
+            return value, pos
+
+
+def _track_events(data, pos, end):
+    """Yield (tick, kind, channel, note or tempo, velocity) for one MTrk chunk."""
+    tick = 0
+    running = 0
+    while pos < end:
+        delta, pos = _read_varlen(data, pos)
+        tick += delta
+        status = data[pos]
+
+        if status == 0xFF:
+            meta = data[pos + 1]
+            length, pos = _read_varlen(data, pos + 2)
+            if meta == 0x51 and length == 3:
+                yield (tick, TEMPO, 0, int.from_bytes(data[pos:pos + 3], 'big'), 0)
+            elif meta == 0x2F:
+                return
+            pos += length
+            continue
+        if status in (0xF0, 0xF7):
+            length, pos = _read_varlen(data, pos + 1)
+            pos += length
+            continue
+
+        if status & 0x80:
+            running = status
+            pos += 1
+        elif not running:
+            raise ValueError("Data byte without a running status")
+        kind = running & 0xF0
+
+        if kind == 0x90 or kind == 0x80:
+            note = data[pos]
+            velocity = data[pos + 1]
+            pos += 2
+            if kind == 0x90 and velocity:
+                yield (tick, NOTE_ON, running & 0x0F, note, velocity)
+            else:
+                yield (tick, NOTE_OFF, running & 0x0F, note, velocity)
+        elif kind == 0xC0 or kind == 0xD0:
+            pos += 1
+        else:
+            pos += 2
+
+
+class MidiFile:
+    """A memory-mapped Standard MIDI File with lazy event decoding."""
+
+    def __init__(self, filename):
+        self.filename = filename
+        self._file = open(filename, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Not a Standard MIDI File: {filename}")
+
+        try:
+            magic, length = CHUNK_HEADER.unpack_from(self._map, 0)
+            if magic != b'MThd' or length < FILE_HEADER.size:
+                raise ValueError(f"Not a Standard MIDI File: {filename}")
+            self.format, self.track_count, self.division = FILE_HEADER.unpack_from(self._map, CHUNK_HEADER.size)
+            if self.division < 0:
+                raise ValueError(f"SMPTE time division is not supported: {filename}")
+
+            # (start, end) of every track chunk; other chunk types are skipped
+            self.tracks = []
+            pos = CHUNK_HEADER.size + length
+            while pos + CHUNK_HEADER.size <= len(self._map):
+                magic, length = CHUNK_HEADER.unpack_from(self._map, pos)
+                start = pos + CHUNK_HEADER.size
+                if magic == b'MTrk':
+                    self.tracks.append((start, min(start + length, len(self._map))))
+                pos = start + length
+        except (ValueError, struct.error):
+            self.close()
+            raise ValueError(f"Not a Standard MIDI File: {filename}")
+
+    def events(self):
+        """Yield (tick, kind, channel, note or tempo, velocity) events of all tracks in time order."""
+        yield from heapq.merge(*(_track_events(self._map, start, end) for start, end in self.tracks))
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class MidiChordRecognizer:
+    def __init__(self, identifier=None, use_sharps=True, include_drums=False):
+        # mask * 12 + bass pitch class -> best chord name (built once)
+        self.identifier = identifier or ChordIdentifier()
+        self.names = self.identifier.best_name_table(use_sharps)
+        self.include_drums = include_drums
+        self.event_count = 0
+
+    def windows(self, events, division, window_beats=1.0):
+        """Yield (start_tick, end_tick, start_time, end_time, chord name) for consecutive windows.
+
+        A window holds every note sounding at its start or struck during it;
+        the lowest of those notes picks the root when the mask is ambiguous.
+        Stretches of silence come out as one window with no chord.
+        """
+        names = self.names
+        window = max(1, round(division * window_beats))
+        sounding = {}               # MIDI note -> number of overlapping note-ons
+        window_notes = set()
+        window_start = 0
+
+        # Tempo map state for converting ticks to seconds
+        tempo = DEFAULT_TEMPO
+        tempo_tick = 0
+        tempo_time = 0.0
+
+        def seconds(tick):
+            return tempo_time + (tick - tempo_tick) * tempo / (1e6 * division)
+
+        def label(notes):
+            if not notes:
+                return None
+            mask = 0
+            for note in notes:
+                mask |= 1 << (note % 12)
+            return names[mask * 12 + min(notes) % 12]
+
+        count = 0
+        for tick, kind, channel, value, _ in events:
+            count += 1
+            # Close every window that ends at or before this event; tempo
+            # changes only apply from their own tick, so times stay exact
+            while tick >= window_start + window:
+                end = window_start + window
+                yield window_start, end, seconds(window_start), seconds(end), label(window_notes)
+                window_start = end
+                window_notes = set(sounding)
+                if not sounding and tick >= window_start + window:
+                    end = window_start + (tick - window_start) // window * window
+                    yield window_start, end, seconds(window_start), seconds(end), None
+                    window_start = end
+
+            if kind == TEMPO:
+                tempo_time = seconds(tick)
+                tempo_tick = tick
+                tempo = value
+            elif channel == DRUM_CHANNEL and not self.include_drums:
+                continue
+            elif kind == NOTE_ON:
+                sounding[value] = sounding.get(value, 0) + 1
+                window_notes.add(value)
+            elif value in sounding:
+                if sounding[value] == 1:
+                    del sounding[value]
+                else:
+                    sounding[value] -= 1
+
+        if window_notes:
+            end = window_start + window
+            yield window_start, end, seconds(window_start), seconds(end), label(window_notes)
+        self.event_count += count
+
+    def segments(self, events, division, window_beats=1.0):
+        """Yield ChordSegments, merging consecutive windows with the same chord."""
+        current = None
+        for window in self.windows(events, division, window_beats):
+            if current is not None and current.chord == window[4]:
+                current = current._replace(end_tick=window[1], end_time=window[3])
+                continue
+            if current is not None:
+                yield current
+            current = ChordSegment(*window)
+        if current is not None:
+            yield current
+
+    def label_file(self, filename, window_beats=1.0):
+        """Return the chord segments of a MIDI file (silence and unnamed windows included)."""
+        with MidiFile(filename) as midi:
+            return list(self.segments(midi.events(), midi.division, window_beats))
+
+
+# One recognizer per worker process, built by _init_worker
+_worker_recognizer = None
+
+
+def _init_worker(use_sharps, include_drums):
+    global _worker_recognizer
+    _worker_recognizer = MidiChordRecognizer(use_sharps=use_sharps, include_drums=include_drums)
+
+
+def _label_task(task):
+    """Worker: (filename, window_beats) -> (segments or None on error, events read)."""
+    filename, window_beats = task
+    before = _worker_recognizer.event_count
+    try:
+        segments = _worker_recognizer.label_file(filename, window_beats)
+    except (ValueError, IndexError):
+        return None, 0
+    return segments, _worker_recognizer.event_count - before
+
+
+def find_midi_files(directory):
+    """Every MIDI file below a directory, sorted by path."""
+    found = []
+    for dirpath, _, filenames in os.walk(directory):
+        for filename in filenames:
+            if filename.lower().endswith(MIDI_EXTENSIONS):
+                found.append(os.path.join(dirpath, filename))
+    return sorted(found)
+
+
+def label_directory(directory, filename, jobs=None, window_beats=1.0, use_sharps=True, include_drums=False):
+    """Label every MIDI file below a directory and write the chord segments to a CSV file.
+
+    Files are spread over `jobs` worker processes (default: CPU count;
+    1 runs in this process); rows keep the sorted file order. Segments
+    without a chord are left out. Returns (files, failed files, events, segments).
+    """
+    files = find_midi_files(directory)
+    tasks = [(path, window_beats) for path in files]
+
+    if jobs == 1:
+        _init_worker(use_sharps, include_drums)
+        results = map(_label_task, tasks)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                   initargs=(use_sharps, include_drums))
+        results = pool.map(_label_task, tasks, chunksize=max(1, len(tasks) // ((jobs or os.cpu_count() or 1) * 8)))
+
+    failed = events = rows = 0
+    try:
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f)
+            writer.writerow(['file', 'start_time', 'end_time', 'start_tick', 'end_tick', 'chord'])
+            for path, (segments, event_count) in zip(files, results):
+                if segments is None:
+                    failed += 1
+                    continue
+                events += event_count
+                relative = os.path.relpath(path, directory)
+                for segment in segments:
+                    if segment.chord is None:
+                        continue
+                    writer.writerow([relative, f"{segment.start_time:.3f}", f"{segment.end_time:.3f}",
+                                     segment.start_tick, segment.end_tick, segment.chord])
+                    rows += 1
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    print(f"{rows} chord segments from {len(files) - failed} files saved to {filename}"
+          + (f" ({failed} unreadable files skipped)" if failed else ""))
+    return len(files), failed, events, rows
+
+
+def main():
+    """Label the chords of MIDI files given on the command line."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Label chords in MIDI files")
+    parser.add_argument('paths', nargs='+', help="MIDI files, or one directory with --output")
+    parser.add_argument('--window', type=float, default=1.0, help="window length in beats (default: 1)")
+    parser.add_argument('--output', help="CSV file for batch mode over a directory")
+    parser.add_argument('--jobs', type=int, help="worker processes for batch mode")
+    parser.add_argument('--flats', action='store_true', help="spell chords with flats")
+    args = parser.parse_args()
+
+    if args.output:
+        label_directory(args.paths[0], args.output, jobs=args.jobs, window_beats=args.window,
+                        use_sharps=not args.flats)
+        return
+
+    recognizer = MidiChordRecognizer(use_sharps=not args.flats)
+    for path in args.paths:
+        print(f"\n{path}")
+        for segment in recognizer.label_file(path, args.window):
+            if segment.chord:
+                print(f"  {segment.start_time:>8.2f}s  {segment.chord}")
+
+
+if __name__ == "__main__":
+    main()
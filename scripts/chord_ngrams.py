@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Chord N-gram Statistics
+Counts chord-transition n-grams (bigrams, trigrams, ...) over large
+progression corpora. Every chord is encoded as one integer,
+root * len(qualities) + quality index, and an n-gram is packed into a
+single int64 key. With normalize=True keys are transposition-invariant:
+the first chord keeps only its quality and every later chord is stored as
+(semitones above the first root, quality), so ii-V-I counts the same in
+every key.
+
+Counting a shard is a vectorized key computation plus np.bincount into a
+fixed-size array (or np.unique for key spaces too large to hold densely),
+and count_corpus spreads shards of input lines over worker processes and
+merges their tables as they finish.
+
+    python chord_ngrams.py corpus.txt --jobs 4 -o trigrams.csv
+"""
+
+import csv
+import json
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from chord_parser import ChordSymbolParser
+
+SHARD_LINES = 50000
+
+# Key spaces up to this size are counted in dense arrays (8 bytes per key)
+DENSE_LIMIT = 1 << 22
+
+
+class NgramCounts:
+    """Merged n-gram tables for one or more orders.
+
+    tables[n] is either a dense int64 array indexed by key or a
+    (sorted keys, counts) pair for large key spaces.
+    """
+
+    def __init__(self, qualities, orders, normalize=True, tables=None, chords=0):
+        self.qualities = list(qualities)
+        self.orders = tuple(orders)
+        self.normalize = normalize
+        self.tables = tables if tables is not None else {}
+        self.chords = chords
+
+    @property
+    def base(self):
+        """Number of values one chord position can take in a packed key."""
+        return 12 * len(self.qualities)
+
+    def key_space(self, n):
+        if self.normalize:
+            return len(self.qualities) * self.base ** (n - 1)
+        return self.base ** n
+
+    def merge(self, other):
+        """Add another NgramCounts (same qualities and orders) into this one.
+
+        Tables of other may be reused, so other should not be used afterwards.
+        """
+        for n, table in other.tables.items():
+            mine = self.tables.get(n)
+            if mine is None:
+                self.tables[n] = table
+            elif isinstance(mine, np.ndarray):
+                if isinstance(table, np.ndarray):
+                    mine += table
+                else:
+                    np.add.at(mine, table[0], table[1])
+            elif isinstance(table, np.ndarray):
+                np.add.at(table, mine[0], mine[1])
+                self.tables[n] = table
+            else:
+                keys, inverse = np.unique(np.concatenate([mine[0], table[0]]), return_inverse=True)
+                self.tables[n] = (keys, np.bincount(inverse, weights=np.concatenate([mine[1], table[1]]),
+                                                    minlength=len(keys)).astype(np.int64))
+        self.chords += other.chords
+        return self
+
+    def compact(self):
+        """Store sparse dense tables as (keys, counts), e.g. before sending them between processes."""
+        for n, table in list(self.tables.items()):
+            if isinstance(table, np.ndarray):
+                keys = np.flatnonzero(table)
+                if len(keys) * 4 < len(table):
+                    self.tables[n] = (keys, table[keys])
+        return self
+
+    def total(self, n):
+        table = self.tables[n]
+        return int(table.sum() if isinstance(table, np.ndarray) else table[1].sum())
+
+    def most_common(self, n, limit=None):
+        """(key, count) pairs for order n, most frequent first."""
+        table = self.tables[n]
+        if isinstance(table, np.ndarray):
+            keys = np.flatnonzero(table)
+            counts = table[keys]
+        else:
+            keys, counts = table
+        order = np.lexsort((keys, -counts))
+        if limit is not None:
+            order = order[:limit]
+        return list(zip(keys[order].tolist(), counts[order].tolist()))
+
+    def decode(self, n, key):
+        """Unpack a key into [(root, quality)] (roots relative to the first chord when normalized)."""
+        quality_count = len(self.qualities)
+        codes = []
+        for _ in range(n - 1 if self.normalize else n):
+            key, code = divmod(key, self.base)
+            codes.append(code)
+        if self.normalize:
+            codes.append(key)
+        chords = []
+        for code in reversed(codes):
+            root, quality = divmod(code, quality_count)
+            chords.append((root, self.qualities[quality]))
+        return chords
+
+    def spell(self, n, key, generator, tonic=0):
+        """Chord names for a key; normalized n-grams are spelled from the tonic pitch class."""
+        note_list = generator.chromatic_notes_sharp
+        return [generator.format_chord_name(note_list[(root + tonic) % 12], quality)
+                for root, quality in self.decode(n, key)]
+
+    def rows(self, generator, limit=None):
+        """Export rows: order, chords (from C when normalized), intervals, count, share of the order."""
+        rows = []
+        for n in self.orders:
+            total = self.total(n) or 1
+            for key, count in self.most_common(n, limit):
+                chords = self.decode(n, key)
+                rows.append({
+                    'n': n,
+                    'ngram': " ".join(self.spell(n, key, generator)),
+                    'intervals': " ".join(f"{root}:{quality}" for root, quality in chords),
+                    'count': count,
+                    'share': count / total
+                })
+        return rows
+
+    def save_csv(self, filename, generator, limit=None):
+        with open(filename, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=['n', 'ngram', 'intervals', 'count', 'share'])
+            writer.writeheader()
+            writer.writerows(self.rows(generator, limit))
+
+    def to_json(self, generator, limit=None):
+        return json.dumps({
+            'chords': self.chords,
+            'normalize': self.normalize,
+            'totals': {str(n): self.total(n) for n in self.orders},
+            'ngrams': self.rows(generator, limit)
+        }, ensure_ascii=False, indent=2)
+
+
+class NgramCounter:
+    def __init__(self, parser=None, orders=(2, 3), normalize=True):
+        # Snapshot of the generator's tables; build a new counter after
+        # changing chord_intervals.
+        self.parser = parser or ChordSymbolParser()
+        self.generator = self.parser.generator
+        self.qualities = list(self.generator.chord_intervals.keys())
+        self.quality_index = {quality: i for i, quality in enumerate(self.qualities)}
+        self.orders = tuple(sorted(orders))
+        self.normalize = normalize
+        # Packed n-gram keys are int64
+        for n in self.orders:
+            if n < 1:
+                raise ValueError("n-gram orders must be >= 1")
+            if NgramCounts(self.qualities, self.orders, normalize).key_space(n) > 2 ** 63:
+                raise ValueError(f"{n}-grams over {len(self.qualities)} qualities do not fit in 64-bit keys")
+        # chord symbol -> code (None for unparseable symbols)
+        self._codes = {}
+
+    def _code(self, symbol):
+        try:
+            parsed = self.parser.parse(symbol)
+        except (ValueError, KeyError):
+            code = None
+        else:
+            code = parsed.root_pc * len(self.qualities) + self.quality_index[parsed.quality]
+        self._codes[symbol] = code
+        return code
+
+    def encode_lines(self, lines):
+        """Encode progressions (one per line, symbols separated by spaces).
+
+        Returns (codes, starts): int32 chord codes and a bool array marking
+        the first chord of each progression. Unknown symbols are dropped
+        and also start a new run, so no n-gram spans them.
+        """
+        codes = []
+        starts = []
+        lookup = self._codes
+        for line in lines:
+            start = True
+            for symbol in line.split():
+                code = lookup.get(symbol, -1)
+                if code == -1:
+                    code = self._code(symbol)
+                if code is None:
+                    start = True
+                    continue
+                codes.append(code)
+                starts.append(start)
+                start = False
+        return np.array(codes, dtype=np.int32), np.array(starts, dtype=bool)
+
+    def count(self, codes, starts):
+        """Count n-grams of every order in encoded progressions."""
+        counts = NgramCounts(self.qualities, self.orders, self.normalize, chords=len(codes))
+        quality_count = len(self.qualities)
+        base = counts.base
+        codes = codes.astype(np.int64)
+        roots, qualities = np.divmod(codes, quality_count)
+        run = np.cumsum(starts)
+
+        for n in self.orders:
+            windows = len(codes) - n + 1
+            if windows <= 0:
+                keys = np.empty(0, dtype=np.int64)
+            else:
+                if self.normalize:
+                    first_root = roots[:windows]
+                    keys = qualities[:windows].copy()
+                    for offset in range(1, n):
+                        relative = (roots[offset:offset + windows] - first_root) % 12
+                        keys = keys * base + relative * quality_count + qualities[offset:offset + windows]
+                else:
+                    keys = codes[:windows].copy()
+                    for offset in range(1, n):
+                        keys = keys * base + codes[offset:offset + windows]
+                # Only windows inside one run of known chords
+                keys = keys[run[:windows] == run[n - 1:]]
+
+            size = counts.key_space(n)
+            if size <= DENSE_LIMIT:
+                counts.tables[n] = np.bincount(keys, minlength=size)
+            else:
+                unique, tallies = np.unique(keys, return_counts=True)
+                counts.tables[n] = (unique, tallies.astype(np.int64))
+        return counts
+
+    def count_lines(self, lines):
+        return self.count(*self.encode_lines(lines))
+
+
+# One counter per worker process, built by _init_worker
+_worker_counter = None
+
+
+def _init_worker(orders, normalize):
+    global _worker_counter
+    _worker_counter = NgramCounter(orders=orders, normalize=normalize)
+
+
+def _count_shard(lines):
+    return _worker_counter.count_lines(lines).compact()
+
+
+def _read_shards(paths, size=SHARD_LINES):
+    """Yield lists of up to `size` lines from the corpus files in order."""
+    shard = []
+    for path in paths:
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                shard.append(line)
+                if len(shard) == size:
+                    yield shard
+                    shard = []
+    if shard:
+        yield shard
+
+
+def count_corpus(paths, orders=(2, 3), normalize=True, jobs=1):
+    """Count n-grams over corpus files (one progression per line).
+
+    jobs=None uses every CPU. Shards are merged as they complete, so only
+    a bounded number of shard tables is alive at once.
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+    # Built up front so bad orders fail here rather than in the workers
+    counter = NgramCounter(orders=orders, normalize=normalize)
+    if jobs == 1:
+        total = NgramCounts(counter.qualities, counter.orders, normalize)
+        for shard in _read_shards(paths):
+            total.merge(counter.count_lines(shard))
+        return total
+
+    total = None
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker, initargs=(orders, normalize)) as pool:
+        pending = deque()
+        limit = (jobs or os.cpu_count() or 1) * 2
+        for shard in _read_shards(paths):
+            pending.append(pool.submit(_count_shard, shard))
+            while len(pending) >= limit or (pending and pending[0].done()):
+                counts = pending.popleft().result()
+                total = counts if total is None else total.merge(counts)
+        while pending:
+            counts = pending.popleft().result()
+            total = counts if total is None else total.merge(counts)
+    if total is None:
+        total = NgramCounts(counter.qualities, counter.orders, normalize)
+    return total
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Count chord n-grams in progression corpora")
+    parser.add_argument('paths', nargs='+', help="corpus files, one progression of chord symbols per line")
+    parser.add_argument('--orders', type=int, nargs='+', default=[2, 3], help="n-gram orders (default: 2 3)")
+    parser.add_argument('--absolute', action='store_true', help="count n-grams in their own keys")
+    parser.add_argument('--jobs', type=int, default=1, help="worker processes; 0 uses every CPU")
+    parser.add_argument('--limit', type=int, default=50, help="n-grams per order to export (default: 50)")
+    parser.add_argument('-o', '--output', help="CSV (or .json) output; default prints a summary")
+    args = parser.parse_args()
+
+    from chord_generator import ChordGenerator
+
+    try:
+        counts = count_corpus(args.paths, args.orders, not args.absolute, args.jobs or None)
+    except ValueError as e:
+        parser.error(str(e))
+    generator = ChordGenerator()
+    if args.output and args.output.endswith('.json'):
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(counts.to_json(generator, args.limit))
+    elif args.output:
+        counts.save_csv(args.output, generator, args.limit)
+    else:
+        print(f"{counts.chords:,} chords")
+        for n in counts.orders:
+            print(f"\nTop {n}-grams ({counts.total(n):,} total):")
+            for key, count in counts.most_common(n, 10):
+                print(f"  {' '.join(counts.spell(n, key, generator)):<32} {count:>12,}")
+
+
+if __name__ == "__main__":
+    main()
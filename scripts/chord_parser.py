@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Chord Symbol Parser
+Parses typed or scraped chord symbols such as F#m7b5, Bbmaj9/D, C7(#9) and
+Ebm(maj7) into root, quality, extra extensions, alterations and slash bass.
+Qualities are recognised by reverse-mapping ChordGenerator.chord_suffixes
+(and chord_suffix_aliases) through one compiled regular expression, and
+parsed symbols are kept in an LRU cache since real corpora repeat a small
+vocabulary millions of times.
+"""
+
+import re
+from collections import namedtuple
+from functools import lru_cache
+
+from chord_generator import ChordGenerator, note_pitch_class
+
+ParsedChord = namedtuple('ParsedChord', [
+    'symbol',        # the symbol as given
+    'root',          # root note, e.g. 'F#'
+    'root_pc',       # root pitch class (0-11)
+    'quality',       # chord_intervals key, e.g. 'half_diminished7'
+    'suffix',        # the suffix that matched, e.g. 'm7b5'
+    'extensions',    # extra extensions as strings, e.g. ('13', 'add9')
+    'alterations',   # altered tones, e.g. ('#9', 'b13')
+    'bass',          # slash bass note or None
+    'bass_pc'        # slash bass pitch class or None
+])
+
+# Unicode accidentals are folded to ASCII before parsing
+ACCIDENTAL_MAP = str.maketrans({'♯': '#', '♭': 'b', '𝄪': '##', '𝄫': 'bb'})
+
+# A 13 right after a triad suffix names a 13th chord built on the seventh
+# chord: Cmaj13 and Cm13 (C13, with no suffix, is dominant)
+THIRTEENTH_QUALITIES = {'major': 'major7', 'minor': 'minor7'}
+
+# Natural interval above the root of each extension / alteration degree
+DEGREE_INTERVALS = {2: 2, 4: 5, 5: 7, 6: 9, 9: 14, 11: 17, 13: 21}
+
+# Tokens allowed after the quality suffix: (b9), #11, add9, no3, omit5, 13, /9 ...
+MODIFIER = re.compile(r'\(?[,/]?\s*(?:(?P<alteration>[#b+-]\d{1,2})|(?P<extension>(?:add|no|omit|sus)?\d{1,2}))\s*\)?')
+
+
+class ChordSymbolParser:
+    def __init__(self, generator=None, cache_size=65536):
+        # Snapshot of the generator's suffix tables; build a new parser
+        # after changing chord_suffixes.
+        self.generator = generator or ChordGenerator()
+
+        # suffix -> quality, canonical suffixes taking precedence over aliases
+        self.suffix_to_quality = {}
+        for quality, suffix in self.generator.chord_suffixes.items():
+            self.suffix_to_quality.setdefault(suffix, quality)
+        for quality, aliases in self.generator.chord_suffix_aliases.items():
+            for alias in aliases:
+                self.suffix_to_quality.setdefault(alias, quality)
+
+        # One compiled grammar: root, accidentals, the longest known suffix,
+        # any trailing modifiers and an optional slash bass
+        suffixes = sorted(self.suffix_to_quality, key=len, reverse=True)
+        self.grammar = re.compile(
+            r'(?P<root>[A-G])(?P<accidental>[#b]*)'
+            r'(?P<suffix>' + '|'.join(re.escape(s) for s in suffixes) + r')'
+            r'(?P<modifiers>(?:[^/]|/(?=\d))*)'
+            r'(?:/(?P<bass>[A-G][#b]*))?'
+        )
+
+        self.parse = lru_cache(maxsize=cache_size)(self._parse)
+
+    def _parse(self, symbol):
+        """Parse one chord symbol; raises ValueError if it is not understood."""
+        text = symbol.strip().translate(ACCIDENTAL_MAP)
+        match = self.grammar.fullmatch(text)
+        if match is None:
+            raise ValueError(f"Invalid chord symbol: {symbol}")
+
+        # The regex engine tries the longest suffix first; if the remaining
+        # modifiers don't parse, fall back to shorter suffixes (e.g. C7(#9))
+        root = match.group('root') + match.group('accidental')
+        for suffix_end in range(match.end('suffix'), match.start('suffix') - 1, -1):
+            suffix = text[match.start('suffix'):suffix_end]
+            if suffix not in self.suffix_to_quality:
+                continue
+            modifiers = text[suffix_end:match.end('modifiers')]
+            parsed = self._parse_modifiers(modifiers)
+            if parsed is not None:
+                break
+        else:
+            raise ValueError(f"Invalid chord symbol: {symbol}")
+
+        extensions, alterations = parsed
+        quality = self.suffix_to_quality[suffix]
+        if extensions[:1] == ('13',) and quality in THIRTEENTH_QUALITIES:
+            seventh = THIRTEENTH_QUALITIES[quality] if suffix else 'dominant7'
+            if seventh in self.generator.chord_intervals:
+                quality = seventh
+        bass = match.group('bass')
+        return ParsedChord(
+            symbol=symbol,
+            root=root,
+            root_pc=note_pitch_class(root),
+            quality=quality,
+            suffix=suffix,
+            extensions=extensions,
+            alterations=alterations,
+            bass=bass,
+            bass_pc=note_pitch_class(bass) if bass else None
+        )
+
+    def notes(self, parsed, use_sharps=None):
+        """Spell a parsed chord: the quality's notes plus its modifiers and bass.
+
+        Numeric extensions (13, add9) add a note, sus2 / sus4 replace the
+        third, a bare 5 (C5) is a power chord without the third, alterations
+        (#9, b5) add the altered note (replacing the fifth for b5 / #5),
+        no3 / omit5 drop that degree, and a slash bass goes first, spelled as
+        the chord tone when it is one. Other notes come in scale-degree
+        order. use_sharps defaults to sharps unless the root is flat.
+        """
+        root = parsed.root
+        if use_sharps is None:
+            use_sharps = 'b' not in root[1:]
+        generator = self.generator
+        # (note, scale degree) pairs
+        tones = list(zip(generator.generate_chord_notes(root, parsed.quality, use_sharps),
+                         generator._degrees(parsed.quality)))
+
+        def add(degree, offset=0):
+            note = generator.get_note_at_interval(root, DEGREE_INTERVALS[degree] + offset, use_sharps, degree)
+            if all(note_pitch_class(note) != note_pitch_class(tone) for tone, _ in tones):
+                tones.append((note, degree))
+
+        for extension in parsed.extensions:
+            prefix = extension.rstrip('0123456789')
+            degree = int(extension[len(prefix):])
+            if prefix in ('no', 'omit'):
+                tones = [tone for tone in tones if tone[1] != degree]
+            elif prefix == 'sus' and degree in (2, 4):
+                tones = [tone for tone in tones if tone[1] != 3]
+                add(degree)
+            elif prefix == '' and degree == 5:
+                tones = [tone for tone in tones if tone[1] != 3]
+            elif prefix in ('', 'add') and degree in DEGREE_INTERVALS:
+                add(degree)
+        for alteration in parsed.alterations:
+            degree = int(alteration[1:])
+            if degree in DEGREE_INTERVALS:
+                if degree == 5:
+                    tones = [tone for tone in tones if tone[1] != 5]
+                add(degree, 1 if alteration[0] in '#+' else -1)
+        tones.sort(key=lambda tone: tone[1])
+        notes = [note for note, _ in tones]
+
+        if parsed.bass:
+            by_pc = {note_pitch_class(note): note for note in notes}
+            bass = by_pc.get(parsed.bass_pc, parsed.bass)
+            notes = [bass] + [note for note in notes if note != bass]
+        return notes
+
+    def _parse_modifiers(self, text):
+        """Split trailing modifiers into (extensions, alterations), or None if invalid."""
+        extensions = []
+        alterations = []
+        position = 0
+        while position < len(text):
+            match = MODIFIER.match(text, position)
+            if match is None or match.end() == position:
+                return None
+            if match.group('alteration'):
+                alterations.append(match.group('alteration'))
+            else:
+                extensions.append(match.group('extension'))
+            position = match.end()
+        return tuple(extensions), tuple(alterations)
+
+
+_default_parser = None
+
+def parse_chord_symbol(symbol):
+    """Parse a chord symbol with a shared, cached parser for the default catalog."""
+    global _default_parser
+    if _default_parser is None:
+        _default_parser = ChordSymbolParser()
+    return _default_parser.parse(symbol)
+
+
+def main():
+    """Demonstrate chord symbol parsing."""
+    print("CHORD SYMBOL PARSER")
+    print("=" * 50)
+
+    for symbol in ['F#m7b5', 'Bbmaj9/D', 'C7(#9)', 'Ebm(maj7)', 'G7b9#11', 'C△7', 'D♭13', 'Am/G']:
+        parsed = parse_chord_symbol(symbol)
+        details = [parsed.quality]
+        if parsed.extensions:
+            details.append("ext " + " ".join(parsed.extensions))
+        if parsed.alterations:
+            details.append("alt " + " ".join(parsed.alterations))
+        if parsed.bass:
+            details.append(f"bass {parsed.bass}")
+        print(f"{symbol:<12} root {parsed.root:<3} {', '.join(details)}")
+
+
+if __name__ == "__main__":
+    main()
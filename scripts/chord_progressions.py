@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Chord Progression Engine
+Transposes and analyzes chord progressions given as chord symbols
+('Dm7 G7 Cmaj7') or roman numerals ('ii-V-I'). Progressions are encoded as
+integer root pitch-class and quality-index arrays, so transposing a whole
+corpus into any (or every) key is one vectorized add, and spelling is a
+gather into per-key name tables that are built once and cached. Roots are
+spelled from the key's tonic letter (ii-V-I in Cb is Dbm, Gb, Cb).
+"""
+
+import re
+from functools import lru_cache
+
+import numpy as np
+
+from chord_generator import LETTER_SPELLINGS, NOTE_LETTERS
+from chord_parser import ChordSymbolParser
+
+# Scale degrees (semitones above the tonic) used to resolve roman numerals
+MAJOR_SCALE = [0, 2, 4, 5, 7, 9, 11]
+MINOR_SCALE = [0, 2, 3, 5, 7, 8, 10]
+
+NUMERALS = ['I', 'II', 'III', 'IV', 'V', 'VI', 'VII']
+ROMAN = re.compile(r'(?P<accidental>[#b]?)(?P<numeral>VII|VI|IV|V|III|II|I|vii|vi|iv|v|iii|ii|i)(?P<suffix>.*)')
+
+# Major keys (by tonic pitch class) written with flats; the rest use sharps
+FLAT_MAJOR_KEYS = {1, 3, 5, 8, 10}
+
+# Scale degree of a root by semitones above the tonic: chromatic roots are
+# flattened degrees (bII, bIII, bVI, bVII); the tritone is #IV in sharp keys
+# and bV in flat keys (None here)
+KEY_DEGREES = (1, 2, 2, 3, 3, 4, None, 5, 6, 6, 7, 7)
+
+# Roman-numeral suffixes that differ from the chord symbol suffix
+ROMAN_SUFFIXES = {
+    'minor': '',
+    'minor6': '6',
+    'minor7': '7',
+    'minormajor7': '(maj7)',
+    'minor9': '9',
+    'minor11': '11',
+    'diminished': '°',
+    'diminished7': '°7',
+    'half_diminished7': 'ø7',
+    'augmented': '+',
+    'augmented7': '+7'
+}
+
+# Chord types written with a lowercase numeral
+LOWERCASE_TYPES = {'Minor', 'Diminished'}
+
+PAD = -1
+
+
+class ProgressionEngine:
+    def __init__(self, parser=None):
+        # Snapshot of the generator's tables; build a new engine after
+        # changing chord_intervals or chord_suffixes.
+        self.parser = parser or ChordSymbolParser()
+        self.generator = self.parser.generator
+        self.qualities = list(self.generator.chord_intervals.keys())
+        self.quality_index = {quality: i for i, quality in enumerate(self.qualities)}
+
+        # Chord name tables [root pc, quality] for sharp (0) and flat (1)
+        # spelling; spell() uses per-key tables built from these suffixes
+        self.name_tables = []
+        for note_list in (self.generator.chromatic_notes_sharp, self.generator.chromatic_notes_flat):
+            table = np.empty((12, len(self.qualities)), dtype=object)
+            for root, root_note in enumerate(note_list):
+                for q, quality in enumerate(self.qualities):
+                    table[root, q] = self.generator.format_chord_name(root_note, quality)
+            self.name_tables.append(table)
+
+        # Roman numeral tables [degree, quality] for major (0) and minor (1) keys
+        self.numeral_tables = [self._numeral_table(MAJOR_SCALE), self._numeral_table(MINOR_SCALE)]
+
+        # Key context (tonic, mode, spelling) is looked up once per key name
+        self.parse_key = lru_cache(maxsize=256)(self._parse_key)
+        self.key_name_table = lru_cache(maxsize=64)(self._key_name_table)
+
+        # Corpora repeat a small vocabulary of progressions
+        self._encode_cached = lru_cache(maxsize=65536)(self._encode_tokens)
+
+    def _numeral_table(self, scale):
+        """Roman numeral for every (semitones above tonic, quality) pair."""
+        degree_names = {}
+        for degree, semitones in enumerate(scale):
+            degree_names[semitones] = ('', NUMERALS[degree])
+        for semitones in range(12):
+            if semitones not in degree_names:
+                # Chromatic roots are a flattened degree, or a raised seventh
+                upper = [d for d, s in enumerate(scale) if s > semitones]
+                degree_names[semitones] = ('b', NUMERALS[upper[0]]) if upper else ('#', NUMERALS[-1])
+
+        table = np.empty((12, len(self.qualities)), dtype=object)
+        for semitones, (accidental, numeral) in degree_names.items():
+            for q, quality in enumerate(self.qualities):
+                if self.generator.chord_types.get(quality) in LOWERCASE_TYPES:
+                    numeral_text = accidental + numeral.lower()
+                else:
+                    numeral_text = accidental + numeral
+                suffix = ROMAN_SUFFIXES.get(quality, self.generator.chord_suffixes.get(quality, ''))
+                table[semitones, q] = numeral_text + suffix
+        return table
+
+    def _parse_key(self, key):
+        """Return (tonic pitch class, is_minor, use_flats) for a key such as 'Eb' or 'F#m'."""
+        parsed = self.parser.parse(key)
+        minor = parsed.quality == 'minor'
+        if 'b' in parsed.root[1:]:
+            use_flats = True
+        elif '#' in parsed.root:
+            use_flats = False
+        else:
+            # Natural tonics follow the key signature (F major, D/G/C/F minor use flats)
+            relative_major = (parsed.root_pc + 3) % 12 if minor else parsed.root_pc
+            use_flats = relative_major in FLAT_MAJOR_KEYS
+        return parsed.root_pc, minor, use_flats
+
+    def _key_name_table(self, key):
+        """Chord names [root pc, quality] with roots spelled from the key's tonic letter.
+
+        Roots that would need more than two accidentals keep the name from
+        the key signature's sharp or flat table.
+        """
+        tonic, _, use_flats = self.parse_key(key)
+        letter = NOTE_LETTERS.index(self.parser.parse(key).root[0])
+        note_list = self.generator.chromatic_notes_flat if use_flats else self.generator.chromatic_notes_sharp
+        table = np.empty((12, len(self.qualities)), dtype=object)
+        for root in range(12):
+            degree = KEY_DEGREES[(root - tonic) % 12] or (5 if use_flats else 4)
+            root_note = LETTER_SPELLINGS[(letter + degree - 1) % 7][root] or note_list[root]
+            for q, quality in enumerate(self.qualities):
+                table[root, q] = self.generator.format_chord_name(root_note, quality)
+        return table
+
+    def key_name(self, tonic_pc, minor=False):
+        """Conventional name of the key on a tonic pitch class, e.g. 'Eb' or 'C#m'."""
+        relative_major = (tonic_pc + 3) % 12 if minor else tonic_pc
+        note_list = self.generator.chromatic_notes_flat if relative_major in FLAT_MAJOR_KEYS else self.generator.chromatic_notes_sharp
+        return note_list[tonic_pc] + ('m' if minor else '')
+
+    def _encode_tokens(self, tokens, key):
+        """Encode a tuple of chord tokens; cached, so results must not be modified."""
+        roots = np.empty(len(tokens), dtype=np.int8)
+        qualities = np.empty(len(tokens), dtype=np.int16)
+
+        for position, token in enumerate(tokens):
+            roman = ROMAN.fullmatch(token)
+            if roman:
+                root, quality = self._resolve_roman(roman, key)
+            else:
+                parsed = self.parser.parse(token)
+                root, quality = parsed.root_pc, parsed.quality
+            roots[position] = root
+            qualities[position] = self.quality_index[quality]
+        return roots, qualities
+
+    def _tokens(self, progression):
+        """Split a progression string on spaces and dashes.
+
+        A dash only separates chords between roman numerals ('ii-V-I') or
+        when the dashed token is not itself a symbol, so 'C-7' (C minor
+        seventh) stays one chord while 'Dm7-G7' is two.
+        """
+        if not isinstance(progression, str):
+            return tuple(progression)
+        tokens = []
+        for token in progression.split():
+            pieces = token.split('-')
+            if len(pieces) > 1 and (all(ROMAN.fullmatch(piece) for piece in pieces)
+                                    or not self._is_symbol(token)):
+                tokens.extend(pieces)
+            else:
+                tokens.append(token)
+        return tuple(tokens)
+
+    def _is_symbol(self, token):
+        try:
+            self.parser.parse(token)
+        except ValueError:
+            return False
+        return True
+
+    def encode(self, progression, key='C'):
+        """Encode one progression as (roots, qualities) int arrays.
+
+        progression is a list of chord symbols, a string of symbols separated
+        by spaces or dashes ('Dm7 G7 Cmaj7'), or roman numerals ('ii-V-I')
+        resolved in key.
+        """
+        roots, qualities = self._encode_cached(self._tokens(progression), key)
+        return roots.copy(), qualities.copy()
+
+    def _resolve_roman(self, roman, key):
+        """Return (root pitch class, quality) for a roman numeral match."""
+        tonic, minor, _ = self.parse_key(key)
+        numeral = roman.group('numeral')
+        scale = MINOR_SCALE if minor else MAJOR_SCALE
+        root = tonic + scale[NUMERALS.index(numeral.upper())]
+        root += {'#': 1, 'b': -1}.get(roman.group('accidental'), 0)
+
+        # Lowercase numerals imply a minor chord unless the suffix says otherwise
+        suffix = roman.group('suffix')
+        if numeral.islower() and not suffix.startswith(('°', 'o', 'ø', 'dim', '+', 'aug')):
+            suffix = 'm' + suffix
+        quality = self.parser.suffix_to_quality.get(suffix)
+        if quality is None:
+            raise ValueError(f"Unknown roman numeral: {roman.group(0)}")
+        return root % 12, quality
+
+    def encode_corpus(self, progressions, key='C'):
+        """Encode many progressions as padded (count x max length) arrays.
+
+        Padding slots hold -1 in both arrays.
+        """
+        encoded = [self._encode_cached(self._tokens(progression), key) for progression in progressions]
+        width = max((len(roots) for roots, _ in encoded), default=0)
+        roots = np.full((len(encoded), width), PAD, dtype=np.int8)
+        qualities = np.full((len(encoded), width), PAD, dtype=np.int16)
+        for row, (progression_roots, progression_qualities) in enumerate(encoded):
+            roots[row, :len(progression_roots)] = progression_roots
+            qualities[row, :len(progression_qualities)] = progression_qualities
+        return roots, qualities
+
+    def transpose(self, roots, semitones):
+        """Transpose encoded roots by a number of semitones (or an array of them).
+
+        semitones broadcasts against roots, so np.arange(12)[:, None, None]
+        transposes a 2-D corpus into all 12 keys at once. Padding stays -1.
+        """
+        roots = np.asarray(roots)
+        shifted = (roots.astype(np.int16) + np.asarray(semitones, dtype=np.int16)) % 12
+        return np.where(roots == PAD, PAD, shifted).astype(np.int8)
+
+    def transpose_all_keys(self, roots):
+        """Return roots transposed into all 12 keys, with the key as the first axis."""
+        roots = np.asarray(roots)
+        shifts = np.arange(12).reshape((12,) + (1,) * roots.ndim)
+        return self.transpose(roots[None], shifts)
+
+    def spell(self, roots, qualities, key='C'):
+        """Gather chord names for encoded chords using the key's signature.
+
+        Returns an object array shaped like roots, with None in padding slots.
+        """
+        table = self.key_name_table(key)
+        roots = np.asarray(roots)
+        qualities = np.asarray(qualities)
+        names = table[roots.clip(0), qualities.clip(0)]
+        names[roots == PAD] = None
+        return names
+
+    def analyze(self, roots, qualities, key='C'):
+        """Roman numerals for encoded chords relative to key (None in padding)."""
+        tonic, minor, _ = self.parse_key(key)
+        table = self.numeral_tables[1 if minor else 0]
+        roots = np.asarray(roots)
+        degrees = (roots.astype(np.int16) - tonic) % 12
+        numerals = table[degrees, np.asarray(qualities).clip(0)]
+        numerals[roots == PAD] = None
+        return numerals
+
+    def resolve(self, progression, key='C'):
+        """Chord names for a progression (symbols or roman numerals) in key."""
+        roots, qualities = self.encode(progression, key)
+        return self.spell(roots, qualities, key).tolist()
+
+
+def main():
+    """Demonstrate progression transposition and analysis."""
+    engine = ProgressionEngine()
+
+    print("CHORD PROGRESSION ENGINE")
+    print("=" * 50)
+
+    print("\nii7-V7-Imaj7 in every key:")
+    roots, qualities = engine.encode('ii7-V7-Imaj7', 'C')
+    for shift, key_roots in enumerate(engine.transpose_all_keys(roots)):
+        key = engine.key_name(shift)
+        print(f"  {key:<3} {' - '.join(engine.spell(key_roots, qualities, key))}")
+
+    print("\nRoman numeral analysis:")
+    for symbols, key in [('Am F C G', 'C'), ('Bbmaj7 Gm7 Cm7 F7', 'Bb'), ('Dm7b5 G7 Cm', 'Cm')]:
+        roots, qualities = engine.encode(symbols, key)
+        print(f"  {symbols:<22} in {key:<3} {' - '.join(engine.analyze(roots, qualities, key))}")
+
+
+if __name__ == "__main__":
+    main()
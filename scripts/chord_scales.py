@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Scale Catalog
+Scales and modes on all 12 roots, and which catalog chords fit each one.
+Scales and chords are both 12-bit pitch-class masks; a chord fits a scale
+when its mask is a subset of the scale's. The full (scale x chord)
+compatibility bitmatrix is computed once with NumPy broadcasting and kept
+packed, and the per-scale and per-chord id lists are precomputed from it, so
+"every chord in D dorian" and "every scale containing G7" are lookups.
+
+Scale id = root * len(SCALE_INTERVALS) + scale index, matching the
+chord id convention of ChordIdentifier (root * qualities + quality index).
+"""
+
+import numpy as np
+
+from chord_generator import ChordGenerator
+from chord_identifier import pitch_class_mask
+from chord_parser import note_pitch_class
+
+# Semitones above the root
+SCALE_INTERVALS = {
+    # Major modes
+    'major': [0, 2, 4, 5, 7, 9, 11],
+    'dorian': [0, 2, 3, 5, 7, 9, 10],
+    'phrygian': [0, 1, 3, 5, 7, 8, 10],
+    'lydian': [0, 2, 4, 6, 7, 9, 11],
+    'mixolydian': [0, 2, 4, 5, 7, 9, 10],
+    'minor': [0, 2, 3, 5, 7, 8, 10],
+    'locrian': [0, 1, 3, 5, 6, 8, 10],
+
+    # Harmonic minor modes
+    'harmonic_minor': [0, 2, 3, 5, 7, 8, 11],
+    'locrian_natural6': [0, 1, 3, 5, 6, 9, 10],
+    'ionian_augmented': [0, 2, 4, 5, 8, 9, 11],
+    'dorian_sharp4': [0, 2, 3, 6, 7, 9, 10],
+    'phrygian_dominant': [0, 1, 4, 5, 7, 8, 10],
+    'lydian_sharp2': [0, 3, 4, 6, 7, 9, 11],
+    'altered_diminished': [0, 1, 3, 4, 6, 8, 9],
+
+    # Melodic minor modes
+    'melodic_minor': [0, 2, 3, 5, 7, 9, 11],
+    'dorian_b2': [0, 1, 3, 5, 7, 9, 10],
+    'lydian_augmented': [0, 2, 4, 6, 8, 9, 11],
+    'lydian_dominant': [0, 2, 4, 6, 7, 9, 10],
+    'mixolydian_b6': [0, 2, 4, 5, 7, 8, 10],
+    'locrian_natural2': [0, 2, 3, 5, 6, 8, 10],
+    'altered': [0, 1, 3, 4, 6, 8, 10],
+
+    # Pentatonic and blues
+    'major_pentatonic': [0, 2, 4, 7, 9],
+    'minor_pentatonic': [0, 3, 5, 7, 10],
+    'major_blues': [0, 2, 3, 4, 7, 9],
+    'blues': [0, 3, 5, 6, 7, 10],
+
+    # Symmetric scales
+    'whole_tone': [0, 2, 4, 6, 8, 10],
+    'diminished_half_whole': [0, 1, 3, 4, 6, 7, 9, 10],
+    'diminished_whole_half': [0, 2, 3, 5, 6, 8, 9, 11],
+    'augmented': [0, 3, 4, 7, 8, 11],
+}
+
+# Other names accepted by scale_id
+SCALE_ALIASES = {
+    'ionian': 'major',
+    'aeolian': 'minor',
+    'natural_minor': 'minor',
+    'super_locrian': 'altered',
+    'half_whole': 'diminished_half_whole',
+    'whole_half': 'diminished_whole_half',
+    'minor_blues': 'blues',
+}
+
+
+class ScaleCatalog:
+    def __init__(self, generator=None):
+        # Snapshot of the generator's chord tables; build a new catalog
+        # after changing chord_intervals.
+        self.generator = generator or ChordGenerator()
+        self.scales = list(SCALE_INTERVALS)
+        self.scale_index = {scale: i for i, scale in enumerate(self.scales)}
+        self.qualities = list(self.generator.chord_intervals.keys())
+        self.quality_index = {quality: i for i, quality in enumerate(self.qualities)}
+
+        # Masks indexed by scale id and chord id
+        self.scale_masks = np.array([
+            pitch_class_mask(root + interval for interval in SCALE_INTERVALS[scale])
+            for root in range(12) for scale in self.scales
+        ], dtype=np.uint16)
+        self.chord_masks = np.array([
+            pitch_class_mask(root + interval for interval in self.generator.chord_intervals[quality])
+            for root in range(12) for quality in self.qualities
+        ], dtype=np.uint16)
+
+        # compatible[s, c]: every note of chord c is in scale s
+        compatible = (self.chord_masks[None, :] & ~self.scale_masks[:, None]) == 0
+        self.chord_count = len(self.chord_masks)
+        self.bits = np.packbits(compatible, axis=1)          # (scales, ceil(chords / 8))
+
+        # Precomputed answers for single queries
+        # (chords listed from the scale's tonic upwards)
+        quality_count = len(self.qualities)
+        self.scale_chords = []
+        for scale_id, row in enumerate(compatible):
+            tonic = scale_id // len(self.scales)
+            ids = np.flatnonzero(row).tolist()
+            ids.sort(key=lambda chord_id: ((chord_id // quality_count - tonic) % 12, chord_id))
+            self.scale_chords.append(tuple(ids))
+        self.chord_scales = [tuple(np.flatnonzero(column).tolist()) for column in compatible.T]
+
+    def _note_list(self, use_sharps):
+        return self.generator.chromatic_notes_sharp if use_sharps else self.generator.chromatic_notes_flat
+
+    def scale_id(self, scale):
+        """Scale id for a name such as 'D dorian' or 'Bb harmonic minor', or a (root, scale) pair."""
+        if isinstance(scale, str):
+            root, _, name = scale.strip().partition(' ')
+        else:
+            root, name = scale
+        name = name.strip().lower().replace(' ', '_').replace('-', '_')
+        name = SCALE_ALIASES.get(name, name)
+        if name not in self.scale_index:
+            raise ValueError(f"Unknown scale: {name}")
+        root_pc = root % 12 if isinstance(root, int) else note_pitch_class(root)
+        return root_pc * len(self.scales) + self.scale_index[name]
+
+    def chord_id(self, chord):
+        """Chord id for a chord name such as 'F#m7b5', or a (root, quality) pair."""
+        if isinstance(chord, str):
+            found = self.generator.find_chord(chord)
+            if found is None:
+                raise ValueError(f"Unknown chord: {chord}")
+            root, quality = found['root'], found['type']
+        else:
+            root, quality = chord
+        root_pc = root % 12 if isinstance(root, int) else note_pitch_class(root)
+        return root_pc * len(self.qualities) + self.quality_index[quality]
+
+    def scale_name(self, scale_id, use_sharps=True):
+        root, index = divmod(scale_id, len(self.scales))
+        return f"{self._note_list(use_sharps)[root]} {self.scales[index].replace('_', ' ')}"
+
+    def chord_name(self, chord_id, use_sharps=True):
+        root, index = divmod(chord_id, len(self.qualities))
+        return self.generator.format_chord_name(self._note_list(use_sharps)[root], self.qualities[index])
+
+    def is_compatible(self, scale, chord):
+        """True if every note of the chord is in the scale."""
+        scale_id = self.scale_id(scale)
+        chord_id = self.chord_id(chord)
+        return bool(self.bits[scale_id, chord_id >> 3] & (0x80 >> (chord_id & 7)))
+
+    def chords_in_scale(self, scale, use_sharps=None):
+        """Names of every catalog chord that fits the scale, from the tonic upwards."""
+        if use_sharps is None:
+            use_sharps = not (isinstance(scale, str) and 'b' in scale.split(' ')[0][1:])
+        return [self.chord_name(chord_id, use_sharps) for chord_id in self.scale_chords[self.scale_id(scale)]]
+
+    def scales_for_chord(self, chord, use_sharps=None):
+        """Names of every scale that contains all notes of the chord."""
+        if use_sharps is None:
+            use_sharps = not (isinstance(chord, str) and len(chord) > 1 and chord[1] == 'b')
+        return [self.scale_name(scale_id, use_sharps) for scale_id in self.chord_scales[self.chord_id(chord)]]
+
+    def compatibility(self, scale_ids, chord_ids):
+        """Vectorized lookup: bool array of compatibility, broadcasting scale_ids against chord_ids."""
+        scale_ids = np.asarray(scale_ids)
+        chord_ids = np.asarray(chord_ids)
+        return (self.bits[scale_ids, chord_ids >> 3] & (0x80 >> (chord_ids & 7))) != 0
+
+    def compatible_chords(self, scale_ids, mode='all'):
+        """Bool chord array for chords fitting all (mode='all') or any ('any') of the scales."""
+        rows = self.bits[np.asarray(scale_ids)]
+        packed = np.bitwise_and.reduce(rows, axis=0) if mode == 'all' else np.bitwise_or.reduce(rows, axis=0)
+        return np.unpackbits(packed, count=self.chord_count).astype(bool)
+
+    def scales_containing(self, masks):
+        """(len(masks), scales) bool matrix: which scales contain each pitch-class mask.
+
+        Works for any note collections (melody fragments, voicings), not
+        only catalog chords.
+        """
+        masks = np.asarray(masks, dtype=np.uint16)
+        return (masks[:, None] & ~self.scale_masks[None, :]) == 0
+
+
+def main():
+    """Demonstrate scale/chord compatibility queries."""
+    catalog = ScaleCatalog()
+
+    print("SCALE CATALOG")
+    print("=" * 50)
+    print(f"{len(catalog.scale_masks)} scales x {catalog.chord_count} chords")
+
+    for scale in ['C major', 'D dorian', 'A harmonic minor', 'G altered']:
+        chords = catalog.chords_in_scale(scale)
+        print(f"\n{scale} ({len(chords)} chords):")
+        print("  " + ", ".join(chords[:16]) + (" ..." if len(chords) > 16 else ""))
+
+    print("\nScales containing G7:")
+    print("  " + ", ".join(catalog.scales_for_chord('G7')))
+
+    print("\nChords shared by C major and A harmonic minor:")
+    shared = catalog.compatible_chords([catalog.scale_id('C major'), catalog.scale_id('A harmonic minor')])
+    print("  " + ", ".join(catalog.chord_name(chord_id) for chord_id in np.flatnonzero(shared)))
+
+
+if __name__ == "__main__":
+    main()
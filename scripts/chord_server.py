@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Chord Lookup Service
+A long-lived local HTTP/JSON server around ChordGenerator, so the front end
+and tools don't rebuild the catalog on every call. Everything is standard
+library: asyncio streams, HTTP/1.1 keep-alive and an LRU cache of rendered
+responses. The generator index and the analysis table are built once at
+startup.
+
+    GET  /chord?name=Cmaj7                     find_chord
+    GET  /notes?root=C&quality=major7          generate_chord_notes
+    GET  /search?chord_type=Minor&contains_note=C#
+    POST /batch   {"requests": [{"endpoint": "chord", "params": {"name": "Dm7"}}, ...]}
+    GET  /stats                                per-endpoint latency and cache counters
+
+    python chord_server.py --port 8765
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from collections import deque
+from functools import lru_cache
+from urllib.parse import parse_qsl, urlsplit
+
+from analyze_chords import ChordTable
+from chord_generator import ChordGenerator
+
+STATUS_TEXT = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+               413: 'Payload Too Large'}
+
+# Latency samples kept per endpoint for the percentiles in /stats
+LATENCY_WINDOW = 10000
+
+MAX_BODY = 1 << 20
+
+
+class EndpointStats:
+    """Request count and a window of recent latencies for one endpoint."""
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.total = 0.0
+        self.samples = deque(maxlen=LATENCY_WINDOW)
+
+    def record(self, seconds, ok):
+        self.count += 1
+        self.total += seconds
+        if not ok:
+            self.errors += 1
+        self.samples.append(seconds)
+
+    def summary(self):
+        ordered = sorted(self.samples)
+
+        def percentile(p):
+            return ordered[min(len(ordered) - 1, int(p * len(ordered)))] * 1e3 if ordered else 0.0
+
+        return {
+            'requests': self.count,
+            'errors': self.errors,
+            'mean_ms': self.total / self.count * 1e3 if self.count else 0.0,
+            'p50_ms': percentile(0.50),
+            'p99_ms': percentile(0.99)
+        }
+
+
+class ChordService:
+    def __init__(self, generator=None, cache_size=4096):
+        self.generator = generator or ChordGenerator()
+
+        # Build every lookup table up front so no request pays for it
+        self.generator.find_chord('C')
+        self.table = ChordTable.from_generator(self.generator)
+
+        self.handlers = {
+            'chord': self.chord,
+            'notes': self.notes,
+            'search': self.search
+        }
+        self.stats = {name: EndpointStats() for name in (*self.handlers, 'batch', 'stats')}
+
+        # Rendered responses keyed by (endpoint, sorted params)
+        self.render = lru_cache(maxsize=cache_size)(self._render)
+
+    def chord(self, name):
+        chord = self.generator.find_chord(name)
+        if chord is None:
+            raise LookupError(f"Unknown chord: {name}")
+        return chord
+
+    def notes(self, root, quality, use_sharps='true'):
+        notes = self.generator.generate_chord_notes(root, quality, use_sharps.lower() != 'false')
+        return {'chord': self.generator.format_chord_name(root, quality), 'notes': notes}
+
+    def search(self, chord_type=None, chord_extension=None, contains_note=None, limit=None):
+        notes = contains_note.split(',') if contains_note else None
+        results = self.table.find(chord_type, chord_extension, notes)
+        total = len(results)
+        if limit is not None:
+            results = results[:int(limit)]
+        return {'count': total, 'chords': results}
+
+    def call(self, endpoint, params):
+        """Run one endpoint and return (status, result)."""
+        handler = self.handlers.get(endpoint)
+        if handler is None:
+            return 404, {'error': f"Unknown endpoint: {endpoint}"}
+        try:
+            return 200, handler(**params)
+        except LookupError as e:
+            return 404, {'error': str(e.args[0]) if e.args else str(e)}
+        except (AttributeError, TypeError, ValueError) as e:
+            # AttributeError: a non-string param from a batch request
+            return 400, {'error': str(e)}
+
+    def _render(self, endpoint, params):
+        """Encoded (status, body) for a GET request; cached."""
+        status, result = self.call(endpoint, dict(params))
+        return status, json.dumps(result).encode()
+
+    def batch(self, body):
+        """Answer a list of requests in one round trip; returns (status, encoded body).
+
+        Each request goes through the same response cache as GET requests.
+        Params must be strings, as in a query string; other values get a
+        400 for that request.
+        """
+        try:
+            requests = json.loads(body)['requests']
+        except (ValueError, KeyError, TypeError):
+            return 400, json.dumps({'error': 'Expected {"requests": [...]}'}).encode()
+        if not isinstance(requests, list):
+            return 400, json.dumps({'error': 'Expected {"requests": [...]}'}).encode()
+        for request in requests:
+            if (not isinstance(request, dict) or not isinstance(request.get('endpoint'), str)
+                    or not isinstance(request.get('params', {}), dict)):
+                return 400, json.dumps({'error': 'Each request must be {"endpoint": "...", "params": {...}}'}).encode()
+        results = []
+        for request in requests:
+            params = request.get('params', {})
+            if all(isinstance(value, str) for value in params.values()):
+                status, payload = self.render(request['endpoint'], tuple(sorted(params.items())))
+            else:
+                status, payload = 400, json.dumps({'error': 'Param values must be strings'}).encode()
+            # Splice the cached encoded results instead of re-serializing them
+            results.append(b'{"status": %d, "result": %s}' % (status, payload))
+        return 200, b'{"results": [' + b', '.join(results) + b']}'
+
+    def stats_report(self):
+        info = self.render.cache_info()
+        return {
+            'endpoints': {name: stats.summary() for name, stats in self.stats.items()},
+            'cache': {'hits': info.hits, 'misses': info.misses, 'size': info.currsize, 'max_size': info.maxsize}
+        }
+
+    def dispatch(self, method, target, body):
+        """Return (endpoint, status, encoded body) for one HTTP request."""
+        url = urlsplit(target)
+        endpoint = url.path.strip('/')
+        if endpoint == 'batch':
+            if method != 'POST':
+                return endpoint, 405, json.dumps({'error': 'Use POST'}).encode()
+            status, payload = self.batch(body)
+            return endpoint, status, payload
+        if method != 'GET':
+            return endpoint, 405, json.dumps({'error': 'Use GET'}).encode()
+        if endpoint == 'stats':
+            return endpoint, 200, json.dumps(self.stats_report()).encode()
+        params = tuple(sorted(parse_qsl(url.query)))
+        status, payload = self.render(endpoint, params)
+        return endpoint, status, payload
+
+    async def handle_connection(self, reader, writer):
+        """Serve requests on one connection until the client closes it."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                try:
+                    method, target, version = request_line.decode('latin-1').split()
+                except ValueError:
+                    break
+
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b'\r\n', b'\n', b''):
+                        break
+                    name, _, value = line.decode('latin-1').partition(':')
+                    headers[name.strip().lower()] = value.strip()
+
+                try:
+                    length = int(headers.get('content-length', 0))
+                except ValueError:
+                    length = -1
+                if length < 0:
+                    # Without a usable length the body can't be skipped, so close
+                    writer.write(self._response(400, b'{"error": "Invalid Content-Length"}', False))
+                    break
+                if length > MAX_BODY:
+                    writer.write(self._response(413, b'{"error": "Body too large"}', False))
+                    break
+                body = await reader.readexactly(length) if length else b''
+
+                connection = headers.get('connection', '').lower()
+                keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+
+                start = time.perf_counter()
+                endpoint, status, payload = self.dispatch(method, target, body)
+                stats = self.stats.get(endpoint)
+                if stats is not None:
+                    stats.record(time.perf_counter() - start, status < 400)
+
+                writer.write(self._response(status, payload, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    def _response(self, status, payload, keep_alive):
+        head = (f"HTTP/1.1 {status} {STATUS_TEXT.get(status, '')}\r\n"
+                f"Content-Type: application/json\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        return head.encode('latin-1') + payload
+
+
+async def serve(host='127.0.0.1', port=8765, cache_size=4096):
+    """Build the service and serve until cancelled."""
+    service = ChordService(cache_size=cache_size)
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    bound_port = server.sockets[0].getsockname()[1]
+    print(f"Chord service listening on http://{host}:{bound_port}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local chord lookup service")
+    parser.add_argument('--host', default='127.0.0.1', help="interface to bind (default: 127.0.0.1)")
+    parser.add_argument('--port', type=int, default=8765, help="port to listen on; 0 picks a free port")
+    parser.add_argument('--cache-size', type=int, default=4096, help="LRU response cache entries")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.cache_size))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Chord Similarity
+Nearest-neighbour search over the chord catalog for reharmonization ideas.
+Three distances are precomputed between every pair of (root, quality) keys:
+
+    pc_distance    pitch classes in one chord but not the other
+    common_tones   pitch classes the chords share
+    voice_leading  smallest total movement in semitones taking one chord to
+                   the other (each voice moves the short way round; the
+                   smaller chord may double notes)
+
+Distances only depend on the two qualities and the interval between the
+roots, so they are stored once as compact (quality x quality x 12) uint8
+arrays shared by all spellings (C#m and Dbm are the same key). Neighbour
+rankings are precomputed the same way, so queries are pure lookups.
+"""
+
+from itertools import combinations_with_replacement
+
+import numpy as np
+
+from chord_generator import ChordGenerator, note_pitch_class
+
+METRICS = ('voice_leading', 'common_tones', 'pc_distance')
+
+
+def _circular_distance(a, b):
+    diff = np.abs(a - b) % 12
+    return np.minimum(diff, 12 - diff)
+
+
+class ChordSimilarity:
+    def __init__(self, generator=None):
+        # Snapshot of the generator's tables; build a new index after
+        # changing chord_intervals.
+        self.generator = generator or ChordGenerator()
+        self.qualities = list(self.generator.chord_intervals.keys())
+        self.quality_index = {quality: i for i, quality in enumerate(self.qualities)}
+        quality_count = len(self.qualities)
+
+        # Every spelling in the catalog maps onto one (root pc, quality) key
+        pitch_classes = {note: i for i, note in enumerate(self.generator.chromatic_notes_sharp)}
+        pitch_classes.update({note: i for i, note in enumerate(self.generator.chromatic_notes_flat)})
+        self.keys_by_name = {}
+        for chord in self.generator.generate_all_chords():
+            self.keys_by_name[chord['chord']] = (pitch_classes[chord['root']], self.quality_index[chord['type']])
+
+        # Pitch-class sets of each quality on root C
+        self.quality_sets = [
+            sorted({interval % 12 for interval in self.generator.chord_intervals[quality]})
+            for quality in self.qualities
+        ]
+
+        # distances[metric][q1, q2, t]: chord (0, q1) against chord (t, q2)
+        self.distances = {metric: np.zeros((quality_count, quality_count, 12), dtype=np.uint8)
+                          for metric in METRICS}
+        masks = np.array([sum(1 << pc for pc in pcs) for pcs in self.quality_sets], dtype=np.int32)
+        shifted = np.array([[((mask << t) | (mask >> (12 - t))) & 0xFFF for t in range(12)] for mask in masks])
+        popcount = np.array([bin(mask).count('1') for mask in range(4096)], dtype=np.uint8)
+        self.distances['pc_distance'][:] = popcount[masks[:, None, None] ^ shifted[None, :, :]]
+        self.distances['common_tones'][:] = popcount[masks[:, None, None] & shifted[None, :, :]]
+        self._compute_voice_leading()
+
+        # Neighbour rankings for a chord on root C; other roots are a rotation
+        self.rankings = {metric: self._rank(metric) for metric in METRICS}
+
+    def _compute_voice_leading(self):
+        """Fill distances['voice_leading'] for every quality pair and root interval."""
+        sizes = sorted({len(pcs) for pcs in self.quality_sets})
+        by_size = {size: [q for q, pcs in enumerate(self.quality_sets) if len(pcs) == size] for size in sizes}
+        transpositions = np.arange(12)
+
+        for size_a in sizes:
+            for size_b in sizes:
+                # Work with the smaller chord doubled up to the larger size
+                small, large = (size_a, size_b) if size_a <= size_b else (size_b, size_a)
+                small_q = by_size[small]
+                large_q = by_size[large]
+                small_sets = np.array([self.quality_sets[q] for q in small_q])
+                large_sets = np.array([self.quality_sets[q] for q in large_q])
+
+                # All ways of doubling notes of the small chord: (patterns, large)
+                patterns = [list(range(small)) + list(extra)
+                            for extra in combinations_with_replacement(range(small), large - small)]
+                expanded = small_sets[:, patterns]                        # (S, P, large)
+
+                # Transpose the large chord by every interval t and sort its notes
+                moved = np.sort((large_sets[:, None, :] + transpositions[None, :, None]) % 12, axis=2)  # (L, 12, large)
+
+                # Sorted expansions against every rotation of the sorted target;
+                # the optimal voice leading never crosses voices, so a rotation wins
+                expanded = np.sort(expanded, axis=2)
+                best = np.full((len(small_q), len(large_q), 12), 255, dtype=np.int64)
+                for rotation in range(large):
+                    target = np.roll(moved, rotation, axis=2)
+                    cost = _circular_distance(expanded[:, :, None, None, :], target[None, None, :, :, :]).sum(axis=4)
+                    best = np.minimum(best, cost.min(axis=1))
+
+                vl = self.distances['voice_leading']
+                if size_a <= size_b:
+                    # best[s, l, t]: small quality on C vs large quality on t
+                    vl[np.ix_(small_q, large_q)] = best
+                else:
+                    # Swap roles: large quality on C vs small quality on t,
+                    # which is small on (12 - t) vs large on C
+                    vl[np.ix_(large_q, small_q)] = best.transpose(1, 0, 2)[:, :, (-transpositions) % 12]
+
+    def _rank(self, metric):
+        """Neighbour order (flat quality * 12 + interval ids) for each quality on C."""
+        primary = self.distances[metric].reshape(len(self.qualities), -1).astype(np.int16)
+        if metric == 'common_tones':
+            primary = -primary
+        secondary = self.distances['voice_leading'].reshape(len(self.qualities), -1)
+        tertiary = self.distances['pc_distance'].reshape(len(self.qualities), -1)
+        # np.lexsort sorts by the last key first
+        return np.stack([np.lexsort((tertiary[q], secondary[q], primary[q])) for q in range(len(self.qualities))])
+
+    def key_of(self, chord):
+        """Return the (root pc, quality index) key for a chord name or key tuple."""
+        if isinstance(chord, str):
+            key = self.keys_by_name.get(chord)
+            if key is None:
+                found = self.generator.find_chord(chord)
+                if found is None:
+                    raise ValueError(f"Unknown chord: {chord}")
+                # Roots outside the catalog (Cbmaj7, E#m) are keyed by pitch class
+                key = self.keys_by_name.get(found['chord'])
+                if key is None:
+                    key = (note_pitch_class(found['root']), self.quality_index[found['type']])
+            return key
+        root, quality = chord
+        return root % 12, self.quality_index.get(quality, quality)
+
+    def distance(self, chord_a, chord_b, metric='voice_leading'):
+        """Precomputed distance between two chords."""
+        root_a, quality_a = self.key_of(chord_a)
+        root_b, quality_b = self.key_of(chord_b)
+        return int(self.distances[metric][quality_a, quality_b, (root_b - root_a) % 12])
+
+    def nearest_keys(self, roots, qualities, k=5, metric='voice_leading', exclude_self=True):
+        """Batched k-NN: (roots, qualities) arrays of shape (n, k) for n query chords."""
+        roots = np.asarray(roots)
+        qualities = np.asarray(qualities)
+        ranking = self.rankings[metric][qualities]                # (n, Q * 12)
+        if exclude_self:
+            # Self is the (quality, interval 0) entry; drop it from each row
+            self_id = qualities * 12
+            keep = ranking != self_id[:, None]
+            ranking = ranking[keep].reshape(len(qualities), -1)
+        ids = ranking[:, :k]
+        neighbour_qualities = ids // 12
+        neighbour_roots = (ids % 12 + roots[:, None]) % 12
+        return neighbour_roots, neighbour_qualities
+
+    def nearest(self, chord, k=5, metric='voice_leading', use_sharps=None):
+        """Top-k neighbours of one chord with all three distances."""
+        root, quality = self.key_of(chord)
+        if use_sharps is None:
+            use_sharps = not (isinstance(chord, str) and len(chord) > 1 and chord[1] == 'b')
+        note_list = self.generator.chromatic_notes_sharp if use_sharps else self.generator.chromatic_notes_flat
+
+        roots, qualities = self.nearest_keys(np.array([root]), np.array([quality]), k, metric)
+        results = []
+        for neighbour_root, neighbour_quality in zip(roots[0].tolist(), qualities[0].tolist()):
+            interval = (neighbour_root - root) % 12
+            results.append({
+                'chord': self.generator.format_chord_name(note_list[neighbour_root], self.qualities[neighbour_quality]),
+                'root': note_list[neighbour_root],
+                'type': self.qualities[neighbour_quality],
+                **{name: int(self.distances[name][quality, neighbour_quality, interval]) for name in METRICS}
+            })
+        return results
+
+    def nearest_progression(self, chords, k=5, metric='voice_leading'):
+        """Top-k neighbour names for each chord of a progression."""
+        keys = [self.key_of(chord) for chord in chords]
+        roots, qualities = self.nearest_keys(np.array([key[0] for key in keys]),
+                                             np.array([key[1] for key in keys]), k, metric)
+        note_list = self.generator.chromatic_notes_sharp
+        return [
+            [self.generator.format_chord_name(note_list[r], self.qualities[q]) for r, q in zip(row_r, row_q)]
+            for row_r, row_q in zip(roots.tolist(), qualities.tolist())
+        ]
+
+
+def main():
+    """Show nearest neighbours for a few chords."""
+    similarity = ChordSimilarity()
+
+    print("CHORD SIMILARITY")
+    print("=" * 50)
+    for chord in ['C', 'G7', 'Dbmaj7']:
+        print(f"\nClosest to {chord} by voice leading:")
+        for neighbour in similarity.nearest(chord, k=5):
+            print(f"  {neighbour['chord']:<10} voice leading {neighbour['voice_leading']:>2}  "
+                  f"common tones {neighbour['common_tones']}  pc distance {neighbour['pc_distance']}")
+
+    print("\nReharmonization ideas for Dm7 - G7 - Cmaj7:")
+    for chord, neighbours in zip(['Dm7', 'G7', 'Cmaj7'], similarity.nearest_progression(['Dm7', 'G7', 'Cmaj7'], k=4)):
+        print(f"  {chord:<6} -> {', '.join(neighbours)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Chord Voicing Generator
+Enumerates playable voicings of every chord in the catalog for fretted
+instruments (guitar, bass, ukulele or any custom tuning) and for piano hand
+spans. Voicings are found by a depth-first search that prunes a branch as
+soon as it exceeds the fret/hand span or can no longer reach every required
+chord tone. The catalog is sharded by root pitch class across a process
+pool, and each shard streams its rows to disk, so memory stays flat however
+many voicings there are.
+"""
+
+import csv
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+from chord_generator import ChordGenerator
+
+# Open-string MIDI notes, lowest string first
+TUNINGS = {
+    'guitar': [40, 45, 50, 55, 59, 64],      # E2 A2 D3 G3 B3 E4
+    'bass': [28, 33, 38, 43],                # E1 A1 D2 G2
+    'ukulele': [67, 60, 64, 69],             # G4 C4 E4 A4 (re-entrant)
+    'drop_d': [38, 45, 50, 55, 59, 64],      # D2 A2 D3 G3 B3 E4
+}
+
+FIELDNAMES = ['chord_name', 'instrument', 'positions', 'notes']
+
+
+def _popcount(mask):
+    return bin(mask).count('1')
+
+
+def fretted_voicings(root_pc, pitch_classes, required, tuning, max_fret=12, max_span=4,
+                     root_in_bass=True, min_strings=3, allow_inner_mutes=False):
+    """Yield playable fret tuples (None = muted string) for one chord.
+
+    pitch_classes: allowed pitch classes; required: pitch classes every
+    voicing must contain. max_span is the number of frets the hand covers
+    (open strings don't count). Unless allow_inner_mutes is set, muted
+    strings may only sit below or above the sounding strings.
+    """
+    allowed = 0
+    for pc in pitch_classes:
+        allowed |= 1 << pc
+    required_mask = 0
+    for pc in required:
+        required_mask |= 1 << pc
+    min_sounding = max(min_strings, _popcount(required_mask))
+
+    # Candidate frets for each string, computed once per chord
+    options = []
+    for open_note in tuning:
+        options.append([fret for fret in range(max_fret + 1) if allowed >> ((open_note + fret) % 12) & 1])
+
+    string_count = len(tuning)
+    frets = [None] * string_count
+    # With re-entrant tunings (ukulele) the first string isn't the lowest,
+    # so the bass can only be checked on complete voicings
+    ascending = all(low < high for low, high in zip(tuning, tuning[1:]))
+
+    def search(string, low, high, covered, sounding, stopped):
+        # Bound: not enough strings left to cover the missing tones
+        missing = _popcount(required_mask & ~covered)
+        remaining = 0 if stopped else string_count - string
+        if missing > remaining or sounding + remaining < min_sounding:
+            return
+        if string == string_count:
+            if root_in_bass and not ascending:
+                lowest = min(open_note + fret for open_note, fret in zip(tuning, frets) if fret is not None)
+                if lowest % 12 != root_pc:
+                    return
+            yield tuple(frets)
+            return
+
+        # Mute this string
+        frets[string] = None
+        yield from search(string + 1, low, high, covered, sounding, stopped or (sounding > 0 and not allow_inner_mutes))
+        if stopped:
+            return
+
+        for fret in options[string]:
+            pc = (tuning[string] + fret) % 12
+            if sounding == 0 and root_in_bass and ascending and pc != root_pc:
+                continue
+            new_low, new_high = low, high
+            if fret:
+                new_low = min(low, fret)
+                new_high = max(high, fret)
+                if new_high - new_low >= max_span:
+                    continue
+            frets[string] = fret
+            yield from search(string + 1, new_low, new_high, covered | (1 << pc), sounding + 1, False)
+        frets[string] = None
+
+    yield from search(0, max_fret + 1, 0, 0, 0, False)
+
+
+def piano_voicings(root_pc, pitch_classes, required, hand_span=12, low=48, high=84,
+                   root_in_bass=True, max_notes=5):
+    """Yield MIDI note tuples for one hand playing a chord.
+
+    Every note is a chord tone, the notes lie within hand_span semitones of
+    the bass, no pitch is repeated and at most max_notes keys are pressed.
+    """
+    allowed = set(pitch_classes)
+    required_mask = 0
+    for pc in required:
+        required_mask |= 1 << pc
+    if _popcount(required_mask) > max_notes:
+        return
+
+    for bass in range(low, high + 1):
+        bass_pc = bass % 12
+        if bass_pc not in allowed or (root_in_bass and bass_pc != root_pc):
+            continue
+        top = min(bass + hand_span, high)
+        candidates = [note for note in range(bass + 1, top + 1) if note % 12 in allowed]
+        notes = [bass]
+
+        def search(index, covered):
+            # Bound: too few keys left to reach the missing tones
+            missing = _popcount(required_mask & ~covered)
+            if missing > max_notes - len(notes):
+                return
+            if missing == 0:
+                yield tuple(notes)
+            for position in range(index, len(candidates)):
+                if len(notes) == max_notes:
+                    return
+                note = candidates[position]
+                notes.append(note)
+                yield from search(position + 1, covered | (1 << (note % 12)))
+                notes.pop()
+
+        yield from search(0, 1 << bass_pc)
+
+
+def _chord_tones(root_pc, intervals, omit_fifth):
+    """Return (pitch classes, required pitch classes) for a chord."""
+    pitch_classes = sorted({(root_pc + interval) % 12 for interval in intervals})
+    required = set(pitch_classes)
+    if omit_fifth and 7 in intervals and len(required) > 1:
+        required.discard((root_pc + 7) % 12)
+    return pitch_classes, sorted(required)
+
+
+def _note_name(midi, names):
+    """Spelled name plus octave; the octave follows the letter, so B#3 is MIDI 60."""
+    note = names[midi % 12]
+    alter = note.count('#') - note[1:].count('b')
+    return f"{note}{(midi - alter) // 12 - 1}"
+
+
+def _write_shard(task):
+    """Worker: write every voicing for one root pitch class to a shard file."""
+    shard_file, root_pc, chords, instrument, tuning, options = task
+    search_options = dict(options)
+    omit_fifth = search_options.pop('omit_fifth', True)
+    count = 0
+    with open(shard_file, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        for spellings, intervals in chords:
+            pitch_classes, required = _chord_tones(root_pc, intervals, omit_fifth)
+            # Pitch class -> chord tone name, per spelling of the chord
+            spellings = [(chord_name, {(root_pc + interval) % 12: note for interval, note in zip(intervals, notes)})
+                         for chord_name, notes in spellings]
+            if tuning is None:
+                voicings = piano_voicings(root_pc, pitch_classes, required, **search_options)
+            else:
+                voicings = fretted_voicings(root_pc, pitch_classes, required, tuning, **search_options)
+
+            for voicing in voicings:
+                # Pitch content is shared by enharmonic spellings (C#m / Dbm)
+                if tuning is None:
+                    positions = " ".join(str(note) for note in voicing)
+                    midi_notes = voicing
+                else:
+                    positions = "-".join('x' if fret is None else str(fret) for fret in voicing)
+                    midi_notes = [open_note + fret for open_note, fret in zip(tuning, voicing) if fret is not None]
+                for chord_name, names in spellings:
+                    writer.writerow([chord_name, instrument, positions,
+                                     " ".join(_note_name(note, names) for note in midi_notes)])
+                    count += 1
+    return count
+
+
+class VoicingGenerator:
+    def __init__(self, generator=None):
+        self.generator = generator or ChordGenerator()
+
+    def _shard_tasks(self, tmp_dir, instrument, tuning, options):
+        """Group the catalog by root pitch class, one task per root.
+
+        Each chord carries its (name, spelled notes) per root spelling, so
+        voicing notes are named like the chord's own notes (E# in F#maj7).
+        """
+        tasks = []
+        for root_pc, root_note in enumerate(self.generator.chromatic_notes_sharp):
+            chords = []
+            for quality, intervals in self.generator.chord_intervals.items():
+                spellings = [
+                    (self.generator.format_chord_name(note, quality),
+                     self.generator.generate_chord_notes(note, quality, use_sharps))
+                    for note, use_sharps in self.generator._root_spellings(root_note)
+                ]
+                chords.append((spellings, list(intervals)))
+            shard_file = os.path.join(tmp_dir, f'shard_{root_pc:02d}.csv')
+            tasks.append((shard_file, root_pc, chords, instrument, tuning, options))
+        return tasks
+
+    def write_voicings(self, filename, instrument='guitar', tuning=None, jobs=None, **options):
+        """Write every voicing of every chord to a CSV file and return the row count.
+
+        instrument is 'piano' or a fretted instrument; fretted instruments use
+        tuning (MIDI open strings, lowest first) or the TUNINGS entry for the
+        instrument. Other options go to fretted_voicings / piano_voicings,
+        plus omit_fifth (default True). jobs sets the number of worker
+        processes (default: CPU count; 1 runs in this process).
+        """
+        if instrument == 'piano':
+            tuning = None
+        elif tuning is None:
+            if instrument not in TUNINGS:
+                raise ValueError(f"Unknown instrument: {instrument}")
+            tuning = TUNINGS[instrument]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tasks = self._shard_tasks(tmp_dir, instrument, tuning, options)
+            if jobs == 1:
+                counts = [_write_shard(task) for task in tasks]
+            else:
+                with ProcessPoolExecutor(max_workers=jobs) as pool:
+                    counts = list(pool.map(_write_shard, tasks))
+
+            # Concatenate shards in root order without loading them
+            with open(filename, 'w', newline='', encoding='utf-8') as out:
+                csv.writer(out).writerow(FIELDNAMES)
+                for task in tasks:
+                    with open(task[0], 'r', encoding='utf-8') as shard:
+                        shutil.copyfileobj(shard, out)
+
+        total = sum(counts)
+        print(f"{total} voicings saved to {filename}")
+        return total
+
+
+def main():
+    """Show a few voicings and write the full guitar catalog."""
+    print("CHORD VOICINGS")
+    print("=" * 50)
+
+    print("\nFirst guitar voicings of C major (frets, low to high):")
+    pitch_classes, required = _chord_tones(0, [0, 4, 7], True)
+    for voicing, _ in zip(fretted_voicings(0, pitch_classes, required, TUNINGS['guitar']), range(5)):
+        print("  " + "-".join('x' if fret is None else str(fret) for fret in voicing))
+
+    print("\nFirst piano voicings of Cmaj7 (MIDI notes):")
+    pitch_classes, required = _chord_tones(0, [0, 4, 7, 11], True)
+    for voicing, _ in zip(piano_voicings(0, pitch_classes, required), range(5)):
+        print("  " + " ".join(str(note) for note in voicing))
+
+    print()
+    VoicingGenerator().write_voicings("guitar_voicings.csv", instrument='guitar')
+
+
+if __name__ == "__main__":
+    main()
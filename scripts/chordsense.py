@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+chordsense command line tool
+Batch chord lookup, spelling and identification over newline-delimited
+input, plus catalog export. Input comes from files or stdin, output is
+streamed as CSV or JSON Lines through a large write buffer, and --jobs N
+spreads chunks of input over worker processes while keeping output order.
+
+    python chordsense.py lookup names.txt                  # Cmaj7 -> notes
+    python chordsense.py spell --format jsonl < pairs.txt   # "Db minor7" or "Dbm7"
+    python chordsense.py identify --jobs 8 notes.txt        # "A C E G" -> Am7
+    python chordsense.py export --chord-type Minor -o minor.csv
+"""
+
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+
+from chord_generator import ChordGenerator
+
+FIELDS = {
+    'lookup': ['input', 'chord', 'notes', 'type', 'root', 'error'],
+    'spell': ['input', 'chord', 'notes', 'error'],
+    'identify': ['input', 'chord', 'notes', 'match', 'error'],
+}
+
+CHUNK_LINES = 20000
+WRITE_BUFFER = 1 << 20
+
+
+class LineProcessor:
+    """Turns input lines into rendered output rows for one subcommand.
+
+    Rendered rows are cached per input line, since batch inputs usually
+    repeat a small vocabulary of chords.
+    """
+
+    def __init__(self, command, output_format='csv', use_sharps=None, cache_size=65536):
+        self.command = command
+        self.output_format = output_format
+        self.use_sharps = use_sharps
+        self.fields = FIELDS[command]
+        self.generator = ChordGenerator()
+        self.parser = None
+        self.identifier = None
+        if command == 'spell':
+            from chord_parser import ChordSymbolParser
+            self.parser = ChordSymbolParser(self.generator)
+        elif command == 'identify':
+            from chord_identifier import ChordIdentifier
+            self.identifier = ChordIdentifier(self.generator)
+
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator='\n')
+        self.render = lru_cache(maxsize=cache_size)(self._render)
+
+    def _lookup(self, text):
+        chord = self.generator.find_chord(text)
+        if chord is None:
+            raise ValueError(f"Unknown chord: {text}")
+        return {'chord': chord['chord'], 'notes': chord['notes'], 'type': chord['type'], 'root': chord['root']}
+
+    def _spell(self, text):
+        # "Db minor7" (root and quality) or a chord symbol such as "Dbm7"
+        root, _, quality = text.partition(' ')
+        quality = quality.strip()
+        if not quality:
+            # Symbols keep their extensions, alterations and slash bass
+            # (C13/E: E, C, G, Bb, A); only plain ones get the catalog name
+            parsed = self.parser.parse(text)
+            if parsed.extensions or parsed.alterations:
+                chord = text
+            else:
+                chord = self.generator.format_chord_name(parsed.root, parsed.quality)
+                if parsed.bass:
+                    chord = f"{chord}/{parsed.bass}"
+            return {'chord': chord, 'notes': self.parser.notes(parsed, self.use_sharps)}
+        use_sharps = self.use_sharps if self.use_sharps is not None else 'b' not in root[1:]
+        notes = self.generator.generate_chord_notes(root, quality, use_sharps)
+        return {'chord': self.generator.format_chord_name(root, quality), 'notes': notes}
+
+    def _identify(self, text):
+        notes = text.replace(',', ' ').split()
+        matches = self.identifier.identify(notes, use_sharps=self.use_sharps, limit=1)
+        if not matches:
+            raise ValueError(f"No chord matches: {text}")
+        match = matches[0]
+        return {'chord': match['chord'], 'notes': match['notes'], 'match': match['match']}
+
+    def _render(self, line):
+        """Output row (with trailing newline) for one input line."""
+        text = line.strip()
+        try:
+            record = {'input': text, **getattr(self, '_' + self.command)(text), 'error': None}
+        except (ValueError, KeyError) as e:
+            record = {'input': text, 'error': str(e.args[0]) if e.args else str(e)}
+
+        if self.output_format == 'jsonl':
+            return json.dumps(record, ensure_ascii=False) + '\n'
+        if 'notes' in record:
+            record['notes'] = ", ".join(record['notes'])
+        self._writer.writerow([record.get(field) for field in self.fields])
+        row = self._buffer.getvalue()
+        self._buffer.seek(0)
+        self._buffer.truncate()
+        return row
+
+    def process(self, lines):
+        """Render a chunk of lines (blank lines are skipped)."""
+        render = self.render
+        return ''.join([render(line) for line in lines if not line.isspace() and line])
+
+
+# One processor per worker process, built by _init_worker
+_worker_processor = None
+
+
+def _init_worker(command, output_format, use_sharps):
+    global _worker_processor
+    _worker_processor = LineProcessor(command, output_format, use_sharps)
+
+
+def _process_chunk(lines):
+    return _worker_processor.process(lines)
+
+
+def _read_chunks(paths, size=CHUNK_LINES):
+    """Yield lists of up to `size` lines from the input files in order ('-' is stdin)."""
+    chunk = []
+    for path in paths:
+        f = sys.stdin if path == '-' else open(path, 'r', encoding='utf-8')
+        try:
+            for line in f:
+                chunk.append(line)
+                if len(chunk) == size:
+                    yield chunk
+                    chunk = []
+        finally:
+            if f is not sys.stdin:
+                f.close()
+    if chunk:
+        yield chunk
+
+
+def run_lines(command, paths, out, output_format='csv', jobs=1, use_sharps=None):
+    """Process input lines and write rendered rows to `out` in input order."""
+    if output_format == 'csv':
+        out.write(','.join(FIELDS[command]) + '\n')
+    chunks = _read_chunks(paths)
+
+    if jobs == 1:
+        processor = LineProcessor(command, output_format, use_sharps)
+        for chunk in chunks:
+            out.write(processor.process(chunk))
+        return
+
+    # Keep a bounded window of chunks in flight and write them in order
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                             initargs=(command, output_format, use_sharps)) as pool:
+        pending = deque()
+        limit = (jobs or os.cpu_count() or 1) * 4
+        for chunk in chunks:
+            pending.append(pool.submit(_process_chunk, chunk))
+            if len(pending) >= limit:
+                out.write(pending.popleft().result())
+        while pending:
+            out.write(pending.popleft().result())
+
+
+def run_export(out, output_format='csv', **filters):
+    """Stream the catalog (optionally filtered) in export order."""
+    generator = ChordGenerator()
+    fields = ['chord_name', 'notes', 'chord_type', 'chord_extension', 'quality', 'root']
+    if output_format == 'csv':
+        writer = csv.writer(out, lineterminator='\n')
+        writer.writerow(fields)
+    for chord in generator.iter_chords(**filters):
+        row = [chord['chord'], chord['notes'], generator.chord_types[chord['type']],
+               generator.chord_extensions[chord['type']], chord['type'], chord['root']]
+        if output_format == 'csv':
+            row[1] = ", ".join(row[1])
+            writer.writerow(row)
+        else:
+            out.write(json.dumps(dict(zip(fields, row)), ensure_ascii=False) + '\n')
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog='chordsense', description="Chord lookup, spelling and identification")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    def add_output_options(sub):
+        sub.add_argument('-o', '--output', help="output file (default: stdout)")
+        sub.add_argument('--format', choices=['csv', 'jsonl'], default='csv', help="output format (default: csv)")
+
+    help_text = {
+        'lookup': "chord names to notes, one name per line (Cmaj7, C#m, CM7)",
+        'spell': "notes for 'root quality' lines (Db minor7) or chord symbols (Dbm7)",
+        'identify': "name the chord formed by each line of notes (A C E G, E3 G3 C4)",
+    }
+    for command, description in help_text.items():
+        sub = commands.add_parser(command, help=description, description=description)
+        sub.add_argument('inputs', nargs='*', default=['-'], help="input files (default: stdin)")
+        add_output_options(sub)
+        sub.add_argument('--jobs', type=int, default=1,
+                         help="worker processes; 0 uses every CPU (default: 1)")
+        spelling = sub.add_mutually_exclusive_group()
+        spelling.add_argument('--sharps', dest='use_sharps', action='store_const', const=True,
+                              help="always spell notes with sharps")
+        spelling.add_argument('--flats', dest='use_sharps', action='store_const', const=False,
+                              help="always spell notes with flats")
+
+    export = commands.add_parser('export', help="write the chord catalog", description="write the chord catalog")
+    add_output_options(export)
+    export.add_argument('--root', help="only chords on this root (C#, Db, ...)")
+    export.add_argument('--quality', help="only this quality (minor7, ...)")
+    export.add_argument('--chord-type', help="only this chord type (Minor, Dominant, ...)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    if args.output:
+        out = open(args.output, 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER)
+    else:
+        out = open(sys.stdout.fileno(), 'w', encoding='utf-8', newline='', buffering=WRITE_BUFFER, closefd=False)
+
+    try:
+        if args.command == 'export':
+            run_export(out, args.format, root=args.root, quality=args.quality, chord_type=args.chord_type)
+        else:
+            run_lines(args.command, args.inputs, out, args.format, args.jobs or None, args.use_sharps)
+    except BrokenPipeError:
+        # Output piped into head or similar; stop quietly
+        sys.stderr.close()
+        return 1
+    finally:
+        try:
+            out.close()
+        except BrokenPipeError:
+            pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())